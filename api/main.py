@@ -7,10 +7,12 @@ from fastapi import FastAPI, HTTPException, Query, Depends, Request
 from fastapi.responses import Response, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from typing import List, Optional, Dict, Any, TYPE_CHECKING, Literal
 from dataclasses import asdict
 import atexit
+import base64
+from bisect import bisect_right
 import hashlib
 import os
 import logging
@@ -22,20 +24,29 @@ import uuid
 import ipaddress
 from contextvars import ContextVar
 from contextlib import contextmanager
+from functools import lru_cache
 from urllib.parse import urlparse
 
 import structlog
-from asset_registry.search import BoundedSearchExecutor, SearchOverloadedError
+from asset_registry.search import (
+    BoundedSearchExecutor,
+    SearchClassPolicy,
+    SearchOverloadedError,
+    collect_search_stages,
+    search_stage,
+)
 from api.logging_config import setup_logging
 from api.routers.runs_v4 import (
     RUNTIME_BINDING_KEY_ENV,
     RUNTIME_DECISION_ACTORS_ENV,
     RUNTIME_HITL_TTL_SECONDS_ENV,
     RUNTIME_JOURNAL_MODE_ENV,
+    RUNTIME_SYNCHRONOUS_ENV,
     router as runs_v4_router,
     runtime_binding_key_configuration_issue,
     runtime_hitl_ttl_configuration_issue,
     runtime_journal_mode_configuration_issue,
+    runtime_synchronous_configuration_issue,
     get_asset_repository,
     reload_asset_repository,
 )
@@ -43,6 +54,7 @@ from asset_registry.repositories import (
     AssetIdentityAmbiguousError,
     AssetNotFoundError,
     AssetRepository,
+    SnapshotNotRetainedError,
     StaleSourceSnapshotError,
 )
 
@@ -129,6 +141,7 @@ def find_production_security_issues(
     runtime_decision_actors: Optional[str] = None,
     runtime_hitl_ttl_seconds: Optional[str] = None,
     runtime_journal_mode: Optional[str] = None,
+    runtime_synchronous: Optional[str] = None,
     validate_runtime: bool = False,
 ) -> List[str]:
     """Enumerate production security misconfigurations."""
@@ -179,6 +192,12 @@ def find_production_security_issues(
         )
         if journal_issue is not None:
             issues.append(journal_issue)
+        synchronous_issue = runtime_synchronous_configuration_issue(
+            runtime_synchronous,
+            runtime_journal_mode,
+        )
+        if synchronous_issue is not None:
+            issues.append(synchronous_issue)
 
     return issues
 
@@ -196,6 +215,7 @@ def enforce_production_security_configuration() -> None:
         runtime_decision_actors=os.getenv(RUNTIME_DECISION_ACTORS_ENV),
         runtime_hitl_ttl_seconds=os.getenv(RUNTIME_HITL_TTL_SECONDS_ENV),
         runtime_journal_mode=os.getenv(RUNTIME_JOURNAL_MODE_ENV),
+        runtime_synchronous=os.getenv(RUNTIME_SYNCHRONOUS_ENV),
         validate_runtime=True,
     )
     if issues:
@@ -232,7 +252,7 @@ app.add_middleware(
 
 # ==================== Prometheus Metrics ====================
 
-from prometheus_client import Counter, Histogram, generate_latest, CONTENT_TYPE_LATEST
+from prometheus_client import Counter, Gauge, Histogram, generate_latest, CONTENT_TYPE_LATEST
 
 
 REQUEST_COUNT = Counter(
@@ -255,6 +275,76 @@ SEARCH_FAILURES = Counter(
     "Total search backend failures",
     ["endpoint", "reason"],
 )
+SEARCH_STAGE_LATENCY = Histogram(
+    "skill0_search_stage_duration_seconds",
+    "Search latency per stage (queue_wait, embed, vector_query, serialize)",
+    ["endpoint", "backend", "stage"],
+    buckets=[0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0],
+)
+
+SEARCH_QUEUE_DEPTH = Gauge(
+    "skill0_search_queue_depth",
+    "Requests waiting for a search worker",
+    ["search_class"],
+)
+SEARCH_CONCURRENCY_LIMIT = Gauge(
+    "skill0_search_concurrency_limit",
+    "Current adaptive concurrency limit",
+    ["search_class"],
+)
+SEARCH_REJECTIONS = Counter(
+    "skill0_search_rejections_total",
+    "Search requests shed by admission control",
+    ["search_class", "reason"],
+)
+
+VECTOR_BACKEND = "sqlite-vec"
+ASSET_SNAPSHOT_BACKEND = "asset-snapshot"
+
+
+@contextmanager
+def _search_stage_metrics(endpoint: str, backend: str):
+    """Observe each stage collected while the block runs; ``endpoint`` is the route template."""
+    with collect_search_stages() as stages:
+        try:
+            yield stages
+        finally:
+            for stage, seconds in stages.items():
+                SEARCH_STAGE_LATENCY.labels(
+                    endpoint=endpoint, backend=backend, stage=stage
+                ).observe(seconds)
+            if stages:
+                logger.info(
+                    "search_stages",
+                    endpoint=endpoint,
+                    backend=backend,
+                    **{
+                        f"{stage}_ms": round(seconds * 1000, 3)
+                        for stage, seconds in stages.items()
+                    },
+                )
+
+
+@lru_cache(maxsize=None)
+def _response_adapter(model: Any) -> TypeAdapter:
+    return TypeAdapter(model)
+
+
+def _json_response(
+    content: Any, model: Any = None, *, headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """Encode ``content`` now so the enclosing ``serialize`` stage times it.
+
+    A returned model is validated and encoded by FastAPI only after the
+    handler exits, outside every search stage.
+    """
+    if model is None:
+        return JSONResponse(content, headers=headers)
+    return Response(
+        _response_adapter(model).dump_json(content),
+        media_type="application/json",
+        headers=headers,
+    )
 
 
 @app.middleware("http")
@@ -569,8 +659,46 @@ def _constant_time_text_equal(value: str, expected: str) -> bool:
 
 # Global search engine (lazy initialization)
 search_engine: Optional["SemanticSearch"] = None
-search_executor = BoundedSearchExecutor(max_workers=2, queue_capacity=4)
+
+
+def _env_seconds(name: str) -> Optional[float]:
+    """Parse an optional positive duration in seconds."""
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return None
+    value = float(raw)
+    if value <= 0:
+        raise ValueError(f"{name} must be positive")
+    return value
+
+
+# Cheap interactive lookups must not queue behind multi-second analytics or
+# admin jobs, so every class gets its own workers and bounded queue.
+search_executor = BoundedSearchExecutor(
+    classes={
+        "interactive": SearchClassPolicy(
+            max_workers=2,
+            queue_capacity=4,
+            target_latency_seconds=0.5,
+            deadline_seconds=_env_seconds("SKILL0_SEARCH_DEADLINE_SECONDS"),
+        ),
+        "asset_metadata": SearchClassPolicy(max_workers=2, queue_capacity=8),
+        "analytics": SearchClassPolicy(
+            max_workers=1, queue_capacity=2, acquire_timeout_seconds=1.0
+        ),
+        "admin": SearchClassPolicy(
+            max_workers=1, queue_capacity=1, acquire_timeout_seconds=1.0
+        ),
+    }
+)
 atexit.register(search_executor.shutdown)
+for _search_class in search_executor.policies:
+    SEARCH_QUEUE_DEPTH.labels(search_class=_search_class).set_function(
+        lambda name=_search_class: search_executor.stats()[name]["queue_depth"]
+    )
+    SEARCH_CONCURRENCY_LIMIT.labels(search_class=_search_class).set_function(
+        lambda name=_search_class: search_executor.stats()[name]["concurrency_limit"]
+    )
 
 
 def _load_semantic_search_class():
@@ -650,6 +778,7 @@ def _asset_search_sync(query: str, asset_types: tuple[str, ...], limit: int):
 
 
 def _search_overloaded(exc: SearchOverloadedError) -> HTTPException:
+    SEARCH_REJECTIONS.labels(search_class=exc.search_class, reason=exc.reason).inc()
     return HTTPException(
         status_code=429,
         detail={"code": exc.code, "message": "Search capacity is exhausted"},
@@ -750,6 +879,14 @@ class AssetSearchRequest(BaseModel):
     limit: int = Field(default=5, ge=1, le=50)
 
 
+class AssetSnapshotDiffResponse(BaseModel):
+    from_snapshot_id: str
+    to_snapshot_id: str
+    added: list[AssetRevisionResponse]
+    changed: list[AssetRevisionResponse]
+    removed: list[AssetRevisionResponse]
+
+
 class AssetReloadResponse(BaseModel):
     snapshot_id: str
     revision_count: int
@@ -769,6 +906,36 @@ def _revision_response(revision, *, include_payload: bool) -> AssetRevisionRespo
     )
 
 
+ASSET_PAGE_LIMIT_MAX = 500
+
+
+def _snapshot_etag(repository: AssetRepository) -> str:
+    """Snapshots are immutable, so the snapshot_id identifies every listing it serves."""
+    return f'"{repository.snapshot_id}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {item.strip().removeprefix("W/") for item in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def _encode_cursor(key: str) -> str:
+    return base64.urlsafe_b64encode(key.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: Optional[str]) -> Optional[str]:
+    if cursor is None:
+        return None
+    try:
+        return base64.b64decode(
+            cursor + "=" * (-len(cursor) % 4), altchars=b"-_", validate=True
+        ).decode("utf-8")
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+
+
 def _raise_asset_repository_error(exc: Exception) -> None:
     if isinstance(exc, AssetNotFoundError):
         raise HTTPException(status_code=404, detail="Asset not found") from exc
@@ -782,33 +949,103 @@ def _raise_asset_repository_error(exc: Exception) -> None:
             status_code=409,
             detail={"code": exc.code, "message": "Asset identity is ambiguous"},
         ) from exc
+    if isinstance(exc, SnapshotNotRetainedError):
+        raise HTTPException(
+            status_code=410,
+            detail={"code": exc.code, "message": "Snapshot is no longer retained"},
+        ) from exc
     raise exc
 
 
-@app.get("/api/assets", response_model=list[AssetSummary], tags=["Assets"])
-async def list_assets(
-    repository: AssetRepository = Depends(get_asset_repository),
-):
+async def _assert_asset_snapshot_fresh(repository: AssetRepository) -> None:
+    """A 304 vouches for the client's copy, so the snapshot must still be current."""
     try:
-        revisions = await search_executor.run(repository.list_revisions)
+        await search_executor.run(repository.assert_fresh, search_class="asset_metadata")
     except SearchOverloadedError as exc:
         raise _search_overloaded(exc) from exc
     except Exception as exc:
         _raise_asset_repository_error(exc)
-    grouped: dict[str, list] = {}
-    for revision in revisions:
-        grouped.setdefault(revision.asset_id, []).append(revision)
-    return [
-        AssetSummary(
-            asset_id=asset_id,
-            asset_type="skill",
-            name=str(items[0].payload.get("meta", {}).get("name") or asset_id),
-            summary=str(items[0].payload.get("meta", {}).get("description") or ""),
-            revision_count=len(items),
-            ambiguous=len(items) > 1,
-        )
-        for asset_id, items in sorted(grouped.items())
-    ]
+
+
+@app.get("/api/assets", response_model=list[AssetSummary], tags=["Assets"])
+async def list_assets(
+    request: Request,
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+    limit: Optional[int] = Query(None, ge=1, le=ASSET_PAGE_LIMIT_MAX),
+    repository: AssetRepository = Depends(get_asset_repository),
+):
+    etag = _snapshot_etag(repository)
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        await _assert_asset_snapshot_fresh(repository)
+        return Response(status_code=304, headers={"ETag": etag})
+    after = _decode_cursor(cursor)
+    with _search_stage_metrics("/api/assets", ASSET_SNAPSHOT_BACKEND):
+        try:
+            summaries = await search_executor.run(
+                repository.list_asset_summaries, search_class="asset_metadata"
+            )
+        except SearchOverloadedError as exc:
+            raise _search_overloaded(exc) from exc
+        except Exception as exc:
+            _raise_asset_repository_error(exc)
+        with search_stage("serialize"):
+            start = 0 if after is None else bisect_right(
+                summaries, after, key=lambda item: item.asset_id
+            )
+            page = summaries[start:] if limit is None else summaries[start : start + limit]
+            headers = {"ETag": etag}
+            if limit is not None and start + limit < len(summaries):
+                headers["X-Next-Cursor"] = _encode_cursor(page[-1].asset_id)
+            return _json_response(
+                [AssetSummary(**asdict(item)) for item in page],
+                list[AssetSummary],
+                headers=headers,
+            )
+
+
+@app.get(
+    "/api/assets/changes",
+    response_model=AssetSnapshotDiffResponse,
+    tags=["Assets"],
+)
+async def list_asset_changes(
+    since: str = Query(..., min_length=1, description="snapshot_id to diff from"),
+    repository: AssetRepository = Depends(get_asset_repository),
+):
+    """Revisions added, changed or removed since a retained snapshot.
+
+    ``410`` means the snapshot fell out of the retained history and the
+    consumer must rescan.
+    """
+
+    with _search_stage_metrics("/api/assets/changes", ASSET_SNAPSHOT_BACKEND):
+        try:
+            diff = await search_executor.run(
+                repository.diff, since, search_class="asset_metadata"
+            )
+        except SearchOverloadedError as exc:
+            raise _search_overloaded(exc) from exc
+        except Exception as exc:
+            _raise_asset_repository_error(exc)
+        with search_stage("serialize"):
+            return _json_response(
+                AssetSnapshotDiffResponse(
+                    from_snapshot_id=diff.from_snapshot_id,
+                    to_snapshot_id=diff.to_snapshot_id,
+                    added=[
+                        _revision_response(item, include_payload=False) for item in diff.added
+                    ],
+                    changed=[
+                        _revision_response(item, include_payload=False)
+                        for item in diff.changed
+                    ],
+                    removed=[
+                        _revision_response(item, include_payload=False)
+                        for item in diff.removed
+                    ],
+                ),
+                AssetSnapshotDiffResponse,
+            )
 
 
 @app.get(
@@ -818,17 +1055,43 @@ async def list_assets(
 )
 async def list_asset_revisions(
     asset_id: str,
+    request: Request,
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+    limit: Optional[int] = Query(None, ge=1, le=ASSET_PAGE_LIMIT_MAX),
     repository: AssetRepository = Depends(get_asset_repository),
 ):
-    try:
-        revisions = await search_executor.run(
-            repository.list_asset_revisions, asset_id
-        )
-    except SearchOverloadedError as exc:
-        raise _search_overloaded(exc) from exc
-    except Exception as exc:
-        _raise_asset_repository_error(exc)
-    return [_revision_response(item, include_payload=False) for item in revisions]
+    etag = _snapshot_etag(repository)
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        await _assert_asset_snapshot_fresh(repository)
+        return Response(status_code=304, headers={"ETag": etag})
+    after = _decode_cursor(cursor)
+    with _search_stage_metrics("/api/assets/{asset_id}/revisions", ASSET_SNAPSHOT_BACKEND):
+        try:
+            revisions = await search_executor.run(
+                repository.list_asset_revisions,
+                asset_id,
+                search_class="asset_metadata",
+            )
+        except SearchOverloadedError as exc:
+            raise _search_overloaded(exc) from exc
+        except Exception as exc:
+            _raise_asset_repository_error(exc)
+        with search_stage("serialize"):
+            start = 0
+            if after is not None:
+                positions = [item.revision_id for item in revisions]
+                if after not in positions:
+                    raise HTTPException(status_code=400, detail="Invalid cursor")
+                start = positions.index(after) + 1
+            page = revisions[start:] if limit is None else revisions[start : start + limit]
+            headers = {"ETag": etag}
+            if limit is not None and start + limit < len(revisions):
+                headers["X-Next-Cursor"] = _encode_cursor(page[-1].revision_id)
+            return _json_response(
+                [_revision_response(item, include_payload=False) for item in page],
+                list[AssetRevisionResponse],
+                headers=headers,
+            )
 
 
 @app.get(
@@ -841,33 +1104,42 @@ async def get_asset(
     include_payload: bool = Query(False),
     repository: AssetRepository = Depends(get_asset_repository),
 ):
-    try:
-        revision = await search_executor.run(repository.get_revision, asset_id)
-    except SearchOverloadedError as exc:
-        raise _search_overloaded(exc) from exc
-    except Exception as exc:
-        _raise_asset_repository_error(exc)
-    return _revision_response(revision, include_payload=include_payload)
+    with _search_stage_metrics("/api/assets/{asset_id}", ASSET_SNAPSHOT_BACKEND):
+        try:
+            revision = await search_executor.run(
+                repository.get_revision, asset_id, search_class="asset_metadata"
+            )
+        except SearchOverloadedError as exc:
+            raise _search_overloaded(exc) from exc
+        except Exception as exc:
+            _raise_asset_repository_error(exc)
+        with search_stage("serialize"):
+            return _json_response(
+                _revision_response(revision, include_payload=include_payload),
+                AssetRevisionResponse,
+            )
 
 
 @app.post("/api/assets/search", tags=["Assets"])
 async def search_assets(request: AssetSearchRequest):
-    try:
-        results = await search_executor.run(
-            _asset_search_sync,
-            request.query,
-            tuple(request.asset_types),
-            request.limit,
-        )
-    except SearchOverloadedError as exc:
-        raise _search_overloaded(exc) from exc
-    except Exception as exc:
-        raise _search_service_unavailable("/api/assets/search", exc) from exc
-    return {
-        "query": request.query,
-        "results": [asdict(item) for item in results],
-        "count": len(results),
-    }
+    with _search_stage_metrics("/api/assets/search", VECTOR_BACKEND):
+        try:
+            results = await search_executor.run(
+                _asset_search_sync,
+                request.query,
+                tuple(request.asset_types),
+                request.limit,
+            )
+        except SearchOverloadedError as exc:
+            raise _search_overloaded(exc) from exc
+        except Exception as exc:
+            raise _search_service_unavailable("/api/assets/search", exc) from exc
+        with search_stage("serialize"):
+            return _json_response({
+                "query": request.query,
+                "results": [asdict(item) for item in results],
+                "count": len(results),
+            })
 
 
 @app.post(
@@ -879,7 +1151,9 @@ async def reload_assets(_user: dict = Depends(require_auth)):
     """Validate and atomically swap the configured Runtime Asset snapshot."""
 
     try:
-        repository = await search_executor.run(reload_asset_repository)
+        repository = await search_executor.run(
+            reload_asset_repository, search_class="admin"
+        )
         revisions = repository.list_revisions()
     except SearchOverloadedError as exc:
         raise _search_overloaded(exc) from exc
@@ -1003,21 +1277,26 @@ async def search_skills(request: SearchRequest):
     """
     start = time.time()
     
-    try:
-        results = await search_executor.run(_search_sync, request.query, request.limit)
-    except SearchOverloadedError as exc:
-        raise _search_overloaded(exc) from exc
-    except Exception as exc:
-        raise _search_service_unavailable("/api/search", exc) from exc
+    with _search_stage_metrics("/api/search", VECTOR_BACKEND):
+        try:
+            results = await search_executor.run(_search_sync, request.query, request.limit)
+        except SearchOverloadedError as exc:
+            raise _search_overloaded(exc) from exc
+        except Exception as exc:
+            raise _search_service_unavailable("/api/search", exc) from exc
     
-    elapsed = (time.time() - start) * 1000
+        elapsed = (time.time() - start) * 1000
     
-    return SearchResponse(
-        query=request.query,
-        results=[SkillResult(**r) for r in results],
-        count=len(results),
-        latency_ms=round(elapsed, 2)
-    )
+        with search_stage("serialize"):
+            return _json_response(
+                SearchResponse(
+                    query=request.query,
+                    results=[SkillResult(**r) for r in results],
+                    count=len(results),
+                    latency_ms=round(elapsed, 2)
+                ),
+                SearchResponse,
+            )
 
 
 @app.get("/api/search", response_model=SearchResponse, tags=["Search"])
@@ -1032,21 +1311,26 @@ async def search_skills_get(
     """
     start = time.time()
     
-    try:
-        results = await search_executor.run(_search_sync, q, limit)
-    except SearchOverloadedError as exc:
-        raise _search_overloaded(exc) from exc
-    except Exception as exc:
-        raise _search_service_unavailable("/api/search", exc) from exc
+    with _search_stage_metrics("/api/search", VECTOR_BACKEND):
+        try:
+            results = await search_executor.run(_search_sync, q, limit)
+        except SearchOverloadedError as exc:
+            raise _search_overloaded(exc) from exc
+        except Exception as exc:
+            raise _search_service_unavailable("/api/search", exc) from exc
     
-    elapsed = (time.time() - start) * 1000
+        elapsed = (time.time() - start) * 1000
     
-    return SearchResponse(
-        query=q,
-        results=[SkillResult(**r) for r in results],
-        count=len(results),
-        latency_ms=round(elapsed, 2)
-    )
+        with search_stage("serialize"):
+            return _json_response(
+                SearchResponse(
+                    query=q,
+                    results=[SkillResult(**r) for r in results],
+                    count=len(results),
+                    latency_ms=round(elapsed, 2)
+                ),
+                SearchResponse,
+            )
 
 
 @app.post("/api/similar", response_model=SearchResponse, tags=["Search"])
@@ -1058,26 +1342,31 @@ async def find_similar_skills(request: SimilarRequest):
     """
     start = time.time()
     
-    try:
-        results = await search_executor.run(
-            _similar_sync, request.skill_name, request.limit
-        )
-    except SearchOverloadedError as exc:
-        raise _search_overloaded(exc) from exc
-    except Exception as exc:
-        raise _search_service_unavailable("/api/similar", exc) from exc
+    with _search_stage_metrics("/api/similar", VECTOR_BACKEND):
+        try:
+            results = await search_executor.run(
+                _similar_sync, request.skill_name, request.limit
+            )
+        except SearchOverloadedError as exc:
+            raise _search_overloaded(exc) from exc
+        except Exception as exc:
+            raise _search_service_unavailable("/api/similar", exc) from exc
     
-    if not results:
-        raise HTTPException(status_code=404, detail=f"Skill '{request.skill_name}' not found")
+        if not results:
+            raise HTTPException(status_code=404, detail=f"Skill '{request.skill_name}' not found")
     
-    elapsed = (time.time() - start) * 1000
+        elapsed = (time.time() - start) * 1000
     
-    return SearchResponse(
-        query=f"similar to: {request.skill_name}",
-        results=[SkillResult(**r) for r in results],
-        count=len(results),
-        latency_ms=round(elapsed, 2)
-    )
+        with search_stage("serialize"):
+            return _json_response(
+                SearchResponse(
+                    query=f"similar to: {request.skill_name}",
+                    results=[SkillResult(**r) for r in results],
+                    count=len(results),
+                    latency_ms=round(elapsed, 2)
+                ),
+                SearchResponse,
+            )
 
 
 @app.get("/api/similar/{skill_name}", response_model=SearchResponse, tags=["Search"])
@@ -1090,24 +1379,29 @@ async def find_similar_skills_get(
     """
     start = time.time()
     
-    try:
-        results = await search_executor.run(_similar_sync, skill_name, limit)
-    except SearchOverloadedError as exc:
-        raise _search_overloaded(exc) from exc
-    except Exception as exc:
-        raise _search_service_unavailable("/api/similar", exc) from exc
+    with _search_stage_metrics("/api/similar", VECTOR_BACKEND):
+        try:
+            results = await search_executor.run(_similar_sync, skill_name, limit)
+        except SearchOverloadedError as exc:
+            raise _search_overloaded(exc) from exc
+        except Exception as exc:
+            raise _search_service_unavailable("/api/similar", exc) from exc
     
-    if not results:
-        raise HTTPException(status_code=404, detail=f"Skill '{skill_name}' not found")
+        if not results:
+            raise HTTPException(status_code=404, detail=f"Skill '{skill_name}' not found")
     
-    elapsed = (time.time() - start) * 1000
+        elapsed = (time.time() - start) * 1000
     
-    return SearchResponse(
-        query=f"similar to: {skill_name}",
-        results=[SkillResult(**r) for r in results],
-        count=len(results),
-        latency_ms=round(elapsed, 2)
-    )
+        with search_stage("serialize"):
+            return _json_response(
+                SearchResponse(
+                    query=f"similar to: {skill_name}",
+                    results=[SkillResult(**r) for r in results],
+                    count=len(results),
+                    latency_ms=round(elapsed, 2)
+                ),
+                SearchResponse,
+            )
 
 
 @app.get("/api/cluster", response_model=ClusterResponse, tags=["Analysis"])
@@ -1120,7 +1414,9 @@ async def cluster_skills(
     Automatically group all skills using K-Means clustering.
     """
     try:
-        clusters = await search_executor.run(_cluster_sync, n)
+        clusters = await search_executor.run(
+            _cluster_sync, n, search_class="analytics"
+        )
     except SearchOverloadedError as exc:
         raise _search_overloaded(exc) from exc
     except Exception as exc:
@@ -1144,7 +1440,7 @@ async def cluster_skills(
 async def get_statistics():
     """Get database statistics"""
     try:
-        stats = await search_executor.run(_stats_sync)
+        stats = await search_executor.run(_stats_sync, search_class="analytics")
     except SearchOverloadedError as exc:
         raise _search_overloaded(exc) from exc
     
@@ -1158,7 +1454,9 @@ async def list_all_skills(
 ):
     """List all Skills (paginated)"""
     try:
-        all_skills = await search_executor.run(_list_skills_sync)
+        all_skills = await search_executor.run(
+            _list_skills_sync, search_class="asset_metadata"
+        )
     except SearchOverloadedError as exc:
         raise _search_overloaded(exc) from exc
     
@@ -1183,7 +1481,9 @@ async def get_skill_by_id(
 ):
     """Get Skill details by ID"""
     try:
-        skill = await search_executor.run(_skill_by_id_sync, skill_id, include_json)
+        skill = await search_executor.run(
+            _skill_by_id_sync, skill_id, include_json, search_class="asset_metadata"
+        )
     except SearchOverloadedError as exc:
         raise _search_overloaded(exc) from exc
     
@@ -1203,7 +1503,9 @@ async def index_skills(request: IndexRequest, _user: dict = Depends(require_auth
     start = time.time()
     
     try:
-        count = await search_executor.run(_index_sync, request.parsed_dir)
+        count = await search_executor.run(
+            _index_sync, request.parsed_dir, search_class="admin"
+        )
     except SearchOverloadedError as exc:
         raise _search_overloaded(exc) from exc
     
@@ -1,6 +1,7 @@
 """Runtime governance run read API."""
 from __future__ import annotations
 
+import json
 import os
 from pathlib import Path
 import sqlite3
@@ -8,16 +9,20 @@ from threading import RLock
 from typing import Any, Iterator, Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from prometheus_client import Counter, Gauge
 from pydantic import BaseModel, ConfigDict, Field
 
 from asset_registry.repositories import (
     AssetIdentityAmbiguousError,
     AssetNotFoundError,
     AssetRepository,
+    AssetRepositoryError,
     AssetSnapshotBuildError,
     LegacySkillAssetRepository,
     StaleSourceSnapshotError,
 )
+from asset_registry.sqlite_repository import SQLiteAssetRepository
 
 from runtime.evidence import build_run_evidence
 from runtime.executor import ActionResult
@@ -25,8 +30,10 @@ from runtime.governance import (
     RuntimeGovernanceGate,
     SQLiteRuntimeGovernanceGate,
 )
-from runtime.ledger import RuntimeLedger
-from runtime.models import RunStatus, RuntimeEventType
+from runtime.ledger import LedgerSchemaError, RuntimeLedger
+from runtime.ledger_pool import LedgerPool
+from runtime.ledger_writer import LedgerWriter, LedgerWriterBusy, QueuedLedger
+from runtime.models import RunStatus, RuntimeEvent, RuntimeEventType
 from runtime.orchestrator import RuntimeOrchestrator
 from runtime.recovery import RecoveryCoordinator
 from runtime.rules import UnavailableRuleEvaluator
@@ -37,15 +44,64 @@ RUNTIME_BINDING_KEY_ENV = "SKILL0_RUNTIME_BINDING_KEY"
 RUNTIME_DECISION_ACTORS_ENV = "SKILL0_RUNTIME_DECISION_ACTORS"
 RUNTIME_HITL_TTL_SECONDS_ENV = "SKILL0_RUNTIME_HITL_TTL_SECONDS"
 RUNTIME_JOURNAL_MODE_ENV = "SKILL0_RUNTIME_JOURNAL_MODE"
+RUNTIME_LEDGER_POOL_SIZE_ENV = "SKILL0_RUNTIME_LEDGER_POOL_SIZE"
+RUNTIME_SYNCHRONOUS_ENV = "SKILL0_RUNTIME_SYNCHRONOUS"
+RUNTIME_CHECKPOINT_INTERVAL_SECONDS_ENV = "SKILL0_RUNTIME_CHECKPOINT_INTERVAL_SECONDS"
+RUNTIME_WRITER_QUEUE_SIZE_ENV = "SKILL0_RUNTIME_WRITER_QUEUE_SIZE"
 GOVERNANCE_DB_PATH_ENV = "SKILL0_GOVERNANCE_DB_PATH"
+ASSET_FRESHNESS_TTL_SECONDS_ENV = "SKILL0_ASSET_FRESHNESS_TTL_SECONDS"
+ASSET_MANIFEST_PATH_ENV = "SKILL0_ASSET_MANIFEST_PATH"
+ASSET_PARSE_WORKERS_ENV = "SKILL0_ASSET_PARSE_WORKERS"
+ASSET_PAYLOAD_CACHE_SIZE_ENV = "SKILL0_ASSET_PAYLOAD_CACHE_SIZE"
+ASSET_REGISTRY_DB_ENV = "SKILL0_ASSET_REGISTRY_DB"
 DEFAULT_RUNTIME_DB_PATH = Path("governance/db/runtime.db")
 DEFAULT_GOVERNANCE_DB_PATH = Path("governance/db/governance.db")
 DEFAULT_RUNTIME_HITL_TTL_SECONDS = 86_400
+DEFAULT_RUNTIME_LEDGER_POOL_SIZE = 4
+DEFAULT_RUNTIME_CHECKPOINT_INTERVAL_SECONDS = 300
+DEFAULT_RUNTIME_WRITER_QUEUE_SIZE = 1024
 EVIDENCE_SCHEMA_PATH = Path(__file__).resolve().parents[2] / "schema" / "evidence-summary.schema.json"
 RUN_EVIDENCE_SCHEMA_PATH = (
     Path(__file__).resolve().parents[2] / "schema" / "runtime-run-evidence.schema.json"
 )
 
+MAX_EVENT_PAGE_SIZE = 1000
+# Payload keys that are safe to expose on the public event view; everything
+# else (parameters, outputs, adapter detail) stays in the ledger.
+PUBLIC_EVENT_PAYLOAD_KEYS = frozenset(
+    {
+        "dry_run",
+        "action_count",
+        "contract_schema_version",
+        "schema_validated",
+        "skill_schema_validated",
+        "cross_references_validated",
+        "skill_identity_validated",
+        "governance_validated",
+        "precondition_rule_ids",
+        "effect_classification",
+        "resource_kind",
+        "operation",
+        "output_keys",
+        "error_code",
+        "error_message_present",
+        "rule_id",
+        "validated_rule_ids",
+        "failed_action_id",
+        "source_action_id",
+        "attempt",
+        "max_attempts",
+        "acceptable_error",
+        "completed_attempt",
+        "next_attempt",
+        "strategy",
+        "decision",
+        "actor",
+        "reason_code",
+        "hitl_item_id",
+    }
+)
+
 router = APIRouter(prefix="/api/runs", tags=["runtime-v4"])
 
 
@@ -217,6 +273,47 @@ def get_runtime_journal_mode() -> str:
     return value.upper()
 
 
+def runtime_synchronous_configuration_issue(
+    value: str | None,
+    journal_mode: str | None,
+) -> str | None:
+    synchronous = (value or "FULL").upper()
+    if synchronous not in {"FULL", "NORMAL"}:
+        return "SKILL0_RUNTIME_SYNCHRONOUS must be FULL or NORMAL"
+    if synchronous == "NORMAL" and (journal_mode or "DELETE").upper() != "WAL":
+        return "SKILL0_RUNTIME_SYNCHRONOUS=NORMAL requires SKILL0_RUNTIME_JOURNAL_MODE=WAL"
+    return None
+
+
+def get_runtime_synchronous(journal_mode: str) -> str:
+    value = os.getenv(RUNTIME_SYNCHRONOUS_ENV, "FULL")
+    if runtime_synchronous_configuration_issue(value, journal_mode) is not None:
+        raise HTTPException(
+            status_code=503,
+            detail="Runtime synchronous mode is not configured",
+        )
+    return value.upper()
+
+
+def get_runtime_checkpoint_interval_seconds() -> int | None:
+    """Seconds between pooled WAL checkpoints; `0` leaves them to SQLite."""
+
+    value = os.getenv(
+        RUNTIME_CHECKPOINT_INTERVAL_SECONDS_ENV,
+        str(DEFAULT_RUNTIME_CHECKPOINT_INTERVAL_SECONDS),
+    )
+    try:
+        interval = int(value)
+    except ValueError:
+        interval = -1
+    if not 0 <= interval <= 86_400:
+        raise HTTPException(
+            status_code=503,
+            detail="Runtime checkpoint interval is not configured",
+        )
+    return interval or None
+
+
 def authorize_runtime_decision_actor(actor: str) -> None:
     allowed = {
         value.strip()
@@ -235,13 +332,196 @@ def authorize_runtime_decision_actor(actor: str) -> None:
         )
 
 
+def get_runtime_ledger_pool_size() -> int:
+    value = os.getenv(
+        RUNTIME_LEDGER_POOL_SIZE_ENV, str(DEFAULT_RUNTIME_LEDGER_POOL_SIZE)
+    )
+    try:
+        size = int(value)
+    except ValueError:
+        size = 0
+    if not 1 <= size <= 64:
+        raise HTTPException(
+            status_code=503,
+            detail="Runtime ledger pool size is not configured",
+        )
+    return size
+
+
+def get_runtime_writer_queue_size() -> int:
+    """Bound of the single-writer queue; `0` gives each request a pooled writer."""
+
+    value = os.getenv(
+        RUNTIME_WRITER_QUEUE_SIZE_ENV, str(DEFAULT_RUNTIME_WRITER_QUEUE_SIZE)
+    )
+    try:
+        size = int(value)
+    except ValueError:
+        size = -1
+    if not 0 <= size <= 65_536:
+        raise HTTPException(
+            status_code=503,
+            detail="Runtime writer queue size is not configured",
+        )
+    return size
+
+
+RUNTIME_LEDGER_POOL_EVENTS = Counter(
+    "skill0_runtime_ledger_pool_events_total",
+    "Runtime ledger pool events (opened, reused, affinity_hits, recycled, overflow, "
+    "checkpoints, checkpoints_busy)",
+    ["role", "event"],
+)
+RUNTIME_LEDGER_POOL_CONNECTIONS = Gauge(
+    "skill0_runtime_ledger_pool_connections",
+    "Runtime ledger pool connections by state",
+    ["role", "state"],
+)
+
+_ledger_pool_lock = RLock()
+_ledger_pools: dict[tuple[str, str, str, str, int, int, int | None], LedgerPool] = {}
+
+
+def _pool_connections(role: str, state: str) -> float:
+    with _ledger_pool_lock:
+        pools = [pool for key, pool in _ledger_pools.items() if key[0] == role]
+    return float(sum(pool.stats()[state] for pool in pools))
+
+
+for _role in ("writer", "reader"):
+    for _state in ("idle", "in_use"):
+        RUNTIME_LEDGER_POOL_CONNECTIONS.labels(role=_role, state=_state).set_function(
+            lambda role=_role, state=_state: _pool_connections(role, state)
+        )
+
+
+def _runtime_ledger_pool(role: Literal["writer", "reader"]) -> LedgerPool:
+    path = get_runtime_db_path().resolve()
+    journal_mode = get_runtime_journal_mode()
+    synchronous = get_runtime_synchronous(journal_mode)
+    ttl_seconds = get_runtime_hitl_ttl_seconds()
+    size = get_runtime_ledger_pool_size()
+    checkpoint_interval = get_runtime_checkpoint_interval_seconds()
+    key = (role, str(path), journal_mode, synchronous, ttl_seconds, size, checkpoint_interval)
+    with _ledger_pool_lock:
+        pool = _ledger_pools.get(key)
+        if pool is None:
+            # Requests never upgrade an existing ledger; the entrypoint's
+            # maintenance step migrates it once before the API serves.
+            pool = LedgerPool(
+                path,
+                size=size,
+                read_only=role == "reader",
+                journal_mode=journal_mode,
+                synchronous=synchronous,
+                hitl_ttl_seconds=ttl_seconds,
+                migrate=False,
+                checkpoint_interval_seconds=checkpoint_interval,
+                on_event=lambda event: RUNTIME_LEDGER_POOL_EVENTS.labels(
+                    role=role, event=event
+                ).inc(),
+            )
+            _ledger_pools[key] = pool
+        return pool
+
+
+RUNTIME_LEDGER_WRITER_EVENTS = Counter(
+    "skill0_runtime_ledger_writer_events_total",
+    "Runtime ledger writer events (submitted, rejected, transactions, batched, "
+    "exclusive, failed, checkpoints, checkpoints_busy)",
+    ["event"],
+)
+RUNTIME_LEDGER_WRITER_QUEUE_DEPTH = Gauge(
+    "skill0_runtime_ledger_writer_queue_depth",
+    "Runtime ledger writes waiting for the writer thread",
+)
+
+_ledger_writers: dict[tuple[str, str, str, int, int, int | None], LedgerWriter] = {}
+
+RUNTIME_LEDGER_WRITER_QUEUE_DEPTH.set_function(
+    lambda: float(
+        sum(writer.stats()["queue_depth"] for writer in list(_ledger_writers.values()))
+    )
+)
+
+
+def _runtime_ledger_writer(queue_size: int) -> LedgerWriter:
+    path = get_runtime_db_path().resolve()
+    journal_mode = get_runtime_journal_mode()
+    synchronous = get_runtime_synchronous(journal_mode)
+    ttl_seconds = get_runtime_hitl_ttl_seconds()
+    checkpoint_interval = get_runtime_checkpoint_interval_seconds()
+    key = (str(path), journal_mode, synchronous, ttl_seconds, queue_size, checkpoint_interval)
+    with _ledger_pool_lock:
+        writer = _ledger_writers.get(key)
+        if writer is not None and not writer.matches_file():
+            # The database was restored or swapped underneath the writer.
+            _ledger_writers.pop(key).close()
+            writer = None
+        if writer is None:
+            writer = LedgerWriter(
+                path,
+                journal_mode=journal_mode,
+                synchronous=synchronous,
+                hitl_ttl_seconds=ttl_seconds,
+                migrate=False,
+                queue_size=queue_size,
+                checkpoint_interval_seconds=checkpoint_interval,
+                on_event=lambda event: RUNTIME_LEDGER_WRITER_EVENTS.labels(
+                    event=event
+                ).inc(),
+            )
+            _ledger_writers[key] = writer
+        return writer
+
+
+def runtime_ledger_writer_stats() -> list[dict[str, Any]]:
+    with _ledger_pool_lock:
+        writers = list(_ledger_writers.items())
+    return [{"path": key[0], **writer.stats()} for key, writer in writers]
+
+
+def runtime_ledger_pool_stats() -> dict[str, list[dict[str, Any]]]:
+    with _ledger_pool_lock:
+        pools = list(_ledger_pools.items())
+    stats: dict[str, list[dict[str, Any]]] = {"writer": [], "reader": []}
+    for (role, path, *_), pool in pools:
+        stats[role].append({"path": path, **pool.stats()})
+    return stats
+
+
+def close_runtime_ledger_pools() -> None:
+    with _ledger_pool_lock:
+        pools = list(_ledger_pools.values())
+        _ledger_pools.clear()
+        writers = list(_ledger_writers.values())
+        _ledger_writers.clear()
+    for writer in writers:
+        writer.close()
+    for pool in pools:
+        pool.close()
+
+
 def get_runtime_ledger() -> Iterator[RuntimeLedger]:
-    with RuntimeLedger(
-        get_runtime_db_path(),
-        journal_mode=get_runtime_journal_mode(),
-        hitl_ttl_seconds=get_runtime_hitl_ttl_seconds(),
-    ) as ledger:
-        yield ledger
+    queue_size = get_runtime_writer_queue_size()
+    try:
+        if queue_size == 0:
+            with _runtime_ledger_pool("writer").lease() as ledger:
+                yield ledger
+            return
+        writer = _runtime_ledger_writer(queue_size)
+        with _runtime_ledger_pool("reader").lease() as reader:
+            yield QueuedLedger(writer, reader)
+    except LedgerSchemaError as exc:
+        raise HTTPException(
+            status_code=503, detail="Runtime ledger requires migration"
+        ) from exc
+    except LedgerWriterBusy as exc:
+        raise HTTPException(
+            status_code=503,
+            detail="Runtime ledger writer is saturated",
+            headers={"Retry-After": "1"},
+        ) from exc
 
 
 def get_runtime_governance_gate() -> RuntimeGovernanceGate:
@@ -260,12 +540,7 @@ def get_runtime_reader() -> Iterator[RuntimeLedger]:
     if not path.exists():
         raise HTTPException(status_code=404, detail="Run not found")
     try:
-        with RuntimeLedger(
-            path,
-            journal_mode=get_runtime_journal_mode(),
-            read_only=True,
-            hitl_ttl_seconds=get_runtime_hitl_ttl_seconds(),
-        ) as ledger:
+        with _runtime_ledger_pool("reader").lease() as ledger:
             yield ledger
     except sqlite3.DatabaseError as exc:
         raise HTTPException(status_code=500, detail="Runtime ledger unavailable") from exc
@@ -275,16 +550,104 @@ def get_parsed_dir() -> Path:
     return Path(os.getenv("SKILL0_PARSED_DIR", "parsed"))
 
 
+def get_asset_freshness_ttl_seconds() -> float:
+    value = os.getenv(ASSET_FRESHNESS_TTL_SECONDS_ENV, "0")
+    try:
+        ttl_seconds = float(value)
+    except ValueError:
+        ttl_seconds = -1.0
+    if not 0 <= ttl_seconds <= 60:
+        raise HTTPException(
+            status_code=503,
+            detail="Asset freshness TTL is not configured",
+        )
+    return ttl_seconds
+
+
+def get_asset_manifest_path() -> Path | None:
+    """The snapshot manifest is opt-in: serving never writes beside a read-only corpus."""
+
+    value = os.getenv(ASSET_MANIFEST_PATH_ENV, "").strip()
+    if value.lower() in {"", "off", "none"}:
+        return None
+    return Path(value)
+
+
+def get_asset_parse_workers() -> int:
+    value = os.getenv(ASSET_PARSE_WORKERS_ENV, "1")
+    try:
+        workers = int(value)
+    except ValueError:
+        workers = 0
+    if not 1 <= workers <= 64:
+        raise HTTPException(
+            status_code=503,
+            detail="Asset parse workers are not configured",
+        )
+    return workers
+
+
+def get_asset_payload_cache_size() -> int | None:
+    value = os.getenv(ASSET_PAYLOAD_CACHE_SIZE_ENV, "").strip()
+    if not value:
+        return None
+    try:
+        size = int(value)
+    except ValueError:
+        size = 0
+    if size < 1:
+        raise HTTPException(
+            status_code=503,
+            detail="Asset payload cache size is not configured",
+        )
+    return size
+
+
+def get_asset_registry_db() -> Path | None:
+    value = os.getenv(ASSET_REGISTRY_DB_ENV, "").strip()
+    return Path(value) if value else None
+
+
+def _new_repository(
+    path: str,
+) -> LegacySkillAssetRepository | SQLiteAssetRepository:
+    registry = get_asset_registry_db()
+    if registry is not None:
+        try:
+            return SQLiteAssetRepository(
+                registry, payload_cache_size=get_asset_payload_cache_size()
+            )
+        except AssetRepositoryError as exc:
+            raise HTTPException(
+                status_code=503, detail="Asset registry unavailable"
+            ) from exc
+    return LegacySkillAssetRepository(
+        Path(path),
+        freshness_ttl_seconds=get_asset_freshness_ttl_seconds(),
+        manifest_path=get_asset_manifest_path(),
+        workers=get_asset_parse_workers(),
+        payload_cache_size=get_asset_payload_cache_size(),
+    )
+
+
 _repository_lock = RLock()
-_repositories: dict[str, LegacySkillAssetRepository] = {}
+_repositories: dict[str, LegacySkillAssetRepository | SQLiteAssetRepository] = {}
 
 
-def _repository_for_path(path: str) -> LegacySkillAssetRepository:
+def _repository_for_path(
+    path: str,
+) -> LegacySkillAssetRepository | SQLiteAssetRepository:
     with _repository_lock:
         existing = _repositories.get(path)
+    if isinstance(existing, SQLiteAssetRepository) and not existing.is_current():
+        # Another worker imported a new registry head; follow it.
+        replacement = existing.rebuild()
+        with _repository_lock:
+            _repositories[path] = replacement
+        return replacement
     if existing is not None:
         return existing
-    replacement = LegacySkillAssetRepository(Path(path))
+    replacement = _new_repository(path)
     with _repository_lock:
         return _repositories.setdefault(path, replacement)
 
@@ -303,7 +666,12 @@ def reload_asset_repository() -> AssetRepository:
     """Validate off-side, then atomically replace the configured snapshot."""
 
     path = str(get_parsed_dir().resolve())
-    replacement = LegacySkillAssetRepository(Path(path))
+    with _repository_lock:
+        current = _repositories.get(path)
+    if current is None:
+        replacement = _new_repository(path)
+    else:
+        replacement = current.rebuild()
     with _repository_lock:
         _repositories[path] = replacement
     return replacement
@@ -405,6 +773,7 @@ def create_run(
             request.runtime_contract,
             skill_document,
             asset_id=asset_revision.asset_id,
+            skill_digest=asset_revision.content_hash,
             parameters=request.parameters,
             context={},
             dry_run=True,
@@ -505,6 +874,7 @@ def resume_hitl_run(
             request.runtime_contract,
             skill_document,
             asset_id=asset_revision.asset_id,
+            skill_digest=asset_revision.content_hash,
             parameters=request.parameters,
             context={},
             dry_run=True,
@@ -568,70 +938,59 @@ def get_run(run_id: str, ledger: RuntimeLedger = Depends(get_runtime_reader)) ->
 @router.get("/{run_id}/events")
 def get_events(
     run_id: str,
+    after_sequence: int = Query(default=0, ge=0),
+    limit: int | None = Query(default=None, ge=1, le=MAX_EVENT_PAGE_SIZE),
+    response_format: Literal["json", "ndjson"] = Query(default="json", alias="format"),
     ledger: RuntimeLedger = Depends(get_runtime_reader),
-) -> list[dict[str, object]]:
+) -> Any:
+    """Public view of a run's events after the `after_sequence` cursor.
+
+    `X-Next-After-Sequence` carries the cursor for the next poll; it stays at
+    `after_sequence` when no newer event exists yet.
+    """
+
     try:
         ledger.get_run(run_id)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail="Run not found") from exc
-    public_events: list[dict[str, object]] = []
-    for event in ledger.list_events(run_id):
-        data = event.to_dict()
-        external_resource_id = data.pop("external_resource_id", None)
-        data["external_resource_id_present"] = external_resource_id is not None
-        idempotency_key = data.pop("idempotency_key", None)
-        data["idempotency_key_present"] = idempotency_key is not None
-        source_payload = dict(data.get("payload", {}))
-        allowed_keys = {
-            "dry_run",
-            "action_count",
-            "contract_schema_version",
-            "schema_validated",
-            "skill_schema_validated",
-            "cross_references_validated",
-            "skill_identity_validated",
-            "governance_validated",
-            "precondition_rule_ids",
-            "effect_classification",
-            "resource_kind",
-            "operation",
-            "output_keys",
-            "error_code",
-            "error_message_present",
-            "rule_id",
-            "validated_rule_ids",
-            "failed_action_id",
-            "source_action_id",
-            "attempt",
-            "max_attempts",
-            "acceptable_error",
-            "completed_attempt",
-            "next_attempt",
-            "strategy",
-            "decision",
-            "actor",
-            "reason_code",
-            "hitl_item_id",
-        }
-        payload = {
-            key: source_payload[key]
-            for key in allowed_keys
-            if key in source_payload
-        }
-        compensation = source_payload.get("compensation")
-        if isinstance(compensation, dict) and isinstance(
-            compensation.get("strategy"), str
-        ):
-            payload["compensation_strategy"] = compensation["strategy"]
-        governance = source_payload.get("governance_attestation")
-        if isinstance(governance, dict):
-            payload["governance_revision_id"] = governance.get("revision_id")
-            payload["governance_policy"] = governance.get("policy")
-        recovery_parameters = source_payload.get("resolved_compensation_parameters")
-        if isinstance(recovery_parameters, dict):
-            payload["resolved_compensation_parameter_keys"] = sorted(
-                recovery_parameters
-            )
-        data["payload"] = payload
-        public_events.append(data)
-    return public_events
+    events = ledger.list_events(run_id, after_sequence=after_sequence, limit=limit)
+    headers = {
+        "X-Next-After-Sequence": str(events[-1].sequence if events else after_sequence)
+    }
+    if response_format == "ndjson":
+        return StreamingResponse(
+            (json.dumps(_public_event(event)) + "\n" for event in events),
+            media_type="application/x-ndjson",
+            headers=headers,
+        )
+    return JSONResponse([_public_event(event) for event in events], headers=headers)
+
+
+def _public_event(event: RuntimeEvent) -> dict[str, object]:
+    data = event.to_dict()
+    external_resource_id = data.pop("external_resource_id", None)
+    data["external_resource_id_present"] = external_resource_id is not None
+    idempotency_key = data.pop("idempotency_key", None)
+    data["idempotency_key_present"] = idempotency_key is not None
+    source_payload = data.get("payload", {})
+    payload = {
+        key: value
+        for key, value in source_payload.items()
+        if key in PUBLIC_EVENT_PAYLOAD_KEYS
+    }
+    compensation = source_payload.get("compensation")
+    if isinstance(compensation, dict) and isinstance(
+        compensation.get("strategy"), str
+    ):
+        payload["compensation_strategy"] = compensation["strategy"]
+    governance = source_payload.get("governance_attestation")
+    if isinstance(governance, dict):
+        payload["governance_revision_id"] = governance.get("revision_id")
+        payload["governance_policy"] = governance.get("policy")
+    recovery_parameters = source_payload.get("resolved_compensation_parameters")
+    if isinstance(recovery_parameters, dict):
+        payload["resolved_compensation_parameter_keys"] = sorted(
+            recovery_parameters
+        )
+    data["payload"] = payload
+    return data
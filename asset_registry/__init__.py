@@ -7,7 +7,13 @@ from .contracts import (
     skill_document_to_asset_envelope,
     validate_asset_envelope,
 )
-from .models import AssetRevision, SnapshotDiagnostic
+from .models import (
+    AssetListing,
+    AssetRevision,
+    AssetRevisionRef,
+    SnapshotDiagnostic,
+    SnapshotDiff,
+)
 from .repositories import (
     AssetIdentityAmbiguousError,
     AssetNotFoundError,
@@ -16,9 +22,16 @@ from .repositories import (
     AssetSnapshotBuildError,
     LegacySkillAssetRepository,
     SkillParserAdapter,
+    SnapshotNotRetainedError,
     StaleSourceSnapshotError,
 )
-from .search import AssetSearchResult, BoundedSearchExecutor, SearchOverloadedError
+from .sqlite_repository import SQLiteAssetRepository, import_corpus
+from .search import (
+    AssetSearchResult,
+    BoundedSearchExecutor,
+    SearchClassPolicy,
+    SearchOverloadedError,
+)
 
 __all__ = [
     "AssetContractError",
@@ -27,16 +40,23 @@ __all__ = [
     "skill_document_to_asset_envelope",
     "validate_asset_envelope",
     "AssetIdentityAmbiguousError",
+    "AssetListing",
     "AssetNotFoundError",
     "AssetRepository",
     "AssetRepositoryError",
     "AssetRevision",
+    "AssetRevisionRef",
     "AssetSnapshotBuildError",
     "LegacySkillAssetRepository",
     "SkillParserAdapter",
     "SnapshotDiagnostic",
+    "SnapshotDiff",
+    "SnapshotNotRetainedError",
+    "SQLiteAssetRepository",
+    "import_corpus",
     "StaleSourceSnapshotError",
     "AssetSearchResult",
     "BoundedSearchExecutor",
+    "SearchClassPolicy",
     "SearchOverloadedError",
 ]
@@ -0,0 +1,269 @@
+"""Packed, checksummed cache of a parsed corpus directory.
+
+The pack is one file: a magic line, a JSONL body with one compact document
+per line, a JSON offset index, and a fixed-size trailer locating and
+digesting the index. The per-file directory stays the source of truth; a
+pack whose recorded file stamps no longer match the directory is ignored.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import fnmatch
+import hashlib
+import json
+import mmap
+import os
+from pathlib import Path
+import struct
+from typing import Any, Iterator
+
+PACK_MAGIC = b"SKILL0-CORPUS-PACK/1\n"
+PACK_VERSION = "1"
+_TRAILER = struct.Struct("<8sQQ32s")
+_TRAILER_MAGIC = b"S0PKIDX1"
+
+
+class CorpusPackError(RuntimeError):
+    """Raised when a pack is malformed or no longer matches its checksums."""
+
+
+@dataclass(frozen=True)
+class PackEntry:
+    relative_path: str
+    offset: int
+    length: int
+    digest: str
+    source_digest: str
+    size: int
+    modified_ns: int
+
+
+def default_pack_path(corpus_dir: Path) -> Path:
+    """Derived pack location beside, not inside, the corpus directory."""
+
+    resolved = corpus_dir.resolve()
+    return resolved.parent / f".{resolved.name}.corpus-pack"
+
+
+def _sha256(data: bytes) -> str:
+    return "sha256:" + hashlib.sha256(data).hexdigest()
+
+
+def build_pack(corpus_dir: Path, output: Path | None = None) -> dict[str, Any]:
+    """Pack every ``*.json`` document of ``corpus_dir`` and replace ``output`` atomically."""
+
+    corpus_dir = corpus_dir.resolve()
+    output = output or default_pack_path(corpus_dir)
+    temporary = output.with_name(output.name + ".tmp")
+    entries: list[dict[str, Any]] = []
+    body_digest = hashlib.sha256()
+    try:
+        with temporary.open("wb") as handle:
+            handle.write(PACK_MAGIC)
+            offset = len(PACK_MAGIC)
+            for path in sorted(corpus_dir.glob("*.json"), key=lambda item: item.name):
+                stat = path.stat()
+                raw = path.read_bytes()
+                try:
+                    document = json.loads(raw.decode("utf-8"))
+                except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+                    raise CorpusPackError(f"malformed document: {path.name}") from exc
+                line = (
+                    json.dumps(document, ensure_ascii=False, separators=(",", ":"))
+                    .encode("utf-8")
+                )
+                handle.write(line + b"\n")
+                body_digest.update(line + b"\n")
+                entries.append(
+                    {
+                        "relative_path": path.name,
+                        "offset": offset,
+                        "length": len(line),
+                        "digest": _sha256(line),
+                        "source_digest": _sha256(raw),
+                        "size": stat.st_size,
+                        "modified_ns": stat.st_mtime_ns,
+                    }
+                )
+                offset += len(line) + 1
+            index = json.dumps(
+                {
+                    "pack_version": PACK_VERSION,
+                    "body_digest": "sha256:" + body_digest.hexdigest(),
+                    "entries": entries,
+                },
+                ensure_ascii=False,
+                separators=(",", ":"),
+            ).encode("utf-8")
+            handle.write(index)
+            handle.write(
+                _TRAILER.pack(
+                    _TRAILER_MAGIC, offset, len(index), hashlib.sha256(index).digest()
+                )
+            )
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temporary, output)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+    return {
+        "pack": str(output),
+        "documents": len(entries),
+        "bytes": output.stat().st_size,
+        "body_digest": "sha256:" + body_digest.hexdigest(),
+    }
+
+
+class CorpusPack:
+    """Memory-mapped pack reader decoding single documents on demand."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        with path.open("rb") as handle:
+            try:
+                self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as exc:
+                raise CorpusPackError("empty pack") from exc
+        try:
+            self._load_index()
+        except BaseException:
+            self._map.close()
+            raise
+
+    def _load_index(self) -> None:
+        if len(self._map) < len(PACK_MAGIC) + _TRAILER.size or (
+            self._map[: len(PACK_MAGIC)] != PACK_MAGIC
+        ):
+            raise CorpusPackError("not a corpus pack")
+        magic, index_offset, index_length, index_digest = _TRAILER.unpack(
+            self._map[-_TRAILER.size :]
+        )
+        if magic != _TRAILER_MAGIC or index_offset + index_length + _TRAILER.size != len(
+            self._map
+        ):
+            raise CorpusPackError("corrupt pack trailer")
+        raw_index = self._map[index_offset : index_offset + index_length]
+        if hashlib.sha256(raw_index).digest() != index_digest:
+            raise CorpusPackError("corrupt pack index")
+        index = json.loads(raw_index.decode("utf-8"))
+        if index.get("pack_version") != PACK_VERSION:
+            raise CorpusPackError("unsupported pack version")
+        self.body_digest = str(index["body_digest"])
+        self._body_end = index_offset
+        self._entries = {
+            item["relative_path"]: PackEntry(**item) for item in index["entries"]
+        }
+
+    def __enter__(self) -> CorpusPack:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._map.close()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def entries(self) -> tuple[PackEntry, ...]:
+        return tuple(self._entries.values())
+
+    def entry(self, relative_path: str) -> PackEntry:
+        return self._entries[relative_path]
+
+    def load(self, relative_path: str) -> dict[str, Any]:
+        """Decode one document after checking its body digest."""
+
+        entry = self.entry(relative_path)
+        raw = self._map[entry.offset : entry.offset + entry.length]
+        if _sha256(raw) != entry.digest:
+            raise CorpusPackError(f"corrupt pack document: {relative_path}")
+        return json.loads(raw.decode("utf-8"))
+
+    def iter_documents(self, pattern: str = "*.json") -> Iterator[tuple[str, dict[str, Any]]]:
+        for relative_path in self._entries:
+            if fnmatch.fnmatchcase(relative_path, pattern):
+                yield relative_path, self.load(relative_path)
+
+    def verify(self) -> dict[str, Any]:
+        """Check the whole body digest and every document digest."""
+
+        body = self._map[len(PACK_MAGIC) : self._body_end]
+        if _sha256(body) != self.body_digest:
+            raise CorpusPackError("corrupt pack body")
+        for relative_path in self._entries:
+            self.load(relative_path)
+        return {"pack": str(self.path), "documents": len(self), "body_digest": self.body_digest}
+
+    def matches(self, corpus_dir: Path) -> bool:
+        """Whether the directory still holds exactly the packed files, unchanged."""
+
+        try:
+            names = {path.name for path in corpus_dir.glob("*.json")}
+            if names != self._entries.keys():
+                return False
+            for entry in self._entries.values():
+                stat = (corpus_dir / entry.relative_path).stat()
+                if stat.st_size != entry.size or stat.st_mtime_ns != entry.modified_ns:
+                    return False
+        except OSError:
+            return False
+        return True
+
+
+def open_fresh_pack(corpus_dir: Path, pack_path: Path | None = None) -> CorpusPack | None:
+    """Open the pack for ``corpus_dir`` only if it exists, is intact and still current."""
+
+    pack_path = pack_path or default_pack_path(corpus_dir)
+    if not pack_path.is_file():
+        return None
+    try:
+        pack = CorpusPack(pack_path)
+    except (CorpusPackError, OSError, ValueError):
+        return None
+    if not pack.matches(corpus_dir):
+        pack.close()
+        return None
+    return pack
+
+
+class CorpusReader:
+    """Read corpus documents from a current pack, falling back to the files.
+
+    ``paths`` lists the directory in name order; ``load`` decodes one
+    document, so callers keep their per-file error handling either way.
+    """
+
+    def __init__(self, corpus_dir: Path, *, pack_path: Path | None = None):
+        self.corpus_dir = Path(corpus_dir)
+        self.pack = open_fresh_pack(self.corpus_dir, pack_path)
+
+    def __enter__(self) -> CorpusReader:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self.pack is not None:
+            self.pack.close()
+            self.pack = None
+
+    def paths(self, pattern: str = "*.json") -> list[Path]:
+        if self.pack is not None:
+            return [
+                self.corpus_dir / entry.relative_path
+                for entry in self.pack.entries
+                if fnmatch.fnmatchcase(entry.relative_path, pattern)
+            ]
+        return sorted(self.corpus_dir.glob(pattern), key=lambda item: item.name)
+
+    def load(self, path: Path) -> Any:
+        if self.pack is not None:
+            return self.pack.load(path.name)
+        with path.open("r", encoding="utf-8") as handle:
+            return json.load(handle)
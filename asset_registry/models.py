@@ -2,22 +2,151 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable, Mapping
+
+
+class _PayloadField:
+    """Return the eager payload when one was given, else ask ``payload_loader``."""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.attribute = f"_{name}"
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        payload = instance.__dict__[self.attribute]
+        return instance.payload_loader() if payload is None else payload
+
+    def __set__(self, instance: Any, value: dict[str, Any] | None) -> None:
+        instance.__dict__[self.attribute] = value
 
 
 @dataclass(frozen=True)
 class AssetRevision:
+    """Revision metadata plus its payload.
+
+    Pass ``payload`` to keep it resident, or ``payload=None`` with a
+    ``payload_loader`` to materialize it on each access. ``name``,
+    ``summary``, ``parser_id`` and ``parser_version`` default to the
+    payload's ``meta``; repositories pass them explicitly so a snapshot can
+    be listed and identified without loading any payload.
+    """
+
     asset_id: str
     revision_id: str
     asset_type: str
     content_hash: str
     source_digest: str
     source_path: Path
-    payload: dict[str, Any]
+    payload: dict[str, Any] | None = field(repr=False, compare=False)
     legacy_skill_id: str
     identity_strategy: str
+    name: str | None = None
+    summary: str | None = None
+    parser_id: Any = None
+    parser_version: Any = None
+    payload_loader: Callable[[], dict[str, Any]] | None = field(
+        default=None, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.__dict__["_payload"] is None and self.payload_loader is None:
+            raise TypeError("AssetRevision needs a payload or a payload_loader")
+        if None in (self.name, self.summary, self.parser_id, self.parser_version):
+            meta = self.payload.get("meta", {})
+            derived = {
+                "name": str(meta.get("name", "")),
+                "summary": str(meta.get("description") or ""),
+                "parser_id": meta.get("parsed_by", "legacy-unknown"),
+                "parser_version": meta.get(
+                    "parser_version", meta.get("schema_version", "legacy-unknown")
+                ),
+            }
+            for key, value in derived.items():
+                if getattr(self, key) is None:
+                    object.__setattr__(self, key, value)
+
+    def with_changes(self, **changes: Any) -> AssetRevision:
+        """``dataclasses.replace`` that keeps a loader-backed payload unloaded."""
+
+        changes.setdefault("payload", self.__dict__["_payload"])
+        return replace(self, **changes)
+
+
+# 在 dataclass 產生 __init__ 之後才掛上，payload 仍是必填的建構參數
+AssetRevision.payload = _PayloadField()
+AssetRevision.payload.__set_name__(AssetRevision, "payload")
+
+
+@dataclass(frozen=True)
+class AssetRevisionRef:
+    """Payload-free identity of a revision kept in snapshot history."""
+
+    asset_id: str
+    revision_id: str
+    asset_type: str
+    content_hash: str
+    source_digest: str
+    source_path: Path
+
+    @classmethod
+    def of(cls, revision: AssetRevision) -> AssetRevisionRef:
+        return cls(
+            revision.asset_id,
+            revision.revision_id,
+            revision.asset_type,
+            revision.content_hash,
+            revision.source_digest,
+            revision.source_path,
+        )
+
+
+@dataclass(frozen=True)
+class SnapshotDiff:
+    """Revisions keyed by ``(asset_id, source_path)`` that differ between snapshots."""
+
+    from_snapshot_id: str
+    to_snapshot_id: str
+    added: tuple[AssetRevision, ...]
+    changed: tuple[AssetRevision, ...]
+    removed: tuple[AssetRevisionRef, ...]
+
+
+def diff_revisions(
+    from_snapshot_id: str,
+    to_snapshot_id: str,
+    base: Mapping[tuple[str, str], AssetRevisionRef],
+    current: Iterable[AssetRevision],
+) -> SnapshotDiff:
+    keyed = {
+        (revision.asset_id, revision.source_path.as_posix()): revision
+        for revision in current
+    }
+    return SnapshotDiff(
+        from_snapshot_id=from_snapshot_id,
+        to_snapshot_id=to_snapshot_id,
+        added=tuple(item for key, item in keyed.items() if key not in base),
+        changed=tuple(
+            item
+            for key, item in keyed.items()
+            if key in base and base[key].revision_id != item.revision_id
+        ),
+        removed=tuple(item for key, item in base.items() if key not in keyed),
+    )
+
+
+@dataclass(frozen=True)
+class AssetListing:
+    """Per-asset summary projected once when a snapshot is built."""
+
+    asset_id: str
+    asset_type: str
+    name: str
+    summary: str
+    revision_count: int
+    ambiguous: bool
 
 
 @dataclass(frozen=True)
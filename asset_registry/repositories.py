@@ -2,21 +2,35 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 import hashlib
+from functools import partial
 import json
+import multiprocessing
+import os
 from pathlib import Path
-from typing import Protocol
+from threading import Lock
+import time
+from typing import Any, Protocol
 
 from runtime.digest import canonical_digest
 
 from .contracts import (
+    ASSET_SCHEMA_VERSION,
     AssetContractError,
     collision_asset_id,
     skill_document_to_asset_envelope,
 )
-from .models import AssetRevision, SnapshotDiagnostic
+from .models import (
+    AssetListing,
+    AssetRevision,
+    AssetRevisionRef,
+    SnapshotDiagnostic,
+    SnapshotDiff,
+    diff_revisions,
+)
 
 
 class AssetRepositoryError(RuntimeError):
@@ -35,6 +49,10 @@ class StaleSourceSnapshotError(AssetRepositoryError):
     code = "stale_source_snapshot"
 
 
+class SnapshotNotRetainedError(AssetRepositoryError):
+    code = "snapshot_not_retained"
+
+
 class AssetSnapshotBuildError(AssetRepositoryError):
     code = "invalid_source_snapshot"
 
@@ -56,6 +74,10 @@ class AssetRepository(Protocol):
 
     def list_asset_revisions(self, asset_id: str) -> tuple[AssetRevision, ...]: ...
 
+    def list_asset_summaries(self) -> tuple[AssetListing, ...]: ...
+
+    def diff(self, from_snapshot_id: str) -> SnapshotDiff: ...
+
 
 class SkillParserAdapter:
     """Wrap existing canonical Skill output without changing parser behavior."""
@@ -86,9 +108,83 @@ class SkillParserAdapter:
             payload=envelope["payload"],
             legacy_skill_id=envelope["identity"]["legacy_skill_id"],
             identity_strategy=envelope["identity"]["strategy"],
+            name=envelope["name"],
+            summary=envelope["summary"],
         )
 
 
+class _PayloadCache:
+    """Bounded LRU of materialized payloads shared by one repository lineage."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], dict[str, Any]] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: tuple[str, str]) -> dict[str, Any] | None:
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+            return payload
+
+    def put(self, key: tuple[str, str], payload: dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class _SourcePayload:
+    """Read a payload from its source file on use.
+
+    The bytes must still match the recorded ``source_digest`` and the decoded
+    document the ``content_hash``; anything else means the snapshot no longer
+    describes the file and fails closed. Without a cache the payload stays
+    resident after the first read.
+    """
+
+    __slots__ = ("path", "source_digest", "content_hash", "cache", "payload")
+
+    def __init__(
+        self,
+        path: Path,
+        source_digest: str,
+        content_hash: str,
+        cache: _PayloadCache | None = None,
+    ):
+        self.path = path
+        self.source_digest = source_digest
+        self.content_hash = content_hash
+        self.cache = cache
+        self.payload: dict[str, Any] | None = None
+
+    def __call__(self) -> dict[str, Any]:
+        if self.payload is not None:
+            return self.payload
+        key = (str(self.path), self.content_hash)
+        if self.cache is not None and (cached := self.cache.get(key)) is not None:
+            return cached
+        try:
+            raw = self.path.read_bytes()
+        except OSError as exc:
+            raise StaleSourceSnapshotError(StaleSourceSnapshotError.code) from exc
+        if "sha256:" + hashlib.sha256(raw).hexdigest() != self.source_digest:
+            raise StaleSourceSnapshotError(StaleSourceSnapshotError.code)
+        payload = json.loads(raw.decode("utf-8"))
+        if canonical_digest(payload) != self.content_hash:
+            raise StaleSourceSnapshotError(StaleSourceSnapshotError.code)
+        if self.cache is None:
+            self.payload = payload
+        else:
+            self.cache.put(key, payload)
+        return payload
+
+
 @dataclass(frozen=True)
 class _FileStamp:
     relative_path: str
@@ -96,23 +192,175 @@ class _FileStamp:
     modified_ns: int
 
 
+def _stamp_matches(path: Path, stamp: _FileStamp) -> bool:
+    try:
+        current = path.stat()
+    except OSError:
+        return False
+    return current.st_size == stamp.size and current.st_mtime_ns == stamp.modified_ns
+
+
+MANIFEST_VERSION = "1"
+PARALLEL_PARSE_MIN_FILES = 32
+
+
+def _parse_source(
+    adapter: SkillParserAdapter, corpus_dir: Path, relative_path: str
+) -> tuple[_FileStamp, AssetRevision] | SnapshotDiagnostic:
+    """Read, adapt and digest one document; module level so process pools can run it."""
+
+    path = corpus_dir / relative_path
+    try:
+        raw = path.read_bytes()
+        document = json.loads(raw.decode("utf-8"))
+        raw_digest = "sha256:" + hashlib.sha256(raw).hexdigest()
+        revision = adapter.adapt(
+            document,
+            source_path=relative_path,
+            source_digest=raw_digest,
+        )
+        stat = path.stat()
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError, AssetContractError) as exc:
+        return SnapshotDiagnostic("malformed_document", relative_path, str(exc))
+    return _FileStamp(relative_path, stat.st_size, stat.st_mtime_ns), revision
+
+
+def _same_revisions(
+    left: tuple[AssetRevision, ...], right: tuple[AssetRevision, ...]
+) -> bool:
+    return len(left) == len(right) and all(a is b for a, b in zip(left, right))
+
+
 class LegacySkillAssetRepository:
     """Immutable process-local view of the checked-in canonical Skill corpus.
 
     Ambiguous IDs are retained as conflicts so unrelated assets remain
     available. Malformed documents reject the replacement snapshot.
+
+    With ``previous`` the snapshot is built incrementally: files whose size
+    and mtime match the previous stamps reuse its revisions, and collision
+    resolution is only rerun for legacy IDs whose revisions changed. The
+    resulting ``snapshot_id`` is identical to a full rebuild.
+
+    ``freshness_ttl_seconds`` bounds how long a successful per-file freshness
+    check is reused. Within the TTL only the directory is stat()ed, which
+    still catches added, removed and atomically replaced files; a detected
+    change marks the snapshot stale for good.
+
+    ``manifest_path`` persists per-file metadata after each build. A cold
+    start then only parses files whose stamps changed; the remaining payloads
+    are read from disk on first use. A missing or inconsistent manifest
+    falls back to a full build.
+
+    ``payload_cache_size`` keeps only metadata resident: payloads are read
+    from disk on demand, verified, and held in a bounded LRU, so memory no
+    longer grows with document size.
+
+    ``workers`` greater than one parses and digests changed files in a
+    process pool; collision resolution and diagnostics stay in the parent,
+    in path order.
+
+    Rebuilds carry forward payload-free manifests of the last
+    ``snapshot_history_size`` snapshots so ``diff`` can answer what changed
+    since any of them.
     """
 
-    def __init__(self, corpus_dir: Path, *, adapter: SkillParserAdapter | None = None):
+    def __init__(
+        self,
+        corpus_dir: Path,
+        *,
+        adapter: SkillParserAdapter | None = None,
+        previous: LegacySkillAssetRepository | None = None,
+        freshness_ttl_seconds: float = 0.0,
+        manifest_path: Path | None = None,
+        workers: int = 1,
+        payload_cache_size: int | None = None,
+        snapshot_history_size: int = 16,
+    ):
+        if freshness_ttl_seconds < 0:
+            raise ValueError("freshness_ttl_seconds must not be negative")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if payload_cache_size is not None and payload_cache_size < 1:
+            raise ValueError("payload_cache_size must be at least 1")
+        if snapshot_history_size < 1:
+            raise ValueError("snapshot_history_size must be at least 1")
+        self.workers = workers
+        self.snapshot_history_size = snapshot_history_size
+        self.payload_cache_size = payload_cache_size
+        if payload_cache_size is None:
+            self._payload_cache: _PayloadCache | None = None
+        elif previous is not None and previous.payload_cache_size == payload_cache_size:
+            self._payload_cache = previous._payload_cache
+        else:
+            self._payload_cache = _PayloadCache(payload_cache_size)
         self.corpus_dir = corpus_dir.resolve()
+        self.freshness_ttl_seconds = freshness_ttl_seconds
+        self.manifest_path = manifest_path
+        self._verified_at: float | None = None
+        self._stale = False
+        if previous is not None and adapter is None:
+            adapter = previous.adapter
         self.adapter = adapter or SkillParserAdapter()
         self._available: dict[str, AssetRevision] = {}
         self._ambiguous: dict[str, tuple[AssetRevision, ...]] = {}
         self._legacy_aliases: dict[str, tuple[str, ...]] = {}
         self._file_stamps: tuple[_FileStamp, ...] = ()
+        self._sorted_revisions: tuple[AssetRevision, ...] = ()
+        self._summaries: tuple[AssetListing, ...] = ()
+        self._parsed: dict[str, tuple[_FileStamp, AssetRevision]] = {}
+        self._resolutions: dict[
+            str, tuple[tuple[AssetRevision, ...], tuple[AssetRevision, ...]]
+        ] = {}
         self._directory_modified_ns = 0
         self.snapshot_id = ""
-        self._build()
+        if (
+            previous is not None
+            and previous.corpus_dir == self.corpus_dir
+            and previous.adapter is self.adapter
+        ):
+            self._build(previous._parsed, previous._resolutions)
+        elif previous is None and (cached := self._read_manifest()) is not None:
+            parsed, resolutions, snapshot_id = cached
+            self._build(parsed, resolutions)
+            if (
+                self._parsed.keys() == parsed.keys()
+                and all(self._parsed[key] is parsed[key] for key in parsed)
+                and self.snapshot_id != snapshot_id
+            ):
+                self._build()
+        else:
+            self._build()
+        if self.manifest_path is not None:
+            self._write_manifest(self.manifest_path)
+        self._snapshot_history: OrderedDict[
+            str, dict[tuple[str, str], AssetRevisionRef]
+        ] = OrderedDict()
+        if previous is not None and previous.corpus_dir == self.corpus_dir:
+            self._snapshot_history.update(previous._snapshot_history)
+        self._snapshot_history.pop(self.snapshot_id, None)
+        self._snapshot_history[self.snapshot_id] = {
+            (revision.asset_id, revision.source_path.as_posix()): AssetRevisionRef.of(
+                revision
+            )
+            for revision in self._sorted_revisions
+        }
+        while len(self._snapshot_history) > snapshot_history_size:
+            self._snapshot_history.popitem(last=False)
+
+    def rebuild(self) -> LegacySkillAssetRepository:
+        """Return a new snapshot of the same corpus, reparsing only changed files."""
+
+        return type(self)(
+            self.corpus_dir,
+            adapter=self.adapter,
+            previous=self,
+            freshness_ttl_seconds=self.freshness_ttl_seconds,
+            manifest_path=self.manifest_path,
+            workers=self.workers,
+            payload_cache_size=self.payload_cache_size,
+            snapshot_history_size=self.snapshot_history_size,
+        )
 
     @property
     def ambiguous_asset_ids(self) -> tuple[str, ...]:
@@ -126,40 +374,55 @@ class LegacySkillAssetRepository:
     def asset_count(self) -> int:
         return len(self._available) + sum(len(items) for items in self._ambiguous.values())
 
-    def _build(self) -> None:
+    def _build(
+        self,
+        previous_parsed: dict[str, tuple[_FileStamp, AssetRevision]] | None = None,
+        previous_resolutions: dict[
+            str, tuple[tuple[AssetRevision, ...], tuple[AssetRevision, ...]]
+        ]
+        | None = None,
+    ) -> None:
+        previous_parsed = previous_parsed or {}
+        previous_resolutions = previous_resolutions or {}
         diagnostics: list[SnapshotDiagnostic] = []
         grouped: defaultdict[str, list[AssetRevision]] = defaultdict(list)
         stamps: list[_FileStamp] = []
+        parsed: dict[str, tuple[_FileStamp, AssetRevision]] = {}
         if not self.corpus_dir.is_dir():
             raise AssetSnapshotBuildError(
                 (SnapshotDiagnostic("missing_corpus", str(self.corpus_dir), "directory not found"),)
             )
 
+        entries: dict[str, tuple[_FileStamp, AssetRevision] | None] = {}
         for path in sorted(self.corpus_dir.glob("*.json"), key=lambda item: item.name):
             relative_path = path.relative_to(self.corpus_dir).as_posix()
-            try:
-                raw = path.read_bytes()
-                document = json.loads(raw.decode("utf-8"))
-                raw_digest = "sha256:" + hashlib.sha256(raw).hexdigest()
-                revision = self.adapter.adapt(
-                    document,
-                    source_path=relative_path,
-                    source_digest=raw_digest,
-                )
-                stat = path.stat()
-            except (OSError, UnicodeDecodeError, json.JSONDecodeError, AssetContractError) as exc:
-                diagnostics.append(
-                    SnapshotDiagnostic("malformed_document", relative_path, str(exc))
-                )
+            cached = previous_parsed.get(relative_path)
+            if cached is not None and _stamp_matches(path, cached[0]):
+                entries[relative_path] = cached
+            else:
+                entries[relative_path] = None
+        pending = [key for key, value in entries.items() if value is None]
+        for relative_path, outcome in zip(pending, self._parse_sources(pending)):
+            if not isinstance(outcome, SnapshotDiagnostic):
+                outcome = (outcome[0], self._detach_payload(outcome[1]))
+            entries[relative_path] = outcome
+        for relative_path, outcome in entries.items():
+            if isinstance(outcome, SnapshotDiagnostic):
+                diagnostics.append(outcome)
                 continue
+            stamp, revision = outcome
             grouped[revision.asset_id].append(revision)
-            stamps.append(_FileStamp(relative_path, stat.st_size, stat.st_mtime_ns))
+            stamps.append(stamp)
+            parsed[relative_path] = outcome
         if diagnostics:
             raise AssetSnapshotBuildError(tuple(diagnostics))
 
         available: dict[str, AssetRevision] = {}
         ambiguous: dict[str, tuple[AssetRevision, ...]] = {}
         aliases: dict[str, tuple[str, ...]] = {}
+        resolutions: dict[
+            str, tuple[tuple[AssetRevision, ...], tuple[AssetRevision, ...]]
+        ] = {}
         legacy_namespace = set(grouped)
         for legacy_id, revisions in grouped.items():
             if len(revisions) == 1:
@@ -174,21 +437,18 @@ class LegacySkillAssetRepository:
                     continue
                 available[legacy_id] = revisions[0]
                 continue
-            resolved: list[AssetRevision] = []
-            try:
-                for revision in revisions:
-                    derived_id = collision_asset_id(revision.payload)
-                    resolved.append(
-                        self.adapter.adapt(
-                            revision.payload,
-                            source_path=revision.source_path.as_posix(),
-                            source_digest=revision.source_digest,
-                            asset_id=derived_id,
-                            identity_strategy="source_name_disambiguation",
-                        )
-                    )
-            except AssetContractError:
-                resolved = []
+            group = tuple(revisions)
+            cached_resolution = previous_resolutions.get(legacy_id)
+            if cached_resolution is not None and _same_revisions(
+                cached_resolution[0], group
+            ):
+                resolved = list(cached_resolution[1])
+            else:
+                resolved = [
+                    self._detach_payload(item)
+                    for item in self._resolve_collision(revisions)
+                ]
+            resolutions[legacy_id] = (group, tuple(resolved))
             resolved_ids = [item.asset_id for item in resolved]
             if resolved and len(set(resolved_ids)) == len(resolved_ids):
                 conflicting_ids = sorted(
@@ -215,8 +475,12 @@ class LegacySkillAssetRepository:
         self._available = available
         self._ambiguous = ambiguous
         self._legacy_aliases = aliases
+        self._index_revisions()
         self._file_stamps = tuple(stamps)
+        self._parsed = parsed
+        self._resolutions = resolutions
         self._directory_modified_ns = self.corpus_dir.stat().st_mtime_ns
+        self._verified_at = time.monotonic()
         manifest = [
             {
                 "path": revision.source_path.as_posix(),
@@ -225,15 +489,8 @@ class LegacySkillAssetRepository:
                 "identity_strategy": revision.identity_strategy,
                 "source_digest": revision.source_digest,
                 "content_hash": revision.content_hash,
-                "parser_id": revision.payload.get("meta", {}).get(
-                    "parsed_by", "legacy-unknown"
-                ),
-                "parser_version": revision.payload.get("meta", {}).get(
-                    "parser_version",
-                    revision.payload.get("meta", {}).get(
-                        "schema_version", "legacy-unknown"
-                    ),
-                ),
+                "parser_id": revision.parser_id,
+                "parser_version": revision.parser_version,
             }
             for revision in self.list_revisions(check_fresh=False)
         ]
@@ -241,18 +498,203 @@ class LegacySkillAssetRepository:
             {"manifest_version": "1.0.0", "entries": manifest}
         )
 
+    def _index_revisions(self) -> None:
+        revisions = list(self._available.values())
+        for ambiguous in self._ambiguous.values():
+            revisions.extend(ambiguous)
+        self._sorted_revisions = tuple(
+            sorted(revisions, key=lambda item: item.source_path.as_posix())
+        )
+        grouped: dict[str, list[AssetRevision]] = {}
+        for revision in self._sorted_revisions:
+            grouped.setdefault(revision.asset_id, []).append(revision)
+        self._summaries = tuple(
+            AssetListing(
+                asset_id=asset_id,
+                asset_type=items[0].asset_type,
+                name=items[0].name or asset_id,
+                summary=items[0].summary,
+                revision_count=len(items),
+                ambiguous=len(items) > 1,
+            )
+            for asset_id, items in sorted(grouped.items())
+        )
+
+    def _detach_payload(self, revision: AssetRevision) -> AssetRevision:
+        if self._payload_cache is None:
+            return revision
+        return revision.with_changes(
+            payload=None,
+            payload_loader=_SourcePayload(
+                self.corpus_dir / revision.source_path,
+                revision.source_digest,
+                revision.content_hash,
+                self._payload_cache,
+            ),
+        )
+
+    def _parse_sources(
+        self, relative_paths: list[str]
+    ) -> list[tuple[_FileStamp, AssetRevision] | SnapshotDiagnostic]:
+        parse = partial(_parse_source, self.adapter, self.corpus_dir)
+        if self.workers <= 1 or len(relative_paths) < PARALLEL_PARSE_MIN_FILES:
+            return [parse(relative_path) for relative_path in relative_paths]
+        # spawn: the API forks from a multi-threaded process.
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            chunksize = max(1, len(relative_paths) // (self.workers * 4))
+            return list(pool.map(parse, relative_paths, chunksize=chunksize))
+
+    def _read_manifest(
+        self,
+    ) -> tuple[
+        dict[str, tuple[_FileStamp, AssetRevision]],
+        dict[str, tuple[tuple[AssetRevision, ...], tuple[AssetRevision, ...]]],
+        str,
+    ] | None:
+        if self.manifest_path is None or type(self.adapter) is not SkillParserAdapter:
+            return None
+        try:
+            document = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+            if (
+                document["manifest_version"] != MANIFEST_VERSION
+                or document["asset_schema_version"] != ASSET_SCHEMA_VERSION
+                or document["corpus_dir"] != str(self.corpus_dir)
+            ):
+                return None
+            parsed: dict[str, tuple[_FileStamp, AssetRevision]] = {}
+            for entry in document["files"]:
+                stamp = _FileStamp(entry["path"], int(entry["size"]), int(entry["modified_ns"]))
+                revision = AssetRevision(
+                    asset_id=entry["asset_id"],
+                    revision_id=entry["revision_id"],
+                    asset_type=entry["asset_type"],
+                    content_hash=entry["content_hash"],
+                    source_digest=entry["source_digest"],
+                    source_path=Path(entry["path"]),
+                    payload=None,
+                    legacy_skill_id=entry["legacy_skill_id"],
+                    identity_strategy="legacy_exact",
+                    name=entry["name"],
+                    summary=entry["summary"],
+                    parser_id=entry["parser_id"],
+                    parser_version=entry["parser_version"],
+                    payload_loader=_SourcePayload(
+                        self.corpus_dir / entry["path"],
+                        entry["source_digest"],
+                        entry["content_hash"],
+                        self._payload_cache,
+                    ),
+                )
+                parsed[stamp.relative_path] = (stamp, revision)
+            resolutions = {}
+            for entry in document["resolutions"]:
+                group = tuple(parsed[path][1] for path in entry["paths"])
+                if entry["asset_ids"] and len(entry["asset_ids"]) != len(group):
+                    return None
+                resolved = tuple(
+                    revision.with_changes(
+                        asset_id=asset_id,
+                        identity_strategy="source_name_disambiguation",
+                    )
+                    for revision, asset_id in zip(group, entry["asset_ids"])
+                )
+                resolutions[entry["legacy_id"]] = (group, resolved)
+            return parsed, resolutions, document["snapshot_id"]
+        except (OSError, UnicodeDecodeError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write_manifest(self, manifest_path: Path) -> None:
+        """Best effort: a missing manifest only costs the next cold start a full build."""
+
+        document = {
+            "manifest_version": MANIFEST_VERSION,
+            "asset_schema_version": ASSET_SCHEMA_VERSION,
+            "corpus_dir": str(self.corpus_dir),
+            "snapshot_id": self.snapshot_id,
+            "files": [
+                {
+                    "path": stamp.relative_path,
+                    "size": stamp.size,
+                    "modified_ns": stamp.modified_ns,
+                    "asset_id": revision.asset_id,
+                    "revision_id": revision.revision_id,
+                    "asset_type": revision.asset_type,
+                    "content_hash": revision.content_hash,
+                    "source_digest": revision.source_digest,
+                    "legacy_skill_id": revision.legacy_skill_id,
+                    "name": revision.name,
+                    "summary": revision.summary,
+                    "parser_id": revision.parser_id,
+                    "parser_version": revision.parser_version,
+                }
+                for stamp, revision in self._parsed.values()
+            ],
+            "resolutions": [
+                {
+                    "legacy_id": legacy_id,
+                    "paths": [item.source_path.as_posix() for item in group],
+                    "asset_ids": [item.asset_id for item in resolved],
+                }
+                for legacy_id, (group, resolved) in self._resolutions.items()
+            ],
+        }
+        temporary = manifest_path.with_name(manifest_path.name + ".tmp")
+        try:
+            temporary.write_text(
+                json.dumps(document, ensure_ascii=False, separators=(",", ":")),
+                encoding="utf-8",
+            )
+            os.replace(temporary, manifest_path)
+        except OSError:
+            temporary.unlink(missing_ok=True)
+
+    def _resolve_collision(self, revisions: list[AssetRevision]) -> list[AssetRevision]:
+        resolved: list[AssetRevision] = []
+        try:
+            for revision in revisions:
+                derived_id = collision_asset_id(revision.payload)
+                resolved.append(
+                    self.adapter.adapt(
+                        revision.payload,
+                        source_path=revision.source_path.as_posix(),
+                        source_digest=revision.source_digest,
+                        asset_id=derived_id,
+                        identity_strategy="source_name_disambiguation",
+                    )
+                )
+        except AssetContractError:
+            return []
+        return resolved
+
     def assert_fresh(self) -> None:
         """Fail closed without re-enumerating or reparsing the directory."""
 
+        if self._stale:
+            raise StaleSourceSnapshotError(StaleSourceSnapshotError.code)
         try:
             if self.corpus_dir.stat().st_mtime_ns != self._directory_modified_ns:
-                raise StaleSourceSnapshotError(StaleSourceSnapshotError.code)
-            for stamp in self._file_stamps:
-                current = (self.corpus_dir / stamp.relative_path).stat()
-                if current.st_size != stamp.size or current.st_mtime_ns != stamp.modified_ns:
-                    raise StaleSourceSnapshotError(StaleSourceSnapshotError.code)
+                self._stale = True
+            elif self._verified_at is None or (
+                time.monotonic() - self._verified_at >= self.freshness_ttl_seconds
+            ):
+                for stamp in self._file_stamps:
+                    current = (self.corpus_dir / stamp.relative_path).stat()
+                    if (
+                        current.st_size != stamp.size
+                        or current.st_mtime_ns != stamp.modified_ns
+                    ):
+                        self._stale = True
+                        break
+                else:
+                    self._verified_at = time.monotonic()
         except OSError as exc:
+            self._stale = True
             raise StaleSourceSnapshotError(StaleSourceSnapshotError.code) from exc
+        if self._stale:
+            raise StaleSourceSnapshotError(StaleSourceSnapshotError.code)
 
     def get_revision(
         self, asset_id: str, revision_id: str | None = None
@@ -272,10 +714,24 @@ class LegacySkillAssetRepository:
     def list_revisions(self, *, check_fresh: bool = True) -> tuple[AssetRevision, ...]:
         if check_fresh:
             self.assert_fresh()
-        revisions = list(self._available.values())
-        for ambiguous in self._ambiguous.values():
-            revisions.extend(ambiguous)
-        return tuple(sorted(revisions, key=lambda item: item.source_path.as_posix()))
+        return self._sorted_revisions
+
+    def list_asset_summaries(self) -> tuple[AssetListing, ...]:
+        """Summaries ordered by ``asset_id``; ambiguous IDs count every revision."""
+
+        self.assert_fresh()
+        return self._summaries
+
+    def diff(self, from_snapshot_id: str) -> SnapshotDiff:
+        """Revisions added, changed or removed since a retained snapshot."""
+
+        self.assert_fresh()
+        base = self._snapshot_history.get(from_snapshot_id)
+        if base is None:
+            raise SnapshotNotRetainedError(SnapshotNotRetainedError.code)
+        return diff_revisions(
+            from_snapshot_id, self.snapshot_id, base, self._sorted_revisions
+        )
 
     def list_asset_revisions(self, asset_id: str) -> tuple[AssetRevision, ...]:
         self.assert_fresh()
@@ -3,14 +3,46 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
-from functools import partial
-from typing import Any, Callable, TypeVar
+from time import perf_counter
+from typing import Any, Callable, Iterator, Mapping, TypeVar
 
 
 T = TypeVar("T")
 
+_search_stages: contextvars.ContextVar[dict[str, float] | None] = contextvars.ContextVar(
+    "skill0_search_stages", default=None
+)
+
+
+@contextmanager
+def collect_search_stages() -> Iterator[dict[str, float]]:
+    """Collect per-stage seconds for one request; stages outside a collector are free."""
+
+    stages: dict[str, float] = {}
+    token = _search_stages.set(stages)
+    try:
+        yield stages
+    finally:
+        _search_stages.reset(token)
+
+
+@contextmanager
+def search_stage(name: str) -> Iterator[None]:
+    stages = _search_stages.get()
+    if stages is None:
+        yield
+        return
+    started = perf_counter()
+    try:
+        yield
+    finally:
+        stages[name] = stages.get(name, 0.0) + perf_counter() - started
+
 
 @dataclass(frozen=True)
 class AssetSearchResult:
@@ -24,12 +56,175 @@ class AssetSearchResult:
     similarity: float
 
 
+SEARCH_CLASSES = ("interactive", "asset_metadata", "analytics", "admin")
+DEFAULT_SEARCH_CLASS = "interactive"
+
+
+@dataclass(frozen=True)
+class SearchClassPolicy:
+    """Admission limits for one class of search work.
+
+    ``target_latency_seconds`` turns on AIMD: a completion slower than the
+    target halves the concurrency limit (never below ``min_workers``), a
+    faster one grows it by ``1 / limit`` up to ``max_workers``. The limit is
+    halved at most once per latency window: only work that started after
+    the previous decrease, and so ran under the reduced limit, can halve it
+    again.
+    ``deadline_seconds`` sheds queued work whose estimated completion would
+    already miss the deadline. Work admitted to the queue otherwise waits
+    for a worker however long that takes; ``acquire_timeout_seconds`` only
+    bounds the wait for a queue slot once ``queue_capacity`` is full.
+    """
+
+    max_workers: int = 2
+    queue_capacity: int = 4
+    acquire_timeout_seconds: float = 0.2
+    min_workers: int = 1
+    target_latency_seconds: float | None = None
+    deadline_seconds: float | None = None
+
+
 class SearchOverloadedError(RuntimeError):
     code = "search_capacity_exhausted"
 
+    def __init__(
+        self,
+        message: str = "search_capacity_exhausted",
+        *,
+        search_class: str = DEFAULT_SEARCH_CLASS,
+        reason: str = "queue_full",
+    ):
+        super().__init__(message)
+        self.search_class = search_class
+        self.reason = reason
+
+
+class _AdmissionQueue:
+    """One class's worker pool, FIFO wait queue and adaptive limit (loop thread only)."""
+
+    def __init__(self, name: str, policy: SearchClassPolicy):
+        self.name = name
+        self.policy = policy
+        self.executor = ThreadPoolExecutor(
+            max_workers=policy.max_workers,
+            thread_name_prefix=f"skill0-search-{name}",
+        )
+        self.limit = float(policy.max_workers)
+        self.latency_ewma: float | None = None
+        self.decreased_at = float("-inf")
+        self.rejections: dict[str, int] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        self.active = 0
+        self.waiters: deque[asyncio.Future[None]] = deque()
+        self.overflow: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def concurrency_limit(self) -> int:
+        return max(self.policy.min_workers, int(self.limit))
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(not waiter.done() for waiter in self.waiters)
+
+    def _reject(self, reason: str) -> SearchOverloadedError:
+        self.rejections[reason] = self.rejections.get(reason, 0) + 1
+        return SearchOverloadedError(
+            SearchOverloadedError.code, search_class=self.name, reason=reason
+        )
+
+    def _estimated_completion(self) -> float:
+        if self.latency_ewma is None:
+            return 0.0
+        ahead = self.queue_depth + 1
+        return self.latency_ewma * (1 + ahead / self.concurrency_limit)
+
+    async def acquire(self, deadline_seconds: float | None) -> None:
+        if self.active < self.concurrency_limit and not self.queue_depth:
+            self.active += 1
+            return
+        if deadline_seconds is not None and self._estimated_completion() > deadline_seconds:
+            raise self._reject("deadline")
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        started = loop.time()
+        try:
+            if self.queue_depth >= self.policy.queue_capacity:
+                # 佇列已滿：最多等 acquire_timeout_seconds 取得排隊位置
+                timeout, reason = self.policy.acquire_timeout_seconds, "queue_full"
+                if deadline_seconds is not None and deadline_seconds < timeout:
+                    timeout, reason = deadline_seconds, "deadline"
+                self.overflow.append(waiter)
+                await asyncio.wait({waiter}, timeout=timeout)
+                if waiter in self.overflow:
+                    self._abandon(waiter)
+                    raise self._reject(reason)
+            else:
+                self.waiters.append(waiter)
+            # 已進入佇列的工作等到有 worker 為止，只受呼叫端自己的 deadline 限制
+            timeout = None
+            if deadline_seconds is not None:
+                timeout = max(0.0, deadline_seconds - (loop.time() - started))
+            await asyncio.wait_for(waiter, timeout=timeout)
+        except TimeoutError as exc:
+            self._abandon(waiter)
+            raise self._reject("deadline") from exc
+        except asyncio.CancelledError:
+            self._abandon(waiter)
+            raise
+
+    def _abandon(self, waiter: asyncio.Future[None]) -> None:
+        if waiter.done() and not waiter.cancelled():
+            self.release()
+        elif waiter in self.waiters:
+            self.waiters.remove(waiter)
+            self._promote()
+        elif waiter in self.overflow:
+            self.overflow.remove(waiter)
+
+    def _promote(self) -> None:
+        while self.overflow and self.queue_depth < self.policy.queue_capacity:
+            waiter = self.overflow.popleft()
+            if not waiter.done():
+                self.waiters.append(waiter)
+
+    def release(self) -> None:
+        self.active -= 1
+        while self.waiters and self.active < self.concurrency_limit:
+            waiter = self.waiters.popleft()
+            if waiter.done():
+                continue
+            self.active += 1
+            waiter.set_result(None)
+        self._promote()
+
+    def complete(self, elapsed: float | None, started: float | None = None) -> None:
+        if elapsed is not None:
+            self.latency_ewma = (
+                elapsed
+                if self.latency_ewma is None
+                else 0.8 * self.latency_ewma + 0.2 * elapsed
+            )
+            target = self.policy.target_latency_seconds
+            if target is not None:
+                if elapsed > target:
+                    if started is None or started > self.decreased_at:
+                        self.limit = max(float(self.policy.min_workers), self.limit / 2)
+                        self.decreased_at = perf_counter()
+                else:
+                    self.limit = min(
+                        float(self.policy.max_workers), self.limit + 1 / self.limit
+                    )
+        self.release()
+
 
 class BoundedSearchExecutor:
-    """Two workers plus a bounded queue; capacity follows actual thread lifetime."""
+    """Per-class workers plus bounded queues; capacity follows actual thread lifetime.
+
+    Without ``classes`` the executor has a single ``interactive`` class built
+    from ``max_workers``, ``queue_capacity`` and ``acquire_timeout_seconds``.
+    """
 
     def __init__(
         self,
@@ -37,41 +232,89 @@ class BoundedSearchExecutor:
         max_workers: int = 2,
         queue_capacity: int = 4,
         acquire_timeout_seconds: float = 0.2,
+        classes: Mapping[str, SearchClassPolicy] | None = None,
     ):
-        self.max_workers = max_workers
-        self.queue_capacity = queue_capacity
-        self.acquire_timeout_seconds = acquire_timeout_seconds
-        self._executor = ThreadPoolExecutor(
-            max_workers=max_workers,
-            thread_name_prefix="skill0-search",
-        )
-        self._capacity: asyncio.Semaphore | None = None
+        if classes is None:
+            classes = {
+                DEFAULT_SEARCH_CLASS: SearchClassPolicy(
+                    max_workers=max_workers,
+                    queue_capacity=queue_capacity,
+                    acquire_timeout_seconds=acquire_timeout_seconds,
+                )
+            }
+        self.policies = dict(classes)
+        self._queues = {
+            name: _AdmissionQueue(name, policy) for name, policy in self.policies.items()
+        }
         self._loop: asyncio.AbstractEventLoop | None = None
 
-    def _semaphore(self) -> asyncio.Semaphore:
+    def _queue(self, search_class: str) -> _AdmissionQueue:
+        try:
+            queue = self._queues[search_class]
+        except KeyError as exc:
+            raise ValueError(f"unknown search class: {search_class}") from exc
         loop = asyncio.get_running_loop()
-        if self._capacity is None or self._loop is not loop:
+        if self._loop is not loop:
             self._loop = loop
-            self._capacity = asyncio.Semaphore(self.max_workers + self.queue_capacity)
-        return self._capacity
+            for item in self._queues.values():
+                item.reset()
+        return queue
 
-    async def run(self, function: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
-        semaphore = self._semaphore()
-        try:
-            await asyncio.wait_for(
-                semaphore.acquire(), timeout=self.acquire_timeout_seconds
-            )
-        except TimeoutError as exc:
-            raise SearchOverloadedError(SearchOverloadedError.code) from exc
+    async def run(
+        self,
+        function: Callable[..., T],
+        /,
+        *args: Any,
+        search_class: str = DEFAULT_SEARCH_CLASS,
+        deadline_seconds: float | None = None,
+        **kwargs: Any,
+    ) -> T:
+        submitted = perf_counter()
+        queue = self._queue(search_class)
+        if deadline_seconds is None:
+            deadline_seconds = queue.policy.deadline_seconds
+        await queue.acquire(deadline_seconds)
+
+        stages = _search_stages.get()
+        started: list[float] = []
+
+        def invoke() -> T:
+            started.append(perf_counter())
+            if stages is not None:
+                stages["queue_wait"] = started[0] - submitted
+            return function(*args, **kwargs)
 
         loop = asyncio.get_running_loop()
-        future = loop.run_in_executor(self._executor, partial(function, *args, **kwargs))
+        context = contextvars.copy_context()
+        try:
+            future = loop.run_in_executor(queue.executor, context.run, invoke)
+        except BaseException:
+            queue.release()
+            raise
 
         def release_capacity(_future) -> None:
-            loop.call_soon_threadsafe(semaphore.release)
+            if started:
+                loop.call_soon_threadsafe(
+                    queue.complete, perf_counter() - started[0], started[0]
+                )
+            else:
+                loop.call_soon_threadsafe(queue.complete, None)
 
         future.add_done_callback(release_capacity)
         return await asyncio.shield(future)
 
+    def stats(self) -> dict[str, dict[str, Any]]:
+        return {
+            name: {
+                "queue_depth": queue.queue_depth,
+                "in_flight": queue.active,
+                "concurrency_limit": queue.concurrency_limit,
+                "latency_ewma_seconds": queue.latency_ewma,
+                "rejections": dict(queue.rejections),
+            }
+            for name, queue in self._queues.items()
+        }
+
     def shutdown(self) -> None:
-        self._executor.shutdown(wait=False, cancel_futures=True)
+        for queue in self._queues.values():
+            queue.executor.shutdown(wait=False, cancel_futures=True)
@@ -5,6 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, timezone
 import hashlib
+import os
 from pathlib import Path
 import sqlite3
 from typing import Iterable, Literal
@@ -188,6 +189,19 @@ def preflight_index_schema(
     }
 
 
+def default_index_representation(connection: sqlite3.Connection) -> str | None:
+    """Return the representation queries use, or None before the registry exists."""
+
+    if connection.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='index_representations'"
+    ).fetchone() is None:
+        return None
+    row = connection.execute(
+        "SELECT name FROM index_representations WHERE is_default = 1"
+    ).fetchone()
+    return str(row[0]) if row else "primary"
+
+
 def _statements(sql: str) -> tuple[str, ...]:
     statements: list[str] = []
     buffer = ""
@@ -274,3 +288,30 @@ def verify_database(path: Path) -> str:
             raise MigrationError(f"backup integrity check failed: {result}")
         connection.execute("SELECT name FROM sqlite_master LIMIT 1").fetchall()
     return result
+
+
+def read_database_generation(connection: sqlite3.Connection) -> int:
+    """Return the swap generation recorded in ``PRAGMA user_version``."""
+
+    return int(connection.execute("PRAGMA user_version").fetchone()[0])
+
+
+def swap_database(candidate: Path, target: Path) -> str:
+    """Integrity-check a closed candidate and atomically rename it over target.
+
+    Readers holding the previous file keep their open inode; new connections
+    observe the complete replacement, never a partially rebuilt database.
+    """
+
+    for suffix in ("-journal", "-wal"):
+        if candidate.with_name(candidate.name + suffix).exists():
+            raise MigrationError(f"candidate database is still open: {suffix}")
+    result = verify_database(candidate)
+    os.replace(candidate, target)
+    if os.name != "nt":
+        directory = os.open(target.resolve().parent, os.O_RDONLY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+    return result
@@ -0,0 +1,479 @@
+"""Persistent Asset registry shared by API workers through one SQLite file."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from datetime import datetime, timezone
+import json
+from pathlib import Path
+import sqlite3
+from typing import Any, Iterator
+
+from runtime.digest import canonical_digest
+
+from .models import (
+    AssetListing,
+    AssetRevision,
+    AssetRevisionRef,
+    SnapshotDiff,
+    diff_revisions,
+)
+from .repositories import (
+    AssetIdentityAmbiguousError,
+    AssetNotFoundError,
+    AssetRepositoryError,
+    LegacySkillAssetRepository,
+    SnapshotNotRetainedError,
+    StaleSourceSnapshotError,
+    _PayloadCache,
+)
+from .sqlite import REGISTRY_POLICY, apply_migrations, connect_sqlite, load_migrations
+
+
+_REVISION_COLUMNS = """
+    r.revision_key, r.asset_id, r.revision_id, r.asset_type, r.content_hash,
+    r.source_digest, r.source_path, r.legacy_skill_id, r.identity_strategy,
+    r.name, r.summary, r.parser_json
+"""
+
+
+class _RegistryPayload:
+    """Load one payload from the registry by content hash and verify it."""
+
+    __slots__ = ("repository", "content_hash")
+
+    def __init__(self, repository: SQLiteAssetRepository, content_hash: str):
+        self.repository = repository
+        self.content_hash = content_hash
+
+    def __call__(self) -> dict[str, Any]:
+        return self.repository._load_payload(self.content_hash)
+
+
+class SQLiteAssetRepository:
+    """Read-only Asset snapshot pinned to the registry head at construction.
+
+    Revisions, snapshot manifests and legacy identity aliases live in an
+    indexed SQLite registry written by :func:`import_corpus`, so lookups are
+    primary-key seeks and several API processes share one imported snapshot
+    instead of each parsing the corpus. Every imported revision is retained;
+    :meth:`list_asset_history` returns them across snapshots.
+
+    A later import moves the head and makes this view stale; ``rebuild``
+    returns a view of the new head. Payloads are read on use, verified
+    against ``content_hash``, and optionally held in a bounded LRU.
+    """
+
+    def __init__(self, database: Path, *, payload_cache_size: int | None = None):
+        if payload_cache_size is not None and payload_cache_size < 1:
+            raise ValueError("payload_cache_size must be at least 1")
+        self.database = database.resolve()
+        self.payload_cache_size = payload_cache_size
+        self._payload_cache = (
+            None if payload_cache_size is None else _PayloadCache(payload_cache_size)
+        )
+        self._stale = False
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT snapshot_id FROM asset_registry_head WHERE singleton = 1"
+            ).fetchone()
+        if row is None:
+            raise AssetRepositoryError("asset_registry_empty")
+        self.snapshot_id = str(row["snapshot_id"])
+
+    def rebuild(self) -> SQLiteAssetRepository:
+        """Return a view pinned to the current registry head."""
+
+        return type(self)(self.database, payload_cache_size=self.payload_cache_size)
+
+    @property
+    def ambiguous_asset_ids(self) -> tuple[str, ...]:
+        with self._connect() as connection:
+            rows = connection.execute(
+                """
+                SELECT DISTINCT asset_id FROM asset_snapshot_revisions
+                WHERE snapshot_id = ? AND ambiguous = 1 ORDER BY asset_id
+                """,
+                (self.snapshot_id,),
+            ).fetchall()
+        return tuple(row["asset_id"] for row in rows)
+
+    @property
+    def ambiguous_legacy_aliases(self) -> tuple[str, ...]:
+        with self._connect() as connection:
+            rows = connection.execute(
+                """
+                SELECT DISTINCT legacy_skill_id FROM asset_identity_aliases
+                WHERE snapshot_id = ? ORDER BY legacy_skill_id
+                """,
+                (self.snapshot_id,),
+            ).fetchall()
+        return tuple(row["legacy_skill_id"] for row in rows)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        try:
+            connection = connect_sqlite(
+                self.database, policy=REGISTRY_POLICY, mode="read_only"
+            )
+        except sqlite3.Error as exc:
+            raise AssetRepositoryError("asset_registry_unavailable") from exc
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    def _check_head(self, connection: sqlite3.Connection) -> None:
+        if not self._stale:
+            row = connection.execute(
+                "SELECT snapshot_id FROM asset_registry_head WHERE singleton = 1"
+            ).fetchone()
+            self._stale = row is None or row["snapshot_id"] != self.snapshot_id
+        if self._stale:
+            raise StaleSourceSnapshotError(StaleSourceSnapshotError.code)
+
+    @contextmanager
+    def _reading(self) -> Iterator[sqlite3.Connection]:
+        with self._connect() as connection:
+            self._check_head(connection)
+            yield connection
+
+    def is_current(self) -> bool:
+        try:
+            self.assert_fresh()
+        except StaleSourceSnapshotError:
+            return False
+        return True
+
+    def assert_fresh(self) -> None:
+        """Fail closed once a later import has moved the registry head."""
+
+        with self._reading():
+            pass
+
+    def _revision(self, row: sqlite3.Row) -> AssetRevision:
+        parser_id, parser_version = json.loads(row["parser_json"])
+        return AssetRevision(
+            asset_id=row["asset_id"],
+            revision_id=row["revision_id"],
+            asset_type=row["asset_type"],
+            content_hash=row["content_hash"],
+            source_digest=row["source_digest"],
+            source_path=Path(row["source_path"]),
+            payload=None,
+            legacy_skill_id=row["legacy_skill_id"],
+            identity_strategy=row["identity_strategy"],
+            name=row["name"],
+            summary=row["summary"],
+            parser_id=parser_id,
+            parser_version=parser_version,
+            payload_loader=_RegistryPayload(self, row["content_hash"]),
+        )
+
+    def _load_payload(self, content_hash: str) -> dict[str, Any]:
+        key = (str(self.database), content_hash)
+        if self._payload_cache is not None and (
+            cached := self._payload_cache.get(key)
+        ) is not None:
+            return cached
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT payload_json FROM asset_payloads WHERE content_hash = ?",
+                (content_hash,),
+            ).fetchone()
+        if row is None:
+            raise StaleSourceSnapshotError(StaleSourceSnapshotError.code)
+        payload = json.loads(row["payload_json"])
+        if canonical_digest(payload) != content_hash:
+            raise StaleSourceSnapshotError(StaleSourceSnapshotError.code)
+        if self._payload_cache is not None:
+            self._payload_cache.put(key, payload)
+        return payload
+
+    def _snapshot_rows(
+        self, connection: sqlite3.Connection, asset_id: str
+    ) -> list[sqlite3.Row]:
+        return connection.execute(
+            f"""
+            SELECT {_REVISION_COLUMNS}, s.ambiguous
+            FROM asset_snapshot_revisions AS s
+            JOIN asset_revisions AS r ON r.revision_key = s.revision_key
+            WHERE s.snapshot_id = ? AND s.asset_id = ?
+            ORDER BY s.source_path
+            """,
+            (self.snapshot_id, asset_id),
+        ).fetchall()
+
+    def _alias_targets(
+        self, connection: sqlite3.Connection, asset_id: str
+    ) -> list[str]:
+        return [
+            row["asset_id"]
+            for row in connection.execute(
+                """
+                SELECT asset_id FROM asset_identity_aliases
+                WHERE snapshot_id = ? AND legacy_skill_id = ?
+                ORDER BY asset_id
+                """,
+                (self.snapshot_id, asset_id),
+            )
+        ]
+
+    def get_revision(
+        self, asset_id: str, revision_id: str | None = None
+    ) -> AssetRevision:
+        with self._reading() as connection:
+            if self._alias_targets(connection, asset_id):
+                raise AssetIdentityAmbiguousError(AssetIdentityAmbiguousError.code)
+            rows = self._snapshot_rows(connection, asset_id)
+        if not rows:
+            raise AssetNotFoundError(AssetNotFoundError.code)
+        if rows[0]["ambiguous"]:
+            raise AssetIdentityAmbiguousError(AssetIdentityAmbiguousError.code)
+        revision = self._revision(rows[0])
+        if revision_id is not None and revision.revision_id != revision_id:
+            raise AssetNotFoundError(AssetNotFoundError.code)
+        return revision
+
+    def _manifest_rows(
+        self, connection: sqlite3.Connection, snapshot_id: str
+    ) -> list[sqlite3.Row]:
+        return connection.execute(
+            f"""
+            SELECT {_REVISION_COLUMNS}
+            FROM asset_snapshot_revisions AS s
+            JOIN asset_revisions AS r ON r.revision_key = s.revision_key
+            WHERE s.snapshot_id = ?
+            ORDER BY s.source_path
+            """,
+            (snapshot_id,),
+        ).fetchall()
+
+    def list_revisions(self) -> tuple[AssetRevision, ...]:
+        with self._reading() as connection:
+            rows = self._manifest_rows(connection, self.snapshot_id)
+        return tuple(self._revision(row) for row in rows)
+
+    def diff(self, from_snapshot_id: str) -> SnapshotDiff:
+        """Revisions added, changed or removed since any imported snapshot."""
+
+        with self._reading() as connection:
+            if connection.execute(
+                "SELECT 1 FROM asset_snapshots WHERE snapshot_id = ?",
+                (from_snapshot_id,),
+            ).fetchone() is None:
+                raise SnapshotNotRetainedError(SnapshotNotRetainedError.code)
+            base_rows = self._manifest_rows(connection, from_snapshot_id)
+            rows = self._manifest_rows(connection, self.snapshot_id)
+        base = {
+            (row["asset_id"], row["source_path"]): AssetRevisionRef.of(self._revision(row))
+            for row in base_rows
+        }
+        return diff_revisions(
+            from_snapshot_id,
+            self.snapshot_id,
+            base,
+            (self._revision(row) for row in rows),
+        )
+
+    def list_asset_summaries(self) -> tuple[AssetListing, ...]:
+        """Summaries ordered by ``asset_id``; ambiguous IDs count every revision."""
+
+        with self._reading() as connection:
+            rows = connection.execute(
+                """
+                SELECT s.asset_id, r.asset_type, r.name, r.summary, s.ambiguous
+                FROM asset_snapshot_revisions AS s
+                JOIN asset_revisions AS r ON r.revision_key = s.revision_key
+                WHERE s.snapshot_id = ?
+                ORDER BY s.asset_id, s.source_path
+                """,
+                (self.snapshot_id,),
+            ).fetchall()
+        grouped: dict[str, list[sqlite3.Row]] = {}
+        for row in rows:
+            grouped.setdefault(row["asset_id"], []).append(row)
+        return tuple(
+            AssetListing(
+                asset_id=asset_id,
+                asset_type=items[0]["asset_type"],
+                name=items[0]["name"] or asset_id,
+                summary=items[0]["summary"],
+                revision_count=len(items),
+                ambiguous=len(items) > 1,
+            )
+            for asset_id, items in grouped.items()
+        )
+
+    def list_asset_revisions(self, asset_id: str) -> tuple[AssetRevision, ...]:
+        with self._reading() as connection:
+            targets = self._alias_targets(connection, asset_id)
+            if targets:
+                rows = [self._snapshot_rows(connection, target)[0] for target in targets]
+            else:
+                rows = self._snapshot_rows(connection, asset_id)
+        if not rows:
+            raise AssetNotFoundError(AssetNotFoundError.code)
+        return tuple(self._revision(row) for row in rows)
+
+    def list_asset_history(self, asset_id: str) -> tuple[AssetRevision, ...]:
+        """Every revision ever imported for ``asset_id``, oldest first."""
+
+        with self._reading() as connection:
+            rows = connection.execute(
+                f"""
+                SELECT {_REVISION_COLUMNS}
+                FROM asset_revisions AS r
+                WHERE r.asset_id = ?
+                ORDER BY r.revision_key
+                """,
+                (asset_id,),
+            ).fetchall()
+        if not rows:
+            raise AssetNotFoundError(AssetNotFoundError.code)
+        return tuple(self._revision(row) for row in rows)
+
+
+def _canonical_json(payload: dict[str, Any]) -> str:
+    return json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+def import_corpus(
+    database: Path,
+    corpus_dir: Path,
+    *,
+    migration_dir: Path,
+    source: LegacySkillAssetRepository | None = None,
+    workers: int = 1,
+) -> dict[str, Any]:
+    """Validate ``corpus_dir`` and publish it as the registry head.
+
+    The whole snapshot is written in one ``BEGIN IMMEDIATE`` transaction:
+    unchanged revisions and payloads are shared with earlier snapshots, and
+    re-importing an identical corpus only moves the head.
+    """
+
+    if source is None:
+        source = LegacySkillAssetRepository(
+            corpus_dir, manifest_path=None, workers=workers
+        )
+    revisions = source.list_revisions()
+    ambiguous = set(source.ambiguous_asset_ids)
+    aliases = {
+        legacy_id: tuple(item.asset_id for item in source.list_asset_revisions(legacy_id))
+        for legacy_id in source.ambiguous_legacy_aliases
+    }
+    now = datetime.now(timezone.utc).isoformat()
+    new_revisions = 0
+    new_payloads = 0
+    connection = connect_sqlite(database, policy=REGISTRY_POLICY, mode="read_write")
+    try:
+        apply_migrations(connection, load_migrations(migration_dir))
+        connection.execute("BEGIN IMMEDIATE")
+        known = connection.execute(
+            "SELECT 1 FROM asset_snapshots WHERE snapshot_id = ?",
+            (source.snapshot_id,),
+        ).fetchone()
+        if known is None:
+            connection.execute(
+                """
+                INSERT INTO asset_snapshots(snapshot_id, corpus_dir, revision_count, imported_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                (source.snapshot_id, str(source.corpus_dir), len(revisions), now),
+            )
+            for revision in revisions:
+                if connection.execute(
+                    "SELECT 1 FROM asset_payloads WHERE content_hash = ?",
+                    (revision.content_hash,),
+                ).fetchone() is None:
+                    connection.execute(
+                        "INSERT INTO asset_payloads(content_hash, payload_json) VALUES (?, ?)",
+                        (revision.content_hash, _canonical_json(revision.payload)),
+                    )
+                    new_payloads += 1
+                identity = (
+                    revision.asset_id,
+                    revision.revision_id,
+                    revision.source_path.as_posix(),
+                    revision.source_digest,
+                    revision.identity_strategy,
+                )
+                cursor = connection.execute(
+                    """
+                    INSERT OR IGNORE INTO asset_revisions(
+                        asset_id, revision_id, source_path, source_digest,
+                        identity_strategy, asset_type, content_hash,
+                        legacy_skill_id, name, summary, parser_json,
+                        first_snapshot_id, first_seen_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        *identity,
+                        revision.asset_type,
+                        revision.content_hash,
+                        revision.legacy_skill_id,
+                        revision.name,
+                        revision.summary,
+                        json.dumps([revision.parser_id, revision.parser_version]),
+                        source.snapshot_id,
+                        now,
+                    ),
+                )
+                new_revisions += cursor.rowcount
+                revision_key = connection.execute(
+                    """
+                    SELECT revision_key FROM asset_revisions
+                    WHERE asset_id = ? AND revision_id = ? AND source_path = ?
+                      AND source_digest = ? AND identity_strategy = ?
+                    """,
+                    identity,
+                ).fetchone()[0]
+                connection.execute(
+                    """
+                    INSERT INTO asset_snapshot_revisions(
+                        snapshot_id, asset_id, source_path, revision_key, ambiguous
+                    ) VALUES (?, ?, ?, ?, ?)
+                    """,
+                    (
+                        source.snapshot_id,
+                        revision.asset_id,
+                        revision.source_path.as_posix(),
+                        revision_key,
+                        int(revision.asset_id in ambiguous),
+                    ),
+                )
+            connection.executemany(
+                """
+                INSERT INTO asset_identity_aliases(snapshot_id, legacy_skill_id, asset_id)
+                VALUES (?, ?, ?)
+                """,
+                [
+                    (source.snapshot_id, legacy_id, target)
+                    for legacy_id, targets in aliases.items()
+                    for target in targets
+                ],
+            )
+        connection.execute(
+            """
+            INSERT INTO asset_registry_head(singleton, snapshot_id, updated_at)
+            VALUES (1, ?, ?)
+            ON CONFLICT(singleton) DO UPDATE SET
+                snapshot_id = excluded.snapshot_id,
+                updated_at = excluded.updated_at
+            """,
+            (source.snapshot_id, now),
+        )
+        connection.commit()
+    except BaseException:
+        connection.rollback()
+        raise
+    finally:
+        connection.close()
+    return {
+        "snapshot_id": source.snapshot_id,
+        "revisions": len(revisions),
+        "new_revisions": new_revisions,
+        "new_payloads": new_payloads,
+        "reused_snapshot": known is not None,
+    }
@@ -32,6 +32,34 @@ CREATE INDEX IF NOT EXISTS idx_runtime_events_type
 CREATE INDEX IF NOT EXISTS idx_runtime_events_idempotency
     ON runtime_events(idempotency_key)
     WHERE idempotency_key IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_runtime_events_skill
+    ON runtime_events(skill_name, skill_version, occurred_at, run_id, sequence);
+
+CREATE TABLE IF NOT EXISTS runtime_run_state (
+    run_id TEXT PRIMARY KEY REFERENCES runtime_runs(run_id) ON DELETE RESTRICT,
+    last_sequence INTEGER NOT NULL,
+    last_event_type TEXT NOT NULL,
+    outcome_event_type TEXT,
+    final_event_type TEXT,
+    terminal_event_types TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS runtime_skill_evidence (
+    skill_name TEXT NOT NULL,
+    skill_version TEXT NOT NULL,
+    source_event_watermark INTEGER NOT NULL,
+    generated_at TEXT,
+    counts_json TEXT NOT NULL,
+    failure_patterns_json TEXT NOT NULL,
+    element_refs_json TEXT NOT NULL,
+    PRIMARY KEY (skill_name, skill_version)
+);
+
+CREATE TABLE IF NOT EXISTS runtime_run_evidence (
+    run_id TEXT PRIMARY KEY REFERENCES runtime_runs(run_id) ON DELETE RESTRICT,
+    outcome_event_types TEXT NOT NULL,
+    outcome TEXT
+);
 
 CREATE TABLE IF NOT EXISTS runtime_idempotency_claims (
     idempotency_key TEXT PRIMARY KEY,
@@ -189,3 +217,6 @@ BEFORE DELETE ON runtime_resume_claims
 BEGIN
     SELECT RAISE(ABORT, 'runtime_resume_claims is immutable');
 END;
+
+-- Keep in step with runtime.ledger.LEDGER_SCHEMA_VERSION.
+PRAGMA user_version = 3;
@@ -0,0 +1,11 @@
+CREATE TABLE embedding_projection (
+    representation TEXT PRIMARY KEY,
+    method TEXT NOT NULL,
+    source_dimension INTEGER NOT NULL,
+    dimension INTEGER NOT NULL,
+    mean BLOB NOT NULL,
+    components BLOB NOT NULL,
+    retained_variance REAL NOT NULL,
+    projection_digest TEXT NOT NULL,
+    fitted_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
@@ -0,0 +1,59 @@
+CREATE TABLE index_representations (
+    name TEXT PRIMARY KEY,
+    vector_table TEXT NOT NULL UNIQUE,
+    dimension INTEGER NOT NULL,
+    representation_version TEXT NOT NULL,
+    embedding_model_name TEXT,
+    embedding_model_id TEXT NOT NULL,
+    embedding_model_version TEXT NOT NULL,
+    status TEXT NOT NULL CHECK (status IN ('building', 'ready', 'retired')),
+    is_default INTEGER NOT NULL DEFAULT 0 CHECK (is_default IN (0, 1)),
+    created_at TEXT NOT NULL,
+    ready_at TEXT
+);
+
+CREATE UNIQUE INDEX idx_index_representations_default
+ON index_representations(is_default) WHERE is_default = 1;
+
+CREATE TABLE asset_index_state_next (
+    representation TEXT NOT NULL DEFAULT 'primary',
+    asset_id TEXT NOT NULL,
+    revision_id TEXT NOT NULL,
+    representation_version TEXT NOT NULL,
+    embedding_model_id TEXT NOT NULL,
+    embedding_model_version TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    skill_row_id INTEGER NOT NULL,
+    vector_row_id INTEGER NOT NULL,
+    source_path TEXT NOT NULL,
+    indexed_at TEXT NOT NULL,
+    PRIMARY KEY (
+        representation,
+        asset_id,
+        revision_id,
+        representation_version,
+        embedding_model_id,
+        embedding_model_version
+    ),
+    UNIQUE (representation, skill_row_id),
+    UNIQUE (representation, vector_row_id),
+    FOREIGN KEY (skill_row_id) REFERENCES skills(id) ON DELETE CASCADE
+);
+
+INSERT INTO asset_index_state_next (
+    representation, asset_id, revision_id, representation_version,
+    embedding_model_id, embedding_model_version, content_hash,
+    skill_row_id, vector_row_id, source_path, indexed_at
+)
+SELECT
+    'primary', asset_id, revision_id, representation_version,
+    embedding_model_id, embedding_model_version, content_hash,
+    skill_row_id, vector_row_id, source_path, indexed_at
+FROM asset_index_state;
+
+DROP TABLE asset_index_state;
+
+ALTER TABLE asset_index_state_next RENAME TO asset_index_state;
+
+CREATE INDEX idx_asset_index_state_source_path
+ON asset_index_state(representation, source_path);
@@ -0,0 +1,60 @@
+CREATE TABLE asset_payloads (
+    content_hash TEXT PRIMARY KEY,
+    payload_json TEXT NOT NULL
+);
+
+CREATE TABLE asset_revisions (
+    revision_key INTEGER PRIMARY KEY,
+    asset_id TEXT NOT NULL,
+    revision_id TEXT NOT NULL,
+    asset_type TEXT NOT NULL,
+    content_hash TEXT NOT NULL REFERENCES asset_payloads(content_hash),
+    source_digest TEXT NOT NULL,
+    source_path TEXT NOT NULL,
+    legacy_skill_id TEXT NOT NULL,
+    identity_strategy TEXT NOT NULL,
+    name TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    parser_json TEXT NOT NULL,
+    first_snapshot_id TEXT NOT NULL,
+    first_seen_at TEXT NOT NULL,
+    UNIQUE (asset_id, revision_id, source_path, source_digest, identity_strategy)
+);
+
+CREATE INDEX idx_asset_revisions_legacy_skill_id
+ON asset_revisions(legacy_skill_id);
+
+CREATE TABLE asset_snapshots (
+    snapshot_id TEXT PRIMARY KEY,
+    corpus_dir TEXT NOT NULL,
+    revision_count INTEGER NOT NULL,
+    imported_at TEXT NOT NULL
+);
+
+CREATE TABLE asset_snapshot_revisions (
+    snapshot_id TEXT NOT NULL REFERENCES asset_snapshots(snapshot_id) ON DELETE CASCADE,
+    asset_id TEXT NOT NULL,
+    source_path TEXT NOT NULL,
+    revision_key INTEGER NOT NULL REFERENCES asset_revisions(revision_key),
+    ambiguous INTEGER NOT NULL CHECK (ambiguous IN (0, 1)),
+    PRIMARY KEY (snapshot_id, asset_id, source_path)
+) WITHOUT ROWID;
+
+CREATE INDEX idx_asset_snapshot_revisions_source_path
+ON asset_snapshot_revisions(snapshot_id, source_path);
+
+CREATE INDEX idx_asset_snapshot_revisions_revision_key
+ON asset_snapshot_revisions(revision_key);
+
+CREATE TABLE asset_identity_aliases (
+    snapshot_id TEXT NOT NULL REFERENCES asset_snapshots(snapshot_id) ON DELETE CASCADE,
+    legacy_skill_id TEXT NOT NULL,
+    asset_id TEXT NOT NULL,
+    PRIMARY KEY (snapshot_id, legacy_skill_id, asset_id)
+) WITHOUT ROWID;
+
+CREATE TABLE asset_registry_head (
+    singleton INTEGER PRIMARY KEY CHECK (singleton = 1),
+    snapshot_id TEXT NOT NULL REFERENCES asset_snapshots(snapshot_id),
+    updated_at TEXT NOT NULL
+);
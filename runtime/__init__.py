@@ -7,6 +7,8 @@ parser, registry, semantic search, governance dashboard, or framework runtime.
 from .evidence import build_evidence_summary, build_run_evidence
 from .executor import RuntimeExecutor
 from .ledger import RuntimeLedger
+from .ledger_pool import LedgerPool
+from .ledger_writer import LedgerWriter, LedgerWriterBusy, QueuedLedger
 from .models import ActionResult, RunResult, RunStatus, RuntimeEvent, RuntimeEventType
 from .orchestrator import RuntimeOrchestrator
 from .recovery import RecoveryCoordinator
@@ -19,6 +21,10 @@ from .rules import ContextRuleEvaluator, RuleEvaluationError, UnavailableRuleEva
 
 __all__ = [
     "ActionResult",
+    "LedgerPool",
+    "LedgerWriter",
+    "LedgerWriterBusy",
+    "QueuedLedger",
     "RecoveryCoordinator",
     "RuntimeGovernanceError",
     "RuntimeGovernanceGate",
@@ -3,26 +3,71 @@ from __future__ import annotations
 import hashlib
 import hmac
 import json
+from typing import Any, Iterator
+
+# Containers up to this depth are streamed piecewise; deeper subtrees are
+# encoded in one C-accelerated call, so the largest intermediate string is
+# bounded by the largest subtree rather than the whole document.
+STREAM_DEPTH = 3
+_FLUSH_CHARS = 64 * 1024
+_ENCODER = json.JSONEncoder(
+    ensure_ascii=False,
+    sort_keys=True,
+    separators=(",", ":"),
+)
+
+
+def iter_canonical_json(value: object, _depth: int = 0) -> Iterator[str]:
+    """Yield the sorted-key compact JSON encoding of ``value`` in pieces.
+
+    The concatenation is byte-identical to ``json.dumps`` with the same
+    options.
+    """
+
+    if _depth < STREAM_DEPTH:
+        if (
+            isinstance(value, dict)
+            and value
+            and all(isinstance(key, str) for key in value)
+        ):
+            yield "{"
+            for index, key in enumerate(sorted(value)):
+                yield ("," if index else "") + _ENCODER.encode(key) + ":"
+                yield from iter_canonical_json(value[key], _depth + 1)
+            yield "}"
+            return
+        if isinstance(value, (list, tuple)) and value:
+            yield "["
+            for index, item in enumerate(value):
+                if index:
+                    yield ","
+                yield from iter_canonical_json(item, _depth + 1)
+            yield "]"
+            return
+    yield _ENCODER.encode(value)
+
+
+def _feed(sink: Any, value: object) -> None:
+    pending: list[str] = []
+    size = 0
+    for chunk in iter_canonical_json(value):
+        pending.append(chunk)
+        size += len(chunk)
+        if size >= _FLUSH_CHARS:
+            sink.update("".join(pending).encode("utf-8"))
+            pending.clear()
+            size = 0
+    if pending:
+        sink.update("".join(pending).encode("utf-8"))
 
 
 def canonical_digest(value: object) -> str:
-    encoded = json.dumps(
-        value,
-        ensure_ascii=False,
-        sort_keys=True,
-        separators=(",", ":"),
-    ).encode("utf-8")
-    return f"sha256:{hashlib.sha256(encoded).hexdigest()}"
+    digest = hashlib.sha256()
+    _feed(digest, value)
+    return f"sha256:{digest.hexdigest()}"
 
 
 def keyed_digest(value: object, *, key: str) -> str:
-    encoded = json.dumps(
-        value,
-        ensure_ascii=False,
-        sort_keys=True,
-        separators=(",", ":"),
-    ).encode("utf-8")
-    return (
-        "hmac-sha256:"
-        + hmac.new(key.encode("utf-8"), encoded, hashlib.sha256).hexdigest()
-    )
+    digest = hmac.new(key.encode("utf-8"), digestmod=hashlib.sha256)
+    _feed(digest, value)
+    return "hmac-sha256:" + digest.hexdigest()
@@ -0,0 +1,175 @@
+"""Foldable per-skill Evidence aggregate shared by the ledger and `runtime.evidence`."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import re
+from typing import Iterable
+
+from .models import RuntimeEvent, RuntimeEventType
+
+
+EVIDENCE_OUTCOMES = (
+    "succeeded",
+    "failed",
+    "compensated",
+    "recovery_failed",
+    "awaiting_approval",
+    "hitl_required",
+    "reconciliation_required",
+    "recovery_pending",
+    "denied",
+    "cancelled",
+)
+# The only event types `run_outcome` looks at; other events never move a run
+# between outcome counts.
+OUTCOME_EVENT_TYPES = frozenset(
+    {
+        RuntimeEventType.RUN_COMPENSATED,
+        RuntimeEventType.RUN_RECOVERY_FAILED,
+        RuntimeEventType.RECONCILIATION_REQUIRED,
+        RuntimeEventType.RUN_SUSPENDED,
+        RuntimeEventType.RUN_CANCELLED,
+        RuntimeEventType.COMPENSATION_QUEUED,
+        RuntimeEventType.RUN_SUCCEEDED,
+        RuntimeEventType.RUN_FAILED,
+        RuntimeEventType.POLICY_DENIED,
+        RuntimeEventType.APPROVAL_REQUIRED,
+        RuntimeEventType.APPROVAL_GRANTED,
+    }
+)
+_FAILURE_EVENT_TYPES = frozenset(
+    {
+        RuntimeEventType.RUN_FAILED,
+        RuntimeEventType.RUN_RECOVERY_FAILED,
+        RuntimeEventType.RUN_SUSPENDED,
+        RuntimeEventType.RECONCILIATION_REQUIRED,
+    }
+)
+_SAFE_REASON_CODE = re.compile(r"^[A-Z][A-Z0-9_]{1,63}$")
+
+
+def failure_pattern(event: RuntimeEvent) -> str | None:
+    if not event.payload.get("reason") or event.event_type not in _FAILURE_EVENT_TYPES:
+        return None
+    reason_code = event.payload.get("reason_code")
+    if isinstance(reason_code, str) and _SAFE_REASON_CODE.fullmatch(reason_code):
+        return f"{event.event_type.value}:{reason_code}"
+    return event.event_type.value
+
+
+def run_outcome(types: Iterable[RuntimeEventType]) -> str | None:
+    """The Evidence count a run falls under, given the event types it has."""
+
+    types = set(types)
+    if RuntimeEventType.RUN_COMPENSATED in types:
+        return "compensated"
+    if RuntimeEventType.RUN_RECOVERY_FAILED in types:
+        return "recovery_failed"
+    if RuntimeEventType.RECONCILIATION_REQUIRED in types:
+        return "reconciliation_required"
+    if RuntimeEventType.RUN_SUSPENDED in types:
+        return "hitl_required"
+    if RuntimeEventType.RUN_CANCELLED in types:
+        return "cancelled"
+    if (
+        RuntimeEventType.COMPENSATION_QUEUED in types
+        and RuntimeEventType.RUN_SUCCEEDED not in types
+    ):
+        return "recovery_pending"
+    if RuntimeEventType.RUN_SUCCEEDED in types:
+        return "succeeded"
+    if RuntimeEventType.RUN_FAILED in types:
+        return "failed"
+    if RuntimeEventType.POLICY_DENIED in types:
+        return "denied"
+    if (
+        RuntimeEventType.APPROVAL_REQUIRED in types
+        and RuntimeEventType.APPROVAL_GRANTED not in types
+    ):
+        return "awaiting_approval"
+    return None
+
+
+@dataclass
+class SkillEvidence:
+    """Order-independent aggregate of one skill version's events."""
+
+    event_count: int = 0
+    generated_at: str | None = None
+    counts: dict[str, int] = field(
+        default_factory=lambda: dict.fromkeys(EVIDENCE_OUTCOMES, 0)
+    )
+    failure_patterns: set[str] = field(default_factory=set)
+    element_refs: set[str] = field(default_factory=set)
+
+    def add_event(self, event: RuntimeEvent) -> None:
+        """Fold everything but the run outcome, which needs the run's history."""
+
+        self.event_count += 1
+        if self.generated_at is None or event.occurred_at > self.generated_at:
+            self.generated_at = event.occurred_at
+        if event.action_id:
+            self.element_refs.add(event.action_id)
+        pattern = failure_pattern(event)
+        if pattern is not None:
+            self.failure_patterns.add(pattern)
+
+    def move_run(self, before: str | None, after: str | None) -> None:
+        if before == after:
+            return
+        if before is not None:
+            self.counts[before] -= 1
+        if after is not None:
+            self.counts[after] += 1
+
+    def summary(
+        self,
+        *,
+        skill_name: str,
+        skill_version: str,
+        minimum_confident_sample: int = 10,
+    ) -> dict[str, object]:
+        counts = dict(self.counts)
+        sample_size = sum(
+            counts[name]
+            for name in ("succeeded", "failed", "compensated", "recovery_failed")
+        )
+        return {
+            "projection_version": "1.0.0",
+            "skill_ref": {"name": skill_name, "version": skill_version},
+            "generated_at": self.generated_at or "1970-01-01T00:00:00+00:00",
+            "source_event_watermark": self.event_count,
+            "counts": counts,
+            "sample_size": sample_size,
+            "success_rate": counts["succeeded"] / sample_size if sample_size else None,
+            "confidence": min(1.0, sample_size / max(1, minimum_confident_sample)),
+            "known_failure_patterns": sorted(self.failure_patterns),
+            "element_refs": sorted(self.element_refs),
+            "provenance": [
+                {
+                    "kind": "runtime_event_ledger",
+                    "ref": f"append-only SQLite ledger#events={self.event_count}",
+                    "version": "4.0.0",
+                }
+            ],
+        }
+
+
+def fold_skill_evidence(
+    events: Iterable[RuntimeEvent],
+) -> tuple[SkillEvidence, dict[str, frozenset[RuntimeEventType]]]:
+    """Aggregate events in one pass; also return each run's outcome event types."""
+
+    evidence = SkillEvidence()
+    run_types: dict[str, set[RuntimeEventType]] = {}
+    for event in events:
+        evidence.add_event(event)
+        types = run_types.setdefault(event.run_id, set())
+        if event.event_type in OUTCOME_EVENT_TYPES:
+            types.add(event.event_type)
+    for types in run_types.values():
+        evidence.move_run(None, run_outcome(types))
+    return evidence, {
+        run_id: frozenset(types) for run_id, types in run_types.items() if types
+    }
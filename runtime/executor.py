@@ -38,6 +38,11 @@ class RuntimeExecutor:
     The P0 implementation is deliberately small: policy, idempotency claim,
     adapter boundary, minimal event recording, and declared recovery material.
     It is not a production sandbox or distributed transaction coordinator.
+
+    Events are queued and committed in one ledger transaction per side-effect
+    boundary: everything up to and including `ACTION_STARTED` is durable
+    before the adapter is called, and everything recorded after it returns is
+    committed before the next adapter call or when `run` returns.
     """
 
     def __init__(
@@ -52,6 +57,8 @@ class RuntimeExecutor:
         self.adapter = adapter
         self.policy = policy or DefaultPolicyEngine()
         self.production_approval_gate = production_approval_gate
+        self._pending: list[RuntimeEvent] = []
+        self._claims: dict[str, str] = {}
 
     def run(
         self,
@@ -66,6 +73,36 @@ class RuntimeExecutor:
         existing_run_id: str | None = None,
         execution_basis_digest: str | None = None,
         resume_item_id: str | None = None,
+    ) -> RunResult:
+        try:
+            return self._run(
+                contract,
+                parameters=parameters,
+                context=context,
+                dry_run=dry_run,
+                preflight=preflight,
+                rule_evaluator=rule_evaluator,
+                rule_bindings=rule_bindings,
+                existing_run_id=existing_run_id,
+                execution_basis_digest=execution_basis_digest,
+                resume_item_id=resume_item_id,
+            )
+        finally:
+            self._flush()
+
+    def _run(
+        self,
+        contract: dict[str, Any],
+        *,
+        parameters: dict[str, Any],
+        context: dict[str, Any] | None,
+        dry_run: bool,
+        preflight: dict[str, Any] | None,
+        rule_evaluator: RuleEvaluator | None,
+        rule_bindings: dict[str, str] | None,
+        existing_run_id: str | None,
+        execution_basis_digest: str | None,
+        resume_item_id: str | None,
     ) -> RunResult:
         context = dict(context or {})
         skill = contract["skill_ref"]
@@ -228,12 +265,8 @@ class RuntimeExecutor:
         outputs: dict[str, Any] = {}
         validated_postconditions: list[str] = []
         rule_bindings = dict(rule_bindings or {})
-        completed_action_ids = {
-            event.action_id
-            for event in self.ledger.list_events(run_id)
-            if event.event_type == RuntimeEventType.ACTION_SUCCEEDED
-            and event.action_id is not None
-        }
+        self._flush()
+        completed_action_ids = self.ledger.run_event_view(run_id).completed_action_ids()
         for binding in primary_bindings:
             action_id = binding["action_id"]
             if action_id in completed_action_ids:
@@ -310,21 +343,10 @@ class RuntimeExecutor:
                     "operation": effect["operation"],
                 },
             )
+            self._pending.append(prepared)
             if primary_key:
-                if self.ledger.append_claimed_event(prepared, purpose="primary") is None:
-                    reason = "duplicate primary idempotency key"
-                    self._event(
-                        run_id,
-                        skill,
-                        RuntimeEventType.RUN_FAILED,
-                        action_id=action_id,
-                        payload={"reason": reason},
-                    )
-                    return RunResult(run_id, RunStatus.FAILED, reason=reason)
-            else:
-                self.ledger.append_event(prepared)
-
-            self._event(
+                self._claims[prepared.event_id] = "primary"
+            started = self._event(
                 run_id,
                 skill,
                 RuntimeEventType.ACTION_STARTED,
@@ -332,6 +354,23 @@ class RuntimeExecutor:
                 idempotency_key=primary_key,
                 payload={"dry_run": dry_run},
             )
+            rejected = self._flush(barrier=True)
+            if rejected is not None:
+                # Nothing in the batch was written; keep what preceded the claim.
+                self._pending = [
+                    event
+                    for event in rejected
+                    if event.event_id not in {prepared.event_id, started.event_id}
+                ]
+                reason = "duplicate primary idempotency key"
+                self._event(
+                    run_id,
+                    skill,
+                    RuntimeEventType.RUN_FAILED,
+                    action_id=action_id,
+                    payload={"reason": reason},
+                )
+                return RunResult(run_id, RunStatus.FAILED, reason=reason)
 
             try:
                 result = self.adapter.execute(
@@ -655,15 +694,27 @@ class RuntimeExecutor:
         idempotency_key: str | None = None,
         external_resource_id: str | None = None,
     ) -> RuntimeEvent:
-        return self.ledger.append_event(
-            RuntimeEvent(
-                run_id=run_id,
-                event_type=event_type,
-                skill_name=skill["name"],
-                skill_version=skill["version"],
-                action_id=action_id,
-                idempotency_key=idempotency_key,
-                external_resource_id=external_resource_id,
-                payload=payload,
-            )
+        event = RuntimeEvent(
+            run_id=run_id,
+            event_type=event_type,
+            skill_name=skill["name"],
+            skill_version=skill["version"],
+            action_id=action_id,
+            idempotency_key=idempotency_key,
+            external_resource_id=external_resource_id,
+            payload=payload,
         )
+        self._pending.append(event)
+        return event
+
+    def _flush(self, *, barrier: bool = False) -> list[RuntimeEvent] | None:
+        """Commit the queued events in one transaction.
+
+        Returns `None` once written. If an idempotency claim in the batch is
+        owned elsewhere, nothing is written and the rejected batch is returned.
+        """
+        batch, claims = self._pending, self._claims
+        self._pending, self._claims = [], {}
+        if self.ledger.append_events(batch, claim_purposes=claims, barrier=barrier) is None:
+            return batch
+        return None
@@ -1,14 +1,31 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
+from dataclasses import dataclass
 import json
 import re
 import sqlite3
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator, Mapping, Sequence
 from uuid import uuid4
 
+from .evidence_projection import (
+    OUTCOME_EVENT_TYPES,
+    SkillEvidence,
+    fold_skill_evidence,
+    run_outcome,
+)
 from .models import RunStatus, RuntimeEvent, RuntimeEventType
+from .run_events import RunEventView
+
+
+# Recorded in PRAGMA user_version once `_migrate` has brought a database up to
+# date, so an up-to-date ledger opens without running any DDL.
+LEDGER_SCHEMA_VERSION = 3
+
+# Writes that `RuntimeLedger.apply_writes` can share one transaction between.
+BATCHABLE_WRITES = frozenset({"append_events", "ensure_idempotency_claim", "decide_hitl_item"})
 
 
 _STATUS_BY_EVENT: dict[RuntimeEventType, RunStatus] = {
@@ -81,20 +98,56 @@ def projected_status_for_event(event_type: RuntimeEventType) -> RunStatus | None
     return _STATUS_BY_EVENT.get(event_type)
 
 
-def validate_event_type_sequence(event_types: Iterable[RuntimeEventType]) -> None:
+@dataclass(frozen=True)
+class RunSequenceState:
+    """Position of one run in the event state machine after its latest event.
+
+    `advance` validates a single next event against this position, so an
+    append costs O(1) while a replay from `RUN_CREATED` still reaches the
+    same state as `validate_event_type_sequence`.
+    """
+
+    last_sequence: int = 0
+    last_event_type: RuntimeEventType | None = None
     outcome: RuntimeEventType | None = None
     final_terminal: RuntimeEventType | None = None
-    for event_type in event_types:
-        if final_terminal is not None:
-            raise ValueError(f"event appended after final terminal {final_terminal.value}")
-        if outcome is not None and event_type not in _ALLOWED_AFTER_OUTCOME:
-            raise ValueError(f"event {event_type.value} is invalid after outcome {outcome.value}")
+    terminal_events: frozenset[RuntimeEventType] = frozenset()
+
+    def advance(self, event_type: RuntimeEventType) -> "RunSequenceState":
+        if self.final_terminal is not None:
+            raise ValueError(f"event appended after final terminal {self.final_terminal.value}")
+        if self.outcome is not None and event_type not in _ALLOWED_AFTER_OUTCOME:
+            raise ValueError(f"event {event_type.value} is invalid after outcome {self.outcome.value}")
+        outcome = self.outcome
         if event_type in _OUTCOME_EVENTS:
             if outcome is not None:
                 raise ValueError("multiple runtime outcome events are not allowed")
             outcome = event_type
-        if event_type in _FINAL_TERMINAL_EVENTS:
-            final_terminal = event_type
+        terminal_events = self.terminal_events
+        if event_type in _UNIQUE_TERMINAL_EVENTS:
+            if event_type in terminal_events:
+                raise ValueError("duplicate runtime terminal event")
+            terminal_events = terminal_events | {event_type}
+        return RunSequenceState(
+            last_sequence=self.last_sequence + 1,
+            last_event_type=event_type,
+            outcome=outcome,
+            final_terminal=(
+                event_type if event_type in _FINAL_TERMINAL_EVENTS else self.final_terminal
+            ),
+            terminal_events=terminal_events,
+        )
+
+
+def validate_event_type_sequence(event_types: Iterable[RuntimeEventType]) -> RunSequenceState:
+    state = RunSequenceState()
+    for event_type in event_types:
+        state = state.advance(event_type)
+    return state
+
+
+class LedgerSchemaError(RuntimeError):
+    """Raised when a ledger's recorded schema version cannot be served as-is."""
 
 
 class RuntimeLedger:
@@ -103,6 +156,16 @@ class RuntimeLedger:
     `journal_mode=DELETE` plus `synchronous=FULL` is the conservative P0
     default. WAL remains opt-in until the deployment validates its SQLite
     version and backup/recovery procedure.
+
+    `synchronous=NORMAL` is accepted only with WAL. It keeps the database
+    consistent, but the latest commits may be lost on power or OS failure,
+    so every batch that guards an external side effect (`barrier=True`, and
+    any batch claiming an idempotency key) is still committed under FULL.
+
+    Writers compare `PRAGMA user_version` with `LEDGER_SCHEMA_VERSION` and
+    only run DDL when they differ. With `migrate=False` an empty database is
+    still initialized, but an existing older schema is refused so upgrades
+    stay on the explicit maintenance path.
     """
 
     def __init__(
@@ -110,12 +173,21 @@ class RuntimeLedger:
         path: str | Path,
         *,
         journal_mode: str = "DELETE",
+        synchronous: str = "FULL",
         read_only: bool = False,
         hitl_ttl_seconds: int = 86_400,
+        migrate: bool = True,
+        check_same_thread: bool = True,
     ) -> None:
         mode = journal_mode.upper()
         if mode not in {"DELETE", "WAL"}:
             raise ValueError("journal_mode must be DELETE or WAL")
+        sync = synchronous.upper()
+        if sync not in {"FULL", "NORMAL"}:
+            raise ValueError("synchronous must be FULL or NORMAL")
+        if sync == "NORMAL" and mode != "WAL":
+            raise ValueError("synchronous=NORMAL requires journal_mode=WAL")
+        self.synchronous = sync
         if not 300 <= hitl_ttl_seconds <= 604_800:
             raise ValueError("HITL TTL must be between 300 and 604800 seconds")
         self.path = Path(path)
@@ -130,6 +202,7 @@ class RuntimeLedger:
                 uri=True,
                 timeout=30.0,
                 isolation_level=None,
+                check_same_thread=check_same_thread,
             )
         else:
             self.path.parent.mkdir(parents=True, exist_ok=True)
@@ -137,20 +210,30 @@ class RuntimeLedger:
                 self.path,
                 timeout=30.0,
                 isolation_level=None,
+                check_same_thread=check_same_thread,
             )
         self.connection.row_factory = sqlite3.Row
-        self.connection.execute("PRAGMA foreign_keys=ON")
-        if read_only:
-            self.connection.execute("PRAGMA query_only=ON")
-        else:
-            self.connection.execute("PRAGMA synchronous=FULL")
-            self.connection.execute(f"PRAGMA journal_mode={mode}")
-            self._migrate()
+        try:
+            self.connection.execute("PRAGMA foreign_keys=ON")
+            if read_only:
+                self.connection.execute("PRAGMA query_only=ON")
+            else:
+                self.connection.execute(f"PRAGMA journal_mode={mode}")
+                self.connection.execute(f"PRAGMA synchronous={sync}")
+                if self.schema_version != LEDGER_SCHEMA_VERSION:
+                    self._upgrade(migrate=migrate)
+        except BaseException:
+            self.connection.close()
+            raise
 
     @property
     def sqlite_version(self) -> str:
         return sqlite3.sqlite_version
 
+    @property
+    def schema_version(self) -> int:
+        return int(self.connection.execute("PRAGMA user_version").fetchone()[0])
+
     def close(self) -> None:
         self.connection.close()
 
@@ -160,6 +243,35 @@ class RuntimeLedger:
     def __exit__(self, exc_type: object, exc: object, tb: object) -> None:
         self.close()
 
+    def checkpoint(self, mode: str = "TRUNCATE") -> dict[str, int]:
+        """Run a WAL checkpoint; `busy` is 1 when readers kept it from finishing."""
+        mode = mode.upper()
+        if mode not in {"PASSIVE", "FULL", "RESTART", "TRUNCATE"}:
+            raise ValueError("unsupported WAL checkpoint mode")
+        busy, log_frames, checkpointed = self.connection.execute(
+            f"PRAGMA wal_checkpoint({mode})"
+        ).fetchone()
+        return {"busy": busy, "log_frames": log_frames, "checkpointed": checkpointed}
+
+    def _upgrade(self, *, migrate: bool) -> None:
+        version = self.schema_version
+        if version > LEDGER_SCHEMA_VERSION:
+            raise LedgerSchemaError(
+                f"runtime ledger schema {version} is newer than supported "
+                f"{LEDGER_SCHEMA_VERSION}"
+            )
+        if not migrate and self.connection.execute(
+            "SELECT 1 FROM sqlite_master LIMIT 1"
+        ).fetchone() is not None:
+            raise LedgerSchemaError(
+                f"runtime ledger schema {version} requires migration to "
+                f"{LEDGER_SCHEMA_VERSION}"
+            )
+        # Every step is idempotent, so a concurrent opener racing this one
+        # converges on the same schema before either records the version.
+        self._migrate()
+        self.connection.execute(f"PRAGMA user_version={LEDGER_SCHEMA_VERSION}")
+
     def _migrate(self) -> None:
         hitl_table_exists = self.connection.execute(
             "SELECT 1 FROM sqlite_master "
@@ -216,6 +328,34 @@ class RuntimeLedger:
             CREATE INDEX IF NOT EXISTS idx_runtime_events_idempotency
                 ON runtime_events(idempotency_key)
                 WHERE idempotency_key IS NOT NULL;
+            CREATE INDEX IF NOT EXISTS idx_runtime_events_skill
+                ON runtime_events(skill_name, skill_version, occurred_at, run_id, sequence);
+
+            CREATE TABLE IF NOT EXISTS runtime_run_state (
+                run_id TEXT PRIMARY KEY REFERENCES runtime_runs(run_id) ON DELETE RESTRICT,
+                last_sequence INTEGER NOT NULL,
+                last_event_type TEXT NOT NULL,
+                outcome_event_type TEXT,
+                final_event_type TEXT,
+                terminal_event_types TEXT NOT NULL
+            );
+
+            CREATE TABLE IF NOT EXISTS runtime_skill_evidence (
+                skill_name TEXT NOT NULL,
+                skill_version TEXT NOT NULL,
+                source_event_watermark INTEGER NOT NULL,
+                generated_at TEXT,
+                counts_json TEXT NOT NULL,
+                failure_patterns_json TEXT NOT NULL,
+                element_refs_json TEXT NOT NULL,
+                PRIMARY KEY (skill_name, skill_version)
+            );
+
+            CREATE TABLE IF NOT EXISTS runtime_run_evidence (
+                run_id TEXT PRIMARY KEY REFERENCES runtime_runs(run_id) ON DELETE RESTRICT,
+                outcome_event_types TEXT NOT NULL,
+                outcome TEXT
+            );
 
             CREATE TABLE IF NOT EXISTS runtime_idempotency_claims (
                 idempotency_key TEXT PRIMARY KEY,
@@ -387,6 +527,20 @@ class RuntimeLedger:
                 "ALTER TABLE runtime_execution_bases "
                 "ADD COLUMN governance_revision_id TEXT"
             )
+        self._backfill_skill_evidence()
+
+    def _backfill_skill_evidence(self) -> None:
+        # Ledgers written before the projection existed get it once here;
+        # afterwards every event insert keeps it current.
+        missing = self.connection.execute(
+            """SELECT DISTINCT r.skill_name, r.skill_version
+               FROM runtime_runs AS r
+               LEFT JOIN runtime_skill_evidence AS e
+                 ON e.skill_name = r.skill_name AND e.skill_version = r.skill_version
+               WHERE e.skill_name IS NULL"""
+        ).fetchall()
+        for row in missing:
+            self.rebuild_skill_evidence(row["skill_name"], row["skill_version"])
 
     def create_run(
         self,
@@ -432,6 +586,9 @@ class RuntimeLedger:
                     ),
                 )
             self._insert_event(cur, event, sequence=1)
+            self._store_run_state(
+                cur, rid, RunSequenceState().advance(RuntimeEventType.RUN_CREATED)
+            )
             cur.execute("COMMIT")
         except Exception:
             if self.connection.in_transaction:
@@ -440,16 +597,139 @@ class RuntimeLedger:
         return rid
 
     def append_event(self, event: RuntimeEvent) -> RuntimeEvent:
-        cur = self.connection.cursor()
+        return self.append_events([event])[0]
+
+    def append_events(
+        self,
+        events: Sequence[RuntimeEvent],
+        *,
+        claim_purposes: Mapping[str, str] | None = None,
+        barrier: bool = False,
+    ) -> list[RuntimeEvent] | None:
+        """Append an ordered batch of events in one transaction.
+
+        `claim_purposes` maps the `event_id` of each event that must first
+        claim its idempotency key to the claim purpose. If any claim belongs
+        to a different run, action, or purpose, nothing is appended and
+        `None` is returned. A `barrier` batch, or one with claims, is synced
+        under `synchronous=FULL` whatever the ledger's profile.
+        """
+        claim_purposes = dict(claim_purposes or {})
+        self._check_claimed_events(events, claim_purposes)
+        if not events:
+            return []
+        with self._synchronous_full(barrier or bool(claim_purposes)):
+            cur = self.connection.cursor()
+            try:
+                cur.execute("BEGIN IMMEDIATE")
+                stored = self._append_batch_in_transaction(cur, events, claim_purposes)
+                cur.execute("COMMIT" if stored is not None else "ROLLBACK")
+                return stored
+            except Exception:
+                if self.connection.in_transaction:
+                    cur.execute("ROLLBACK")
+                raise
+
+    def apply_writes(
+        self,
+        writes: Sequence[tuple[str, Mapping[str, Any]]],
+        *,
+        barrier: bool = False,
+    ) -> list[Any]:
+        """Apply queued append, claim and HITL-decision writes in one transaction.
+
+        `writes` pairs a `BATCHABLE_WRITES` method name with its keyword
+        arguments. Each write runs under its own savepoint, so one that fails
+        is undone alone and its exception takes its place in the returned
+        list; an `append_events` write whose claim conflicts yields `None`.
+        Errors that abort the whole transaction are raised instead.
+        """
+        for operation, _ in writes:
+            if operation not in BATCHABLE_WRITES:
+                raise ValueError(f"unsupported batched ledger write: {operation}")
+        results: list[Any] = []
+        with self._synchronous_full(barrier):
+            cur = self.connection.cursor()
+            try:
+                cur.execute("BEGIN IMMEDIATE")
+                for operation, arguments in writes:
+                    cur.execute("SAVEPOINT ledger_write")
+                    try:
+                        result = self._write_in_transaction(cur, operation, arguments)
+                    except Exception as exc:
+                        if not self.connection.in_transaction:
+                            raise
+                        cur.execute("ROLLBACK TO ledger_write")
+                        result = exc
+                    else:
+                        if result is None:
+                            cur.execute("ROLLBACK TO ledger_write")
+                    cur.execute("RELEASE ledger_write")
+                    results.append(result)
+                cur.execute("COMMIT")
+            except Exception:
+                if self.connection.in_transaction:
+                    cur.execute("ROLLBACK")
+                raise
+        return results
+
+    def _write_in_transaction(
+        self, cur: sqlite3.Cursor, operation: str, arguments: Mapping[str, Any]
+    ) -> Any:
+        if operation == "append_events":
+            claim_purposes = dict(arguments.get("claim_purposes") or {})
+            self._check_claimed_events(arguments["events"], claim_purposes)
+            return self._append_batch_in_transaction(
+                cur, arguments["events"], claim_purposes
+            )
+        if operation == "ensure_idempotency_claim":
+            return self._claim_in_transaction(cur, **arguments)
+        return self._decide_hitl_item_in_transaction(cur, **arguments)
+
+    @contextmanager
+    def _synchronous_full(self, enabled: bool) -> Iterator[None]:
+        if not enabled or self.synchronous == "FULL":
+            yield
+            return
+        self.connection.execute("PRAGMA synchronous=FULL")
         try:
-            cur.execute("BEGIN IMMEDIATE")
-            stored = self._append_event_in_transaction(cur, event)
-            cur.execute("COMMIT")
-            return stored
-        except Exception:
-            if self.connection.in_transaction:
-                cur.execute("ROLLBACK")
-            raise
+            yield
+        finally:
+            self.connection.execute(f"PRAGMA synchronous={self.synchronous}")
+
+    @staticmethod
+    def _check_claimed_events(
+        events: Sequence[RuntimeEvent], claim_purposes: Mapping[str, str]
+    ) -> None:
+        for event in events:
+            if event.event_id in claim_purposes and not (
+                event.idempotency_key and event.action_id
+            ):
+                raise ValueError(
+                    "claimed runtime events require idempotency_key and action_id"
+                )
+
+    def _append_batch_in_transaction(
+        self,
+        cur: sqlite3.Cursor,
+        events: Sequence[RuntimeEvent],
+        claim_purposes: Mapping[str, str],
+    ) -> list[RuntimeEvent] | None:
+        """Append inside the caller's transaction; `None` means roll it back."""
+        stored: list[RuntimeEvent] = []
+        for event in events:
+            purpose = claim_purposes.get(event.event_id)
+            if purpose is not None and self._claim_in_transaction(
+                cur,
+                key=event.idempotency_key,
+                run_id=event.run_id,
+                action_id=event.action_id,
+                purpose=purpose,
+                claimed_at=event.occurred_at,
+            ) == "conflict":
+                return None
+            stored.append(self._append_event_in_transaction(cur, event))
+        return stored
 
     @staticmethod
     def _claim_in_transaction(
@@ -534,27 +814,8 @@ class RuntimeLedger:
             raise ValueError("append_claimed_event requires event.idempotency_key")
         if not event.action_id:
             raise ValueError("append_claimed_event requires event.action_id")
-        cur = self.connection.cursor()
-        try:
-            cur.execute("BEGIN IMMEDIATE")
-            claim = self._claim_in_transaction(
-                cur,
-                key=event.idempotency_key,
-                run_id=event.run_id,
-                action_id=event.action_id,
-                purpose=purpose,
-                claimed_at=event.occurred_at,
-            )
-            if claim == "conflict":
-                cur.execute("ROLLBACK")
-                return None
-            stored = self._append_event_in_transaction(cur, event)
-            cur.execute("COMMIT")
-            return stored
-        except Exception:
-            if self.connection.in_transaction:
-                cur.execute("ROLLBACK")
-            raise
+        stored = self.append_events([event], claim_purposes={event.event_id: purpose})
+        return stored[0] if stored is not None else None
 
     def _append_event_in_transaction(self, cur: sqlite3.Cursor, event: RuntimeEvent) -> RuntimeEvent:
         run = cur.execute(
@@ -571,27 +832,8 @@ class RuntimeLedger:
             datetime.fromisoformat(event.occurred_at.replace("Z", "+00:00"))
         except ValueError as exc:
             raise ValueError("invalid runtime event timestamp") from exc
-        existing_event_types = [
-            RuntimeEventType(row[0])
-            for row in cur.execute(
-                "SELECT event_type FROM runtime_events WHERE run_id=? ORDER BY sequence",
-                (event.run_id,),
-            ).fetchall()
-        ]
-        validate_event_type_sequence([*existing_event_types, event.event_type])
-        if event.event_type in _UNIQUE_TERMINAL_EVENTS:
-            duplicate = cur.execute(
-                "SELECT 1 FROM runtime_events WHERE run_id=? AND event_type=? LIMIT 1",
-                (event.run_id, event.event_type.value),
-            ).fetchone()
-            if duplicate is not None:
-                raise ValueError("duplicate runtime terminal event")
-        sequence = int(
-            cur.execute(
-                "SELECT COALESCE(MAX(sequence), 0) + 1 FROM runtime_events WHERE run_id=?",
-                (event.run_id,),
-            ).fetchone()[0]
-        )
+        state = self._load_run_state(cur, event.run_id).advance(event.event_type)
+        sequence = state.last_sequence
         stored = RuntimeEvent(
             event_id=event.event_id,
             run_id=event.run_id,
@@ -607,6 +849,7 @@ class RuntimeLedger:
             payload=event.payload,
         )
         self._insert_event(cur, stored, sequence=sequence)
+        self._store_run_state(cur, event.run_id, state)
         status = _STATUS_BY_EVENT.get(event.event_type)
         if status is not None:
             cur.execute(
@@ -616,6 +859,93 @@ class RuntimeLedger:
         self._create_event_hitl_item(cur, event)
         return stored
 
+    @staticmethod
+    def _replay_run_state(cur: sqlite3.Cursor, run_id: str) -> RunSequenceState:
+        state = RunSequenceState()
+        for row in cur.execute(
+            "SELECT sequence, event_type FROM runtime_events WHERE run_id=? ORDER BY sequence",
+            (run_id,),
+        ).fetchall():
+            state = state.advance(RuntimeEventType(row["event_type"]))
+            if row["sequence"] != state.last_sequence:
+                raise ValueError("runtime event sequence is not contiguous")
+        return state
+
+    def _load_run_state(self, cur: sqlite3.Cursor, run_id: str) -> RunSequenceState:
+        state = self._read_run_state(cur, run_id)
+        if state is None:
+            # Runs written before the projection existed are replayed once and
+            # then advance incrementally like any other run.
+            state = self._replay_run_state(cur, run_id)
+            self._store_run_state(cur, run_id, state)
+        return state
+
+    @staticmethod
+    def _read_run_state(cur: sqlite3.Cursor, run_id: str) -> RunSequenceState | None:
+        row = cur.execute(
+            "SELECT * FROM runtime_run_state WHERE run_id=?", (run_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return RunSequenceState(
+            last_sequence=row["last_sequence"],
+            last_event_type=RuntimeEventType(row["last_event_type"]),
+            outcome=(
+                RuntimeEventType(row["outcome_event_type"])
+                if row["outcome_event_type"]
+                else None
+            ),
+            final_terminal=(
+                RuntimeEventType(row["final_event_type"])
+                if row["final_event_type"]
+                else None
+            ),
+            terminal_events=frozenset(
+                RuntimeEventType(value)
+                for value in json.loads(row["terminal_event_types"])
+            ),
+        )
+
+    @staticmethod
+    def _store_run_state(
+        cur: sqlite3.Cursor, run_id: str, state: RunSequenceState
+    ) -> None:
+        if state.last_event_type is None:
+            raise ValueError("runtime run has no events")
+        cur.execute(
+            """INSERT INTO runtime_run_state(
+                   run_id, last_sequence, last_event_type, outcome_event_type,
+                   final_event_type, terminal_event_types
+               ) VALUES (?, ?, ?, ?, ?, ?)
+               ON CONFLICT(run_id) DO UPDATE SET
+                   last_sequence=excluded.last_sequence,
+                   last_event_type=excluded.last_event_type,
+                   outcome_event_type=excluded.outcome_event_type,
+                   final_event_type=excluded.final_event_type,
+                   terminal_event_types=excluded.terminal_event_types""",
+            (
+                run_id,
+                state.last_sequence,
+                state.last_event_type.value,
+                state.outcome.value if state.outcome else None,
+                state.final_terminal.value if state.final_terminal else None,
+                json.dumps(sorted(item.value for item in state.terminal_events)),
+            ),
+        )
+
+    def verify_run_state(self, run_id: str) -> RunSequenceState:
+        """Revalidate a run from its first event and compare the stored projection."""
+        cur = self.connection.cursor()
+        if cur.execute(
+            "SELECT 1 FROM runtime_runs WHERE run_id=?", (run_id,)
+        ).fetchone() is None:
+            raise KeyError(run_id)
+        replayed = self._replay_run_state(cur, run_id)
+        stored = self._read_run_state(cur, run_id)
+        if stored is not None and stored != replayed:
+            raise ValueError("runtime run state projection mismatch")
+        return replayed
+
     def _create_event_hitl_item(
         self, cur: sqlite3.Cursor, event: RuntimeEvent
     ) -> None:
@@ -683,6 +1013,183 @@ class RuntimeLedger:
                 json.dumps(event.payload, ensure_ascii=False, sort_keys=True),
             ),
         )
+        self._fold_skill_evidence(cur, event)
+
+    def _fold_skill_evidence(self, cur: sqlite3.Cursor, event: RuntimeEvent) -> None:
+        row = cur.execute(
+            "SELECT * FROM runtime_skill_evidence WHERE skill_name=? AND skill_version=?",
+            (event.skill_name, event.skill_version),
+        ).fetchone()
+        if row is None:
+            # First event of a skill version, or a projection never built.
+            self._rebuild_skill_evidence_in_transaction(
+                cur, event.skill_name, event.skill_version
+            )
+            return
+        evidence = self._decode_skill_evidence(row)
+        evidence.add_event(event)
+        if event.event_type in OUTCOME_EVENT_TYPES:
+            run = cur.execute(
+                "SELECT outcome_event_types, outcome FROM runtime_run_evidence WHERE run_id=?",
+                (event.run_id,),
+            ).fetchone()
+            types = set(json.loads(run["outcome_event_types"])) if run is not None else set()
+            if event.event_type.value not in types:
+                types.add(event.event_type.value)
+                outcome = run_outcome(RuntimeEventType(value) for value in types)
+                cur.execute(
+                    """INSERT INTO runtime_run_evidence(run_id, outcome_event_types, outcome)
+                       VALUES (?, ?, ?)
+                       ON CONFLICT(run_id) DO UPDATE SET
+                           outcome_event_types=excluded.outcome_event_types,
+                           outcome=excluded.outcome""",
+                    (event.run_id, json.dumps(sorted(types)), outcome),
+                )
+                evidence.move_run(run["outcome"] if run is not None else None, outcome)
+        self._store_skill_evidence(cur, event.skill_name, event.skill_version, evidence)
+
+    @staticmethod
+    def _decode_skill_evidence(row: sqlite3.Row) -> SkillEvidence:
+        return SkillEvidence(
+            event_count=row["source_event_watermark"],
+            generated_at=row["generated_at"],
+            counts=json.loads(row["counts_json"]),
+            failure_patterns=set(json.loads(row["failure_patterns_json"])),
+            element_refs=set(json.loads(row["element_refs_json"])),
+        )
+
+    @staticmethod
+    def _store_skill_evidence(
+        cur: sqlite3.Cursor, skill_name: str, skill_version: str, evidence: SkillEvidence
+    ) -> None:
+        cur.execute(
+            """INSERT INTO runtime_skill_evidence(
+                   skill_name, skill_version, source_event_watermark, generated_at,
+                   counts_json, failure_patterns_json, element_refs_json
+               ) VALUES (?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(skill_name, skill_version) DO UPDATE SET
+                   source_event_watermark=excluded.source_event_watermark,
+                   generated_at=excluded.generated_at,
+                   counts_json=excluded.counts_json,
+                   failure_patterns_json=excluded.failure_patterns_json,
+                   element_refs_json=excluded.element_refs_json""",
+            (
+                skill_name,
+                skill_version,
+                evidence.event_count,
+                evidence.generated_at,
+                json.dumps(evidence.counts),
+                json.dumps(sorted(evidence.failure_patterns)),
+                json.dumps(sorted(evidence.element_refs)),
+            ),
+        )
+
+    def _rebuild_skill_evidence_in_transaction(
+        self, cur: sqlite3.Cursor, skill_name: str, skill_version: str
+    ) -> tuple[SkillEvidence, dict[str, tuple[list[str], str | None]]]:
+        evidence, run_types = fold_skill_evidence(
+            self._row_to_event(row)
+            for row in self.connection.execute(
+                "SELECT * FROM runtime_events WHERE skill_name=? AND skill_version=?",
+                (skill_name, skill_version),
+            )
+        )
+        runs = {
+            run_id: (sorted(event_type.value for event_type in types), run_outcome(types))
+            for run_id, types in run_types.items()
+        }
+        cur.execute(
+            """DELETE FROM runtime_run_evidence WHERE run_id IN (
+                   SELECT run_id FROM runtime_runs WHERE skill_name=? AND skill_version=?
+               )""",
+            (skill_name, skill_version),
+        )
+        cur.executemany(
+            "INSERT INTO runtime_run_evidence(run_id, outcome_event_types, outcome) VALUES (?, ?, ?)",
+            [(run_id, json.dumps(types), outcome) for run_id, (types, outcome) in runs.items()],
+        )
+        self._store_skill_evidence(cur, skill_name, skill_version, evidence)
+        return evidence, runs
+
+    def get_skill_evidence(
+        self,
+        skill_name: str,
+        skill_version: str,
+        *,
+        minimum_confident_sample: int = 10,
+    ) -> dict[str, Any] | None:
+        """Read the maintained Evidence summary of a skill version in O(1).
+
+        Equal to `build_evidence_summary` over all of the skill version's
+        events; `None` when the ledger holds no projection for it.
+        """
+        row = self.connection.execute(
+            "SELECT * FROM runtime_skill_evidence WHERE skill_name=? AND skill_version=?",
+            (skill_name, skill_version),
+        ).fetchone()
+        if row is None:
+            return None
+        return self._decode_skill_evidence(row).summary(
+            skill_name=skill_name,
+            skill_version=skill_version,
+            minimum_confident_sample=minimum_confident_sample,
+        )
+
+    def rebuild_skill_evidence(
+        self, skill_name: str | None = None, skill_version: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Recompute Evidence projections from scratch and replace the stored ones.
+
+        Each entry reports whether the stored projection, including its
+        per-run outcomes, already equalled the from-scratch computation.
+        """
+        query = "SELECT DISTINCT skill_name, skill_version FROM runtime_runs"
+        scope: tuple[str, ...] = ()
+        if skill_name is not None:
+            query += " WHERE skill_name=?"
+            scope = (skill_name,)
+            if skill_version is not None:
+                query += " AND skill_version=?"
+                scope = (skill_name, skill_version)
+        skills = self.connection.execute(
+            query + " ORDER BY skill_name, skill_version", scope
+        ).fetchall()
+        report: list[dict[str, Any]] = []
+        for skill in skills:
+            name, version = skill["skill_name"], skill["skill_version"]
+            cur = self.connection.cursor()
+            try:
+                cur.execute("BEGIN IMMEDIATE")
+                stored = cur.execute(
+                    "SELECT * FROM runtime_skill_evidence WHERE skill_name=? AND skill_version=?",
+                    (name, version),
+                ).fetchone()
+                stored_runs = {
+                    row["run_id"]: (json.loads(row["outcome_event_types"]), row["outcome"])
+                    for row in cur.execute(
+                        """SELECT e.* FROM runtime_run_evidence AS e
+                           JOIN runtime_runs AS r ON r.run_id = e.run_id
+                           WHERE r.skill_name=? AND r.skill_version=?""",
+                        (name, version),
+                    )
+                }
+                evidence, runs = self._rebuild_skill_evidence_in_transaction(cur, name, version)
+                cur.execute("COMMIT")
+            except Exception:
+                if self.connection.in_transaction:
+                    cur.execute("ROLLBACK")
+                raise
+            report.append(
+                {
+                    "skill_name": name,
+                    "skill_version": version,
+                    "source_event_watermark": evidence.event_count,
+                    "matched": stored is not None
+                    and self._decode_skill_evidence(stored) == evidence
+                    and stored_runs == runs,
+                }
+            )
+        return report
 
     def get_run(self, run_id: str) -> dict[str, Any]:
         row = self.connection.execute("SELECT * FROM runtime_runs WHERE run_id=?", (run_id,)).fetchone()
@@ -937,110 +1444,172 @@ class RuntimeLedger:
         actor: str,
         reason_code: str,
     ) -> dict[str, Any]:
-        if not isinstance(actor, str) or not (1 <= len(actor) <= 200):
-            raise ValueError("HITL decision actor is invalid")
-        if re.fullmatch(r"[A-Z][A-Z0-9_]{1,63}", reason_code) is None:
-            raise ValueError("HITL decision reason code is invalid")
-        now = datetime.now(timezone.utc).isoformat()
         cur = self.connection.cursor()
         try:
             cur.execute("BEGIN IMMEDIATE")
-            item = cur.execute(
-                "SELECT * FROM runtime_hitl_items WHERE item_id=?", (item_id,)
-            ).fetchone()
-            if item is None:
-                raise KeyError(item_id)
-            if self._row_has_expired(item, now=self._parse_timestamp(now)):
-                raise ValueError("HITL item has expired")
-            if item["status"] != "pending":
-                raise ValueError("HITL item is no longer pending")
-            allowed = (
-                {"approve", "reject"}
-                if item["kind"] == "action_approval"
-                else {"confirm_recovered", "reject"}
-            )
-            if decision not in allowed:
-                raise ValueError("decision is not valid for this HITL item")
-            resulting_status = {
-                "approve": "approved",
-                "reject": "rejected",
-                "confirm_recovered": "confirmed",
-            }[decision]
-            cur.execute(
-                """INSERT INTO runtime_hitl_decisions(
-                       decision_id, item_id, decision, actor, reason_code, decided_at
-                   ) VALUES (?, ?, ?, ?, ?, ?)""",
-                (str(uuid4()), item_id, decision, actor, reason_code, now),
-            )
-            cur.execute(
-                "UPDATE runtime_hitl_items SET status=?, updated_at=? WHERE item_id=?",
-                (resulting_status, now, item_id),
-            )
-            run = cur.execute(
-                "SELECT * FROM runtime_runs WHERE run_id=?", (item["run_id"],)
-            ).fetchone()
-            expected_status = (
-                RunStatus.AWAITING_APPROVAL.value
-                if item["kind"] == "action_approval"
-                else RunStatus.HITL_REQUIRED.value
-            )
-            if run["status"] != expected_status:
-                raise ValueError("runtime run is no longer awaiting this decision")
-            basis = cur.execute(
-                "SELECT execution_digest FROM runtime_execution_bases WHERE run_id=?",
-                (item["run_id"],),
-            ).fetchone()
-            if basis is None or basis["execution_digest"] != item["basis_digest"]:
-                raise ValueError("HITL decision execution basis does not match run")
-            event_type = {
-                "approve": RuntimeEventType.APPROVAL_GRANTED,
-                "reject": RuntimeEventType.APPROVAL_REJECTED,
-                "confirm_recovered": RuntimeEventType.MANUAL_RECOVERY_CONFIRMED,
-            }[decision]
-            self._append_event_in_transaction(
+            item = self._decide_hitl_item_in_transaction(
                 cur,
-                RuntimeEvent(
-                    run_id=item["run_id"],
-                    event_type=event_type,
-                    skill_name=run["skill_name"],
-                    skill_version=run["skill_version"],
-                    action_id=item["action_id"],
-                    payload={
-                        "hitl_item_id": item_id,
-                        "decision": decision,
-                        "actor": actor,
-                        "reason_code": reason_code,
-                    },
-                ),
+                item_id=item_id,
+                decision=decision,
+                actor=actor,
+                reason_code=reason_code,
             )
-            updated = cur.execute(
-                "SELECT * FROM runtime_hitl_items WHERE item_id=?", (item_id,)
-            ).fetchone()
             cur.execute("COMMIT")
-            return self._decode_hitl_item(updated)
+            return item
         except Exception:
             if self.connection.in_transaction:
                 cur.execute("ROLLBACK")
             raise
 
-    def list_events(self, run_id: str) -> list[RuntimeEvent]:
+    def _decide_hitl_item_in_transaction(
+        self,
+        cur: sqlite3.Cursor,
+        *,
+        item_id: str,
+        decision: str,
+        actor: str,
+        reason_code: str,
+    ) -> dict[str, Any]:
+        if not isinstance(actor, str) or not (1 <= len(actor) <= 200):
+            raise ValueError("HITL decision actor is invalid")
+        if re.fullmatch(r"[A-Z][A-Z0-9_]{1,63}", reason_code) is None:
+            raise ValueError("HITL decision reason code is invalid")
+        now = datetime.now(timezone.utc).isoformat()
+        item = cur.execute(
+            "SELECT * FROM runtime_hitl_items WHERE item_id=?", (item_id,)
+        ).fetchone()
+        if item is None:
+            raise KeyError(item_id)
+        if self._row_has_expired(item, now=self._parse_timestamp(now)):
+            raise ValueError("HITL item has expired")
+        if item["status"] != "pending":
+            raise ValueError("HITL item is no longer pending")
+        allowed = (
+            {"approve", "reject"}
+            if item["kind"] == "action_approval"
+            else {"confirm_recovered", "reject"}
+        )
+        if decision not in allowed:
+            raise ValueError("decision is not valid for this HITL item")
+        resulting_status = {
+            "approve": "approved",
+            "reject": "rejected",
+            "confirm_recovered": "confirmed",
+        }[decision]
+        cur.execute(
+            """INSERT INTO runtime_hitl_decisions(
+                   decision_id, item_id, decision, actor, reason_code, decided_at
+               ) VALUES (?, ?, ?, ?, ?, ?)""",
+            (str(uuid4()), item_id, decision, actor, reason_code, now),
+        )
+        cur.execute(
+            "UPDATE runtime_hitl_items SET status=?, updated_at=? WHERE item_id=?",
+            (resulting_status, now, item_id),
+        )
+        run = cur.execute(
+            "SELECT * FROM runtime_runs WHERE run_id=?", (item["run_id"],)
+        ).fetchone()
+        expected_status = (
+            RunStatus.AWAITING_APPROVAL.value
+            if item["kind"] == "action_approval"
+            else RunStatus.HITL_REQUIRED.value
+        )
+        if run["status"] != expected_status:
+            raise ValueError("runtime run is no longer awaiting this decision")
+        basis = cur.execute(
+            "SELECT execution_digest FROM runtime_execution_bases WHERE run_id=?",
+            (item["run_id"],),
+        ).fetchone()
+        if basis is None or basis["execution_digest"] != item["basis_digest"]:
+            raise ValueError("HITL decision execution basis does not match run")
+        event_type = {
+            "approve": RuntimeEventType.APPROVAL_GRANTED,
+            "reject": RuntimeEventType.APPROVAL_REJECTED,
+            "confirm_recovered": RuntimeEventType.MANUAL_RECOVERY_CONFIRMED,
+        }[decision]
+        self._append_event_in_transaction(
+            cur,
+            RuntimeEvent(
+                run_id=item["run_id"],
+                event_type=event_type,
+                skill_name=run["skill_name"],
+                skill_version=run["skill_version"],
+                action_id=item["action_id"],
+                payload={
+                    "hitl_item_id": item_id,
+                    "decision": decision,
+                    "actor": actor,
+                    "reason_code": reason_code,
+                },
+            ),
+        )
+        updated = cur.execute(
+            "SELECT * FROM runtime_hitl_items WHERE item_id=?", (item_id,)
+        ).fetchone()
+        return self._decode_hitl_item(updated)
+
+    def list_events(
+        self,
+        run_id: str,
+        *,
+        after_sequence: int = 0,
+        limit: int | None = None,
+    ) -> list[RuntimeEvent]:
+        """Events of one run with `sequence > after_sequence`, in order.
+
+        The cursor is a range scan on `idx_runtime_events_run`, so a client
+        tailing a live run reads only the events it has not seen yet.
+        """
+
         rows = self.connection.execute(
-            "SELECT * FROM runtime_events WHERE run_id=? ORDER BY sequence", (run_id,)
+            "SELECT * FROM runtime_events WHERE run_id=? AND sequence>? "
+            "ORDER BY sequence LIMIT ?",
+            (run_id, after_sequence, -1 if limit is None else limit),
         ).fetchall()
         return [self._row_to_event(row) for row in rows]
 
     def list_events_for_skill(self, skill_name: str, skill_version: str | None = None) -> list[RuntimeEvent]:
-        if skill_version is None:
-            rows = self.connection.execute(
-                "SELECT * FROM runtime_events WHERE skill_name=? ORDER BY occurred_at, run_id, sequence",
-                (skill_name,),
-            ).fetchall()
-        else:
+        return list(self.iter_events_for_skill(skill_name, skill_version))
+
+    def iter_events_for_skill(
+        self,
+        skill_name: str,
+        skill_version: str | None = None,
+        *,
+        page_size: int = 1000,
+    ) -> Iterator[RuntimeEvent]:
+        """Yield a skill's events in `(occurred_at, run_id, sequence)` order.
+
+        Events are read `page_size` rows at a time, each page resuming after
+        the last key of the previous one along `idx_runtime_events_skill`, so
+        only one page is decoded and held at a time.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be positive")
+        where = "skill_name=?" if skill_version is None else "skill_name=? AND skill_version=?"
+        scope: tuple[str, ...] = (
+            (skill_name,) if skill_version is None else (skill_name, skill_version)
+        )
+        first_page = (
+            f"SELECT * FROM runtime_events WHERE {where} "
+            "ORDER BY occurred_at, run_id, sequence LIMIT ?"
+        )
+        next_page = (
+            f"SELECT * FROM runtime_events WHERE {where} "
+            "AND (occurred_at, run_id, sequence) > (?, ?, ?) "
+            "ORDER BY occurred_at, run_id, sequence LIMIT ?"
+        )
+        rows = self.connection.execute(first_page, (*scope, page_size)).fetchall()
+        while rows:
+            for row in rows:
+                yield self._row_to_event(row)
+            if len(rows) < page_size:
+                return
+            last = rows[-1]
             rows = self.connection.execute(
-                "SELECT * FROM runtime_events WHERE skill_name=? AND skill_version=? ORDER BY occurred_at, run_id, sequence",
-                (skill_name, skill_version),
+                next_page,
+                (*scope, last["occurred_at"], last["run_id"], last["sequence"], page_size),
             ).fetchall()
-        return [self._row_to_event(row) for row in rows]
 
     @staticmethod
     def _row_to_event(row: sqlite3.Row) -> RuntimeEvent:
@@ -1059,82 +1628,23 @@ class RuntimeLedger:
             payload=json.loads(row["payload_json"]),
         )
 
+    def run_event_view(self, run_id: str) -> RunEventView:
+        """Read a run's events once for repeated recovery projections."""
+
+        return RunEventView(self, run_id)
+
     def iter_recovery_candidates(self, run_id: str) -> Iterable[RuntimeEvent]:
         """Yield succeeded primary actions in strict reverse execution order."""
-        events = self.list_events(run_id)
-        compensated_keys = {
-            event.idempotency_key
-            for event in events
-            if event.event_type == RuntimeEventType.COMPENSATION_SUCCEEDED and event.idempotency_key
-        }
-        manually_confirmed_actions = {
-            event.action_id
-            for event in events
-            if event.event_type == RuntimeEventType.MANUAL_RECOVERY_CONFIRMED
-            and event.action_id is not None
-        }
-        for event in reversed(events):
-            if event.event_type != RuntimeEventType.ACTION_SUCCEEDED:
-                continue
-            strategy = event.payload.get("compensation", {}).get("strategy")
-            if strategy not in {"auto_rollback", "manual_approval", "human_intervention"}:
-                continue
-            if event.action_id in manually_confirmed_actions:
-                continue
-            if strategy == "auto_rollback":
-                key = event.payload.get("resolved_compensation_idempotency_key")
-                if key and key in compensated_keys:
-                    continue
-            yield event
+        return self.run_event_view(run_id).iter_recovery_candidates()
 
     def get_unfinished_resume(self, run_id: str) -> RuntimeEvent | None:
-        events = self.list_events(run_id)
-        latest_index: int | None = None
-        for index, event in enumerate(events):
-            if event.event_type == RuntimeEventType.RUN_RESUME_STARTED:
-                latest_index = index
-        if latest_index is None:
-            return None
-        closure_events = {
-            RuntimeEventType.APPROVAL_REQUIRED,
-            RuntimeEventType.POLICY_DENIED,
-            RuntimeEventType.RECONCILIATION_REQUIRED,
-            RuntimeEventType.RUN_SUCCEEDED,
-            RuntimeEventType.RUN_FAILED,
-            RuntimeEventType.RUN_SUSPENDED,
-            RuntimeEventType.RUN_CANCELLED,
-        }
-        if any(
-            event.event_type in closure_events
-            for event in events[latest_index + 1 :]
-        ):
-            return None
-        return events[latest_index]
+        return self.run_event_view(run_id).get_unfinished_resume()
 
     def iter_pending_compensations(self, run_id: str) -> Iterable[RuntimeEvent]:
-        for event in self.iter_recovery_candidates(run_id):
-            if event.payload.get("compensation", {}).get("strategy") == "auto_rollback":
-                yield event
+        return self.run_event_view(run_id).iter_pending_compensations()
 
     def iter_ambiguous_actions(self, run_id: str) -> Iterable[RuntimeEvent]:
-        events = self.list_events(run_id)
-        terminal = {
-            (event.action_id, event.idempotency_key)
-            for event in events
-            if event.event_type
-            in {
-                RuntimeEventType.ACTION_SUCCEEDED,
-                RuntimeEventType.ACTION_FAILED,
-                RuntimeEventType.ACTION_OUTCOME_UNKNOWN,
-            }
-        }
-        for event in events:
-            if (
-                event.event_type == RuntimeEventType.ACTION_STARTED
-                and event.idempotency_key
-                and (event.action_id, event.idempotency_key) not in terminal
-            ):
-                yield event
+        return self.run_event_view(run_id).iter_ambiguous_actions()
 
     def count_events(
         self,
@@ -0,0 +1,206 @@
+"""Process-wide pools of reusable `RuntimeLedger` connections."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from contextlib import contextmanager
+import os
+from pathlib import Path
+import sqlite3
+from threading import Lock, get_ident
+import time
+from typing import Any, Callable, Iterator
+
+from .ledger import RuntimeLedger
+
+
+def _file_identity(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_dev, stat.st_ino
+
+
+class LedgerPool:
+    """Bounded set of idle ledgers leased to one caller at a time.
+
+    A lease prefers the idle ledger last released by the calling thread, so a
+    threadpool worker keeps reusing the same connection and its page cache.
+    When every pooled ledger is leased, an overflow ledger is opened and
+    closed again on release instead of blocking the request. A ledger is
+    closed rather than reused after an SQLite error, after being returned
+    mid-transaction, or once the database file has been replaced.
+
+    With `checkpoint_interval_seconds`, a WAL writer returned after the
+    interval has elapsed runs `wal_checkpoint(TRUNCATE)` so the WAL file does
+    not grow without bound between SQLite's passive auto-checkpoints.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        size: int = 4,
+        read_only: bool = False,
+        journal_mode: str = "DELETE",
+        synchronous: str = "FULL",
+        hitl_ttl_seconds: int = 86_400,
+        migrate: bool = True,
+        checkpoint_interval_seconds: float | None = None,
+        on_event: Callable[[str], None] | None = None,
+    ) -> None:
+        if size < 1:
+            raise ValueError("ledger pool size must be positive")
+        if checkpoint_interval_seconds is not None and checkpoint_interval_seconds <= 0:
+            raise ValueError("checkpoint interval must be positive")
+        self.path = Path(path)
+        self.size = size
+        self.read_only = read_only
+        self.journal_mode = journal_mode
+        self.synchronous = synchronous
+        self.checkpoint_interval_seconds = (
+            checkpoint_interval_seconds
+            if journal_mode.upper() == "WAL" and not read_only
+            else None
+        )
+        self._last_checkpoint = time.monotonic()
+        self.hitl_ttl_seconds = hitl_ttl_seconds
+        self.migrate = migrate
+        self._on_event = on_event
+        self._lock = Lock()
+        self._idle: OrderedDict[int, tuple[RuntimeLedger, tuple[int, int] | None, int]] = (
+            OrderedDict()
+        )
+        self._leased: dict[int, tuple[int, int] | None] = {}
+        self._closed = False
+        self._counters = {
+            "opened": 0,
+            "reused": 0,
+            "affinity_hits": 0,
+            "recycled": 0,
+            "overflow": 0,
+            "checkpoints": 0,
+            "checkpoints_busy": 0,
+        }
+
+    def _record(self, event: str) -> None:
+        self._counters[event] += 1
+        if self._on_event is not None:
+            self._on_event(event)
+
+    def _open(self) -> RuntimeLedger:
+        return RuntimeLedger(
+            self.path,
+            journal_mode=self.journal_mode,
+            synchronous=self.synchronous,
+            read_only=self.read_only,
+            hitl_ttl_seconds=self.hitl_ttl_seconds,
+            migrate=self.migrate,
+            check_same_thread=False,
+        )
+
+    def _take_idle(self) -> RuntimeLedger | None:
+        thread = get_ident()
+        with self._lock:
+            for key, (ledger, identity, owner) in self._idle.items():
+                if owner == thread:
+                    del self._idle[key]
+                    self._record("affinity_hits")
+                    break
+            else:
+                if not self._idle:
+                    return None
+                _, (ledger, identity, owner) = self._idle.popitem(last=True)
+            self._leased[id(ledger)] = identity
+            self._record("reused")
+        if identity is not None and identity == _file_identity(self.path):
+            return ledger
+        # The database was restored or swapped underneath the pool.
+        self._discard(ledger)
+        return None
+
+    def acquire(self) -> RuntimeLedger:
+        ledger = self._take_idle()
+        if ledger is not None:
+            return ledger
+        ledger = self._open()
+        with self._lock:
+            self._leased[id(ledger)] = _file_identity(self.path)
+            self._record("opened")
+        return ledger
+
+    def _discard(self, ledger: RuntimeLedger) -> None:
+        with self._lock:
+            self._leased.pop(id(ledger), None)
+            self._record("recycled")
+        ledger.close()
+
+    def release(self, ledger: RuntimeLedger, *, healthy: bool = True) -> None:
+        if healthy and ledger.connection.in_transaction:
+            try:
+                ledger.connection.execute("ROLLBACK")
+            except sqlite3.Error:
+                pass
+            healthy = False
+        if not healthy:
+            self._discard(ledger)
+            return
+        if self._checkpoint_due():
+            try:
+                result = ledger.checkpoint("TRUNCATE")
+            except sqlite3.Error:
+                self._discard(ledger)
+                return
+            with self._lock:
+                self._record("checkpoints_busy" if result["busy"] else "checkpoints")
+        with self._lock:
+            identity = self._leased.pop(id(ledger), None)
+            keep = not self._closed and len(self._idle) < self.size
+            if keep:
+                self._idle[id(ledger)] = (ledger, identity, get_ident())
+            else:
+                self._record("overflow")
+        if not keep:
+            ledger.close()
+
+    def _checkpoint_due(self) -> bool:
+        if self.checkpoint_interval_seconds is None:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_checkpoint < self.checkpoint_interval_seconds:
+                return False
+            self._last_checkpoint = now
+            return True
+
+    @contextmanager
+    def lease(self) -> Iterator[RuntimeLedger]:
+        ledger = self.acquire()
+        try:
+            yield ledger
+        except sqlite3.Error:
+            self.release(ledger, healthy=False)
+            raise
+        except BaseException:
+            self.release(ledger)
+            raise
+        else:
+            self.release(ledger)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "size": self.size,
+                "idle": len(self._idle),
+                "in_use": len(self._leased),
+                **self._counters,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            idle = [entry[0] for entry in self._idle.values()]
+            self._idle.clear()
+        for ledger in idle:
+            ledger.close()
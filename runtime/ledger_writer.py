@@ -0,0 +1,296 @@
+"""Single-writer service that owns the Runtime ledger's write connection."""
+
+from __future__ import annotations
+
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from pathlib import Path
+import queue
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Mapping, Sequence
+
+from .ledger import BATCHABLE_WRITES, RuntimeLedger
+from .ledger_pool import _file_identity
+from .models import RuntimeEvent
+
+# Writes that manage their own transaction; the writer runs them one at a time.
+EXCLUSIVE_WRITES = frozenset({"create_run", "create_hitl_item", "claim_hitl_resume"})
+
+
+class LedgerWriterBusy(RuntimeError):
+    """Raised when the write queue stays full for the whole submit timeout."""
+
+
+class LedgerWriterClosed(RuntimeError):
+    """Raised when work is submitted to a writer that has been closed."""
+
+
+@dataclass
+class _Write:
+    operation: str
+    arguments: dict[str, Any]
+    barrier: bool = False
+    future: Future = field(default_factory=Future)
+
+
+_STOP = object()
+
+
+class LedgerWriter:
+    """Serialize every ledger write through one thread and one connection.
+
+    Callers submit writes into a bounded queue and wait on the returned
+    future. The writer drains up to `max_batch` queued writes at a time and
+    commits consecutive append, claim and HITL-decision writes in a single
+    transaction, one savepoint each; `EXCLUSIVE_WRITES` run on their own. A
+    full queue blocks the caller for at most `submit_timeout` seconds before
+    `LedgerWriterBusy` is raised. A future resolves only after its write has
+    committed, so a read on another connection afterwards observes it.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        journal_mode: str = "DELETE",
+        synchronous: str = "FULL",
+        hitl_ttl_seconds: int = 86_400,
+        migrate: bool = True,
+        queue_size: int = 1024,
+        max_batch: int = 64,
+        submit_timeout: float = 5.0,
+        checkpoint_interval_seconds: float | None = None,
+        on_event: Callable[[str], None] | None = None,
+    ) -> None:
+        if queue_size < 1 or max_batch < 1:
+            raise ValueError("writer queue size and batch size must be positive")
+        if checkpoint_interval_seconds is not None and checkpoint_interval_seconds <= 0:
+            raise ValueError("checkpoint interval must be positive")
+        self.path = Path(path)
+        self.max_batch = max_batch
+        self.submit_timeout = submit_timeout
+        self.checkpoint_interval_seconds = (
+            checkpoint_interval_seconds if journal_mode.upper() == "WAL" else None
+        )
+        self._on_event = on_event
+        self._lock = threading.Lock()
+        self._counters = {
+            "submitted": 0,
+            "rejected": 0,
+            "transactions": 0,
+            "batched": 0,
+            "exclusive": 0,
+            "failed": 0,
+            "checkpoints": 0,
+            "checkpoints_busy": 0,
+        }
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=queue_size)
+        self._closed = False
+        # Opened here so schema and configuration errors reach the caller;
+        # only the writer thread touches the connection afterwards.
+        self._ledger = RuntimeLedger(
+            self.path,
+            journal_mode=journal_mode,
+            synchronous=synchronous,
+            hitl_ttl_seconds=hitl_ttl_seconds,
+            migrate=migrate,
+            check_same_thread=False,
+        )
+        self._identity = _file_identity(self.path)
+        self._last_checkpoint = time.monotonic()
+        self._thread = threading.Thread(
+            target=self._serve, name=f"ledger-writer:{self.path.name}", daemon=True
+        )
+        self._thread.start()
+
+    def _record(self, event: str, count: int = 1) -> None:
+        with self._lock:
+            self._counters[event] += count
+        if self._on_event is not None:
+            for _ in range(count):
+                self._on_event(event)
+
+    def matches_file(self) -> bool:
+        """Whether the database file is still the one the writer opened."""
+
+        return self._identity is not None and self._identity == _file_identity(self.path)
+
+    def submit(
+        self, operation: str, /, *, barrier: bool = False, **arguments: Any
+    ) -> Future:
+        """Queue one write and return the future of its result."""
+
+        if operation not in BATCHABLE_WRITES and operation not in EXCLUSIVE_WRITES:
+            raise ValueError(f"unsupported ledger write: {operation}")
+        if self._closed:
+            raise LedgerWriterClosed("runtime ledger writer is closed")
+        write = _Write(operation, arguments, barrier)
+        try:
+            self._queue.put(write, timeout=self.submit_timeout)
+        except queue.Full:
+            self._record("rejected")
+            raise LedgerWriterBusy("runtime ledger write queue is full") from None
+        self._record("submitted")
+        return write.future
+
+    def _serve(self) -> None:
+        try:
+            while True:
+                item = self._queue.get()
+                batch: list[_Write] = []
+                while item is not _STOP:
+                    batch.append(item)
+                    if len(batch) >= self.max_batch:
+                        break
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                self._execute(batch)
+                if item is _STOP:
+                    return
+        finally:
+            self._ledger.close()
+
+    def _execute(self, batch: list[_Write]) -> None:
+        pending = [write for write in batch if write.future.set_running_or_notify_cancel()]
+        group: list[_Write] = []
+        for write in pending:
+            if write.operation in BATCHABLE_WRITES:
+                group.append(write)
+                continue
+            self._commit_group(group)
+            group = []
+            self._run_exclusive(write)
+        self._commit_group(group)
+        self._maybe_checkpoint()
+
+    def _commit_group(self, group: list[_Write]) -> None:
+        if not group:
+            return
+        barrier = any(
+            write.barrier or write.arguments.get("claim_purposes") for write in group
+        )
+        try:
+            results = self._ledger.apply_writes(
+                [(write.operation, write.arguments) for write in group], barrier=barrier
+            )
+        except Exception as exc:
+            self._record("failed", len(group))
+            for write in group:
+                write.future.set_exception(exc)
+            return
+        self._record("transactions")
+        self._record("batched", len(group))
+        for write, result in zip(group, results):
+            if isinstance(result, Exception):
+                write.future.set_exception(result)
+            else:
+                write.future.set_result(result)
+
+    def _run_exclusive(self, write: _Write) -> None:
+        try:
+            result = getattr(self._ledger, write.operation)(**write.arguments)
+        except Exception as exc:
+            self._record("failed")
+            write.future.set_exception(exc)
+            return
+        self._record("transactions")
+        self._record("exclusive")
+        write.future.set_result(result)
+
+    def _maybe_checkpoint(self) -> None:
+        if self.checkpoint_interval_seconds is None:
+            return
+        now = time.monotonic()
+        if now - self._last_checkpoint < self.checkpoint_interval_seconds:
+            return
+        self._last_checkpoint = now
+        try:
+            result = self._ledger.checkpoint("TRUNCATE")
+        except sqlite3.Error:
+            return
+        self._record("checkpoints_busy" if result["busy"] else "checkpoints")
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "queue_depth": self._queue.qsize(),
+                "queue_size": self._queue.maxsize,
+                **self._counters,
+            }
+
+    def close(self, timeout: float | None = None) -> None:
+        """Stop accepting writes, finish the queued ones and close the connection."""
+
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+
+class QueuedLedger:
+    """Ledger facade that sends writes to a `LedgerWriter` and reads to a reader.
+
+    It stands in for `RuntimeLedger` wherever the orchestrator, executor and
+    recovery coordinator take one; every other attribute is looked up on the
+    read-only `reader`.
+    """
+
+    def __init__(self, writer: LedgerWriter, reader: RuntimeLedger) -> None:
+        self.writer = writer
+        self.reader = reader
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.reader, name)
+
+    def _write(self, operation: str, /, **arguments: Any) -> Any:
+        return self.writer.submit(operation, **arguments).result()
+
+    def append_event(self, event: RuntimeEvent) -> RuntimeEvent:
+        return self.append_events([event])[0]
+
+    def append_events(
+        self,
+        events: Sequence[RuntimeEvent],
+        *,
+        claim_purposes: Mapping[str, str] | None = None,
+        barrier: bool = False,
+    ) -> list[RuntimeEvent] | None:
+        if not events:
+            return []
+        return self._write(
+            "append_events",
+            events=list(events),
+            claim_purposes=dict(claim_purposes or {}),
+            barrier=barrier,
+        )
+
+    def append_claimed_event(self, event: RuntimeEvent, *, purpose: str) -> RuntimeEvent | None:
+        if not event.idempotency_key:
+            raise ValueError("append_claimed_event requires event.idempotency_key")
+        if not event.action_id:
+            raise ValueError("append_claimed_event requires event.action_id")
+        stored = self.append_events([event], claim_purposes={event.event_id: purpose})
+        return stored[0] if stored is not None else None
+
+    def ensure_idempotency_claim(self, **arguments: Any) -> str:
+        return self._write("ensure_idempotency_claim", **arguments)
+
+    def claim_idempotency(self, **arguments: Any) -> bool:
+        return self.ensure_idempotency_claim(**arguments) != "conflict"
+
+    def decide_hitl_item(self, **arguments: Any) -> dict[str, Any]:
+        return self._write("decide_hitl_item", **arguments)
+
+    def create_run(self, **arguments: Any) -> str:
+        return self._write("create_run", **arguments)
+
+    def create_hitl_item(self, **arguments: Any) -> dict[str, Any]:
+        return self._write("create_hitl_item", **arguments)
+
+    def claim_hitl_resume(self, **arguments: Any) -> Any:
+        return self._write("claim_hitl_resume", **arguments)
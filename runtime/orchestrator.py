@@ -76,6 +76,7 @@ class RuntimeOrchestrator:
         skill_document: dict[str, Any],
         *,
         asset_id: str | None = None,
+        skill_digest: str | None = None,
         parameters: dict[str, Any],
         context: dict[str, Any] | None = None,
         dry_run: bool = True,
@@ -87,6 +88,14 @@ class RuntimeOrchestrator:
         validate_cross_references(skill_document, contract)
         _validate_skill_identity(skill_document, contract)
         resolved_asset_id = asset_id or str(skill_document["meta"]["skill_id"])
+        # A caller that loaded the document from an Asset revision passes its
+        # content_hash; it must describe the document actually being run.
+        document_digest = canonical_digest(skill_document)
+        if skill_digest is not None and skill_digest != document_digest:
+            raise RuntimeContractValidationError(
+                "skill_digest does not match the skill document"
+            )
+        skill_digest = document_digest
         governance_attestation = self.governance_gate.evaluate(
             skill_document,
             contract,
@@ -157,7 +166,7 @@ class RuntimeOrchestrator:
             "governance_revision_id": str(
                 governance_attestation["revision_id"]
             ),
-            "skill_source_digest": canonical_digest(skill_document),
+            "skill_source_digest": skill_digest,
             "contract_digest": canonical_digest(contract),
             "input_digest": keyed_digest(parameters, key=self.binding_key),
             "preflight_digest": canonical_digest(preflight),
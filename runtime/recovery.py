@@ -4,6 +4,7 @@ from typing import Any, Protocol
 
 from .ledger import RuntimeLedger
 from .models import ActionResult, RunStatus, RuntimeEvent, RuntimeEventType
+from .run_events import RunEventView
 
 
 class CompensationAdapter(Protocol):
@@ -40,9 +41,12 @@ class RecoveryCoordinator:
             return current
 
         skill = {"name": run["skill_name"], "version": run["skill_version"]}
-        ambiguous = list(self.ledger.iter_ambiguous_actions(run_id))
+        # One read of the run's history answers every projection below; the
+        # view is refreshed past its last sequence after this method appends.
+        view = self.ledger.run_event_view(run_id)
+        ambiguous = list(view.iter_ambiguous_actions())
         if ambiguous:
-            if not self.ledger.has_event(run_id, RuntimeEventType.RECONCILIATION_REQUIRED):
+            if not view.has_event(RuntimeEventType.RECONCILIATION_REQUIRED):
                 event = ambiguous[0]
                 self._event(
                     run_id,
@@ -54,7 +58,7 @@ class RecoveryCoordinator:
                 )
             return RunStatus.RECONCILIATION_REQUIRED
 
-        unfinished_resume = self.ledger.get_unfinished_resume(run_id)
+        unfinished_resume = view.get_unfinished_resume()
         if unfinished_resume is not None:
             self._event(
                 run_id,
@@ -69,18 +73,12 @@ class RecoveryCoordinator:
             )
             return RunStatus.RECONCILIATION_REQUIRED
 
-        candidates = list(self.ledger.iter_recovery_candidates(run_id))
+        candidates = list(view.iter_recovery_candidates())
         if not candidates:
             # All automatic compensations and action-scoped manual recoveries
             # may already be closed.
-            has_recovery_effect = any(
-                event.event_type == RuntimeEventType.ACTION_SUCCEEDED
-                and event.payload.get("compensation", {}).get("strategy")
-                in {"auto_rollback", "manual_approval", "human_intervention"}
-                for event in self.ledger.list_events(run_id)
-            )
-            if has_recovery_effect:
-                if not self.ledger.has_event(run_id, RuntimeEventType.RUN_COMPENSATED):
+            if view.has_recovery_effect():
+                if not view.has_event(RuntimeEventType.RUN_COMPENSATED):
                     self._event(run_id, skill, RuntimeEventType.RUN_COMPENSATED, payload={"already_complete": True})
                 return RunStatus.COMPENSATED
             return RunStatus(self.ledger.get_run(run_id)["status"])
@@ -143,12 +141,13 @@ class RecoveryCoordinator:
                 return RunStatus.HITL_REQUIRED
 
             max_attempts = 1 + int(comp.get("max_retries", 3))
-            previous_starts = self.ledger.count_events(
-                run_id, RuntimeEventType.COMPENSATION_STARTED, idempotency_key=key
+            view.refresh()
+            previous_starts = view.count_events(
+                RuntimeEventType.COMPENSATION_STARTED, idempotency_key=key
             )
             if previous_starts >= max_attempts:
                 self._fail_recovery(
-                    run_id,
+                    view,
                     skill,
                     action_id=action_id,
                     key=key,
@@ -251,8 +250,9 @@ class RecoveryCoordinator:
                     )
 
             if not succeeded:
+                view.refresh()
                 self._fail_recovery(
-                    run_id,
+                    view,
                     skill,
                     action_id=action_id,
                     key=key,
@@ -260,22 +260,22 @@ class RecoveryCoordinator:
                 )
                 return RunStatus.HITL_REQUIRED
 
-        if not self.ledger.has_event(run_id, RuntimeEventType.RUN_COMPENSATED):
+        view.refresh()
+        if not view.has_event(RuntimeEventType.RUN_COMPENSATED):
             self._event(run_id, skill, RuntimeEventType.RUN_COMPENSATED, payload={"recovered": True})
         return RunStatus.COMPENSATED
 
     def _fail_recovery(
         self,
-        run_id: str,
+        view: RunEventView,
         skill: dict[str, str],
         *,
         action_id: str,
         key: str,
         max_attempts: int,
     ) -> None:
-        if not self.ledger.has_event(
-            run_id, RuntimeEventType.RUN_RECOVERY_FAILED, idempotency_key=key
-        ):
+        run_id = view.run_id
+        if not view.has_event(RuntimeEventType.RUN_RECOVERY_FAILED, idempotency_key=key):
             self._event(
                 run_id,
                 skill,
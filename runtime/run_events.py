@@ -0,0 +1,152 @@
+"""In-memory view of one run's events shared by the executor and recovery."""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import TYPE_CHECKING, Iterator
+
+from .models import RuntimeEvent, RuntimeEventType
+
+if TYPE_CHECKING:
+    from .ledger import RuntimeLedger
+
+
+RECOVERY_STRATEGIES = frozenset({"auto_rollback", "manual_approval", "human_intervention"})
+_ACTION_TERMINAL_EVENTS = frozenset(
+    {
+        RuntimeEventType.ACTION_SUCCEEDED,
+        RuntimeEventType.ACTION_FAILED,
+        RuntimeEventType.ACTION_OUTCOME_UNKNOWN,
+    }
+)
+# Any of these after the latest resume start means the resume attempt closed.
+_RESUME_CLOSURE_EVENTS = frozenset(
+    {
+        RuntimeEventType.APPROVAL_REQUIRED,
+        RuntimeEventType.POLICY_DENIED,
+        RuntimeEventType.RECONCILIATION_REQUIRED,
+        RuntimeEventType.RUN_SUCCEEDED,
+        RuntimeEventType.RUN_FAILED,
+        RuntimeEventType.RUN_SUSPENDED,
+        RuntimeEventType.RUN_CANCELLED,
+    }
+)
+
+
+def _strategy(event: RuntimeEvent) -> object:
+    return event.payload.get("compensation", {}).get("strategy")
+
+
+class RunEventView:
+    """A run's events, read once and indexed for the recovery projections.
+
+    `refresh` reads only the events past the last sequence already seen, so a
+    caller that appends events keeps the view current with one indexed range
+    scan instead of re-reading and re-decoding the whole history.
+    """
+
+    def __init__(self, ledger: RuntimeLedger, run_id: str) -> None:
+        self.ledger = ledger
+        self.run_id = run_id
+        self.events: list[RuntimeEvent] = []
+        self.last_sequence = 0
+        self._counts: Counter[tuple[RuntimeEventType, str | None]] = Counter()
+        self._type_counts: Counter[RuntimeEventType] = Counter()
+        self._recovery_sources: list[RuntimeEvent] = []
+        self._compensated_keys: set[str] = set()
+        self._manually_confirmed: set[str] = set()
+        self._completed_actions: set[str] = set()
+        self._terminal_actions: set[tuple[str | None, str | None]] = set()
+        self._started_actions: list[RuntimeEvent] = []
+        self._latest_resume: RuntimeEvent | None = None
+        self._resume_closed = False
+        self.refresh()
+
+    def refresh(self) -> int:
+        """Fold events appended since the last read; return how many were new."""
+
+        events = self.ledger.list_events(self.run_id, after_sequence=self.last_sequence)
+        for event in events:
+            self._add(event)
+        return len(events)
+
+    def _add(self, event: RuntimeEvent) -> None:
+        self.events.append(event)
+        self.last_sequence = event.sequence
+        event_type = event.event_type
+        self._type_counts[event_type] += 1
+        self._counts[event_type, event.idempotency_key] += 1
+        if event_type == RuntimeEventType.ACTION_SUCCEEDED:
+            if event.action_id is not None:
+                self._completed_actions.add(event.action_id)
+            if _strategy(event) in RECOVERY_STRATEGIES:
+                self._recovery_sources.append(event)
+        elif event_type == RuntimeEventType.COMPENSATION_SUCCEEDED and event.idempotency_key:
+            self._compensated_keys.add(event.idempotency_key)
+        elif (
+            event_type == RuntimeEventType.MANUAL_RECOVERY_CONFIRMED
+            and event.action_id is not None
+        ):
+            self._manually_confirmed.add(event.action_id)
+        elif event_type == RuntimeEventType.ACTION_STARTED and event.idempotency_key:
+            self._started_actions.append(event)
+        elif event_type == RuntimeEventType.RUN_RESUME_STARTED:
+            self._latest_resume = event
+            self._resume_closed = False
+        if event_type in _ACTION_TERMINAL_EVENTS:
+            self._terminal_actions.add((event.action_id, event.idempotency_key))
+        if event_type in _RESUME_CLOSURE_EVENTS and self._latest_resume is not None:
+            self._resume_closed = True
+
+    def count_events(
+        self,
+        event_type: RuntimeEventType,
+        *,
+        idempotency_key: str | None = None,
+    ) -> int:
+        if idempotency_key is None:
+            return self._type_counts[event_type]
+        return self._counts[event_type, idempotency_key]
+
+    def has_event(
+        self,
+        event_type: RuntimeEventType,
+        *,
+        idempotency_key: str | None = None,
+    ) -> bool:
+        return self.count_events(event_type, idempotency_key=idempotency_key) > 0
+
+    def completed_action_ids(self) -> set[str]:
+        return set(self._completed_actions)
+
+    def has_recovery_effect(self) -> bool:
+        """Whether any succeeded action declared a compensation strategy."""
+
+        return bool(self._recovery_sources)
+
+    def iter_recovery_candidates(self) -> Iterator[RuntimeEvent]:
+        """Yield succeeded primary actions in strict reverse execution order."""
+
+        for event in reversed(self._recovery_sources):
+            if event.action_id in self._manually_confirmed:
+                continue
+            if _strategy(event) == "auto_rollback":
+                key = event.payload.get("resolved_compensation_idempotency_key")
+                if key and key in self._compensated_keys:
+                    continue
+            yield event
+
+    def iter_pending_compensations(self) -> Iterator[RuntimeEvent]:
+        for event in self.iter_recovery_candidates():
+            if _strategy(event) == "auto_rollback":
+                yield event
+
+    def get_unfinished_resume(self) -> RuntimeEvent | None:
+        return None if self._resume_closed else self._latest_resume
+
+    def iter_ambiguous_actions(self) -> Iterator[RuntimeEvent]:
+        """Yield started actions that never recorded a terminal outcome."""
+
+        for event in self._started_actions:
+            if (event.action_id, event.idempotency_key) not in self._terminal_actions:
+                yield event
@@ -58,22 +58,38 @@ backup_database() {
     fi
 
     local backup_file="${BACKUP_DIR}/${prefix}_${TIMESTAMP}.db"
+    local partial_file="${backup_file}.partial"
+    rm -f "$partial_file" "${partial_file}-wal" "${partial_file}-shm"
+    # The online backup API copies committed WAL frames that have not been
+    # checkpointed yet. The copy is then switched to a rollback journal so it
+    # restores as a single self-contained file, and checked before it is kept.
     if {
         if command -v sqlite3 >/dev/null 2>&1; then
-            sqlite3 "$db_path" ".backup '${backup_file}'"
+            sqlite3 "$db_path" ".backup '${partial_file}'" \
+                && [[ "$(sqlite3 "$partial_file" "PRAGMA journal_mode=DELETE;" "PRAGMA quick_check;" | tail -n 1)" == "ok" ]]
         else
-            "$PYTHON_BIN" - "$db_path" "$backup_file" <<'PY'
+            "$PYTHON_BIN" - "$db_path" "$partial_file" <<'PY'
 import sqlite3
 import sys
 
 source_path, backup_path = sys.argv[1], sys.argv[2]
-with sqlite3.connect(source_path) as source, sqlite3.connect(backup_path) as backup:
+source = sqlite3.connect(source_path)
+backup = sqlite3.connect(backup_path)
+try:
     source.backup(backup)
+    backup.execute("PRAGMA journal_mode=DELETE").fetchone()
+    if backup.execute("PRAGMA quick_check").fetchone()[0] != "ok":
+        sys.exit(1)
+finally:
+    backup.close()
+    source.close()
 PY
         fi
     }; then
+        mv -f "$partial_file" "$backup_file"
         echo "[OK] ${label}: wrote ${backup_file}"
     else
+        rm -f "$partial_file" "${partial_file}-wal" "${partial_file}-shm"
         echo "[FAIL] ${label}: backup failed (${db_path})"
         failures=$((failures + 1))
     fi
@@ -42,6 +42,7 @@ with RuntimeLedger(
     path,
     journal_mode=journal_mode,
     hitl_ttl_seconds=int(ttl_seconds),
+    migrate=True,
 ):
     pass
 PY
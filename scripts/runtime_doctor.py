@@ -22,12 +22,17 @@ from api.routers.runs_v4 import (  # noqa: E402
     runtime_binding_key_configuration_issue,
     runtime_hitl_ttl_configuration_issue,
     runtime_journal_mode_configuration_issue,
+    runtime_synchronous_configuration_issue,
 )
+from runtime.ledger import LEDGER_SCHEMA_VERSION  # noqa: E402
 
 
 RUNTIME_TABLES = {
     "runtime_runs": set(),
     "runtime_events": set(),
+    "runtime_run_state": set(),
+    "runtime_skill_evidence": set(),
+    "runtime_run_evidence": set(),
     "runtime_execution_bases": {"governance_revision_id"},
     "runtime_hitl_items": {"expires_at"},
     "runtime_hitl_decisions": set(),
@@ -190,9 +195,15 @@ def run_doctor(
         expected_runtime_journal,
         require_wal=production,
     )
+    synchronous_issue = runtime_synchronous_configuration_issue(
+        os.getenv("SKILL0_RUNTIME_SYNCHRONOUS"),
+        expected_runtime_journal,
+    )
     if journal_issue:
         errors.append(journal_issue)
         expected_runtime_journal = None
+    if synchronous_issue:
+        errors.append(synchronous_issue)
 
     for label, path, tables, journal in (
         ("skills_db", skills_path, {}, None),
@@ -216,6 +227,13 @@ def run_doctor(
     if runtime_path.is_file():
         try:
             with _read_only_connection(runtime_path) as connection:
+                schema_version = connection.execute("PRAGMA user_version").fetchone()[0]
+                checks["runtime_db"]["schema_version"] = schema_version
+                if schema_version != LEDGER_SCHEMA_VERSION:
+                    errors.append(
+                        f"runtime_db_schema_version:{schema_version}"
+                        f":expected:{LEDGER_SCHEMA_VERSION}"
+                    )
                 legacy_hitl = connection.execute(
                     "SELECT COUNT(*) FROM runtime_hitl_items WHERE expires_at IS NULL"
                 ).fetchone()[0]
@@ -24,6 +24,11 @@ def build_parser() -> argparse.ArgumentParser:
     target = parser.add_mutually_exclusive_group(required=True)
     target.add_argument("--run-id")
     target.add_argument("--skill-name")
+    target.add_argument(
+        "--rebuild-projection",
+        action="store_true",
+        help="Recompute every per-skill Evidence projection and report any drift",
+    )
     parser.add_argument("--skill-version")
     parser.add_argument("--minimum-sample-size", type=int, default=10)
     parser.add_argument("--output", type=Path, help="Optional JSON output path")
@@ -39,6 +44,24 @@ def main(argv: list[str] | None = None) -> int:
         print("Runtime ledger not found", file=sys.stderr)
         return 2
 
+    if args.rebuild_projection:
+        try:
+            with RuntimeLedger(args.db) as ledger:
+                report = ledger.rebuild_skill_evidence()
+        except (OSError, sqlite3.DatabaseError, ValueError):
+            print("Unable to rebuild Runtime Evidence projections", file=sys.stderr)
+            return 1
+        matched = all(item["matched"] for item in report)
+        print(
+            json.dumps(
+                {"operation": "rebuild_projection", "matched": matched, "skills": report},
+                ensure_ascii=False,
+                indent=2,
+                sort_keys=True,
+            )
+        )
+        return 0 if matched else 1
+
     try:
         with RuntimeLedger(args.db, read_only=True) as ledger:
             if args.run_id:
@@ -49,16 +72,21 @@ def main(argv: list[str] | None = None) -> int:
                     return 2
                 summary = build_run_evidence(ledger.list_events(args.run_id), run=run)
             else:
-                events = ledger.list_events_for_skill(args.skill_name, args.skill_version)
-                if not events:
-                    print("Skill Evidence source events not found", file=sys.stderr)
-                    return 2
-                summary = build_evidence_summary(
-                    events,
-                    skill_name=args.skill_name,
-                    skill_version=args.skill_version,
+                summary = ledger.get_skill_evidence(
+                    args.skill_name,
+                    args.skill_version,
                     minimum_confident_sample=max(1, args.minimum_sample_size),
                 )
+                if summary is None:
+                    summary = build_evidence_summary(
+                        ledger.iter_events_for_skill(args.skill_name, args.skill_version),
+                        skill_name=args.skill_name,
+                        skill_version=args.skill_version,
+                        minimum_confident_sample=max(1, args.minimum_sample_size),
+                    )
+                if summary["source_event_watermark"] == 0:
+                    print("Skill Evidence source events not found", file=sys.stderr)
+                    return 2
 
         validate_schema(
             summary,
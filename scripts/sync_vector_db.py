@@ -4,13 +4,14 @@ Vector DB 同步腳本
 
 功能：
 1. 從 parsed/ 目錄載入所有技能 JSON
-2. 重建 Vector DB 索引（冪等操作）
+2. 於 shadow 檔案重建 Vector DB 索引，驗證後原子替換（冪等操作）
 3. 交叉比對 Governance DB，產出同步報告
 
 用法：
     python scripts/sync_vector_db.py
     python scripts/sync_vector_db.py --parsed-dir parsed --db-path skills.db
     python scripts/sync_vector_db.py --report-only  # 只產出報告不重建
+    python scripts/sync_vector_db.py --in-place     # 舊行為：清空後就地重建
 """
 
 import argparse
@@ -55,17 +56,120 @@ def get_governance_skills():
         return []
 
 
-def sync_vector_db(parsed_dir: str, db_path: str, report_only: bool = False):
+def _remove_database_files(path: Path) -> None:
+    for candidate in (path, path.with_name(path.name + "-journal")):
+        candidate.unlink(missing_ok=True)
+
+
+def build_shadow_index(
+    parsed_path: Path,
+    db_full_path: Path,
+    migration_dir: Path = PROJECT_ROOT / "migrations" / "index",
+) -> dict:
+    """在 live 索引旁建立完整的 shadow 索引，驗證後原子替換。
+
+    live 索引在整個重建期間持續提供搜尋；已套用 asset_index_state 的索引會
+    重用身分（revision、representation、模型版本）完全相同的既有向量。
+    降維索引沿用 live 索引儲存的投影，不會重新擬合。預設表示若為具名表示，
+    shadow 會以同名表示重建並設為預設；尚有其他未回收的表示時拒絕重建，
+    避免替換檔案時遺失仍在建置或等待 cutover 的表示。
+    任何失敗都只會丟棄 shadow 檔案，live 索引保持不變。
+    """
+    from asset_registry.sqlite import (
+        INDEX_POLICY,
+        apply_migrations,
+        connect_sqlite,
+        load_migrations,
+        preflight_index_schema,
+        swap_database,
+    )
+    from vector_db import SemanticSearch, VectorStore
+
+    shadow_path = db_full_path.with_name(db_full_path.name + ".shadow")
+    _remove_database_files(shadow_path)
+
+    generation = 0
+    migrated = False
+    projection = None
+    representation = None
+    embedding_cache = {}
+    if db_full_path.is_file():
+        with VectorStore(db_path=str(db_full_path), initialize_schema=False) as live:
+            generation = live.generation
+            migrated = live.has_asset_index_state()
+            projection = live.projection
+            representation = live.representation_record
+            pending = [
+                item["name"]
+                for item in live.list_representations()
+                if item["name"] != live.representation
+                and item["status"] != "retired"
+                and item["rows"]
+            ]
+            if pending:
+                raise RuntimeError(
+                    "shadow 重建前需先完成 cutover 或回收其他表示: " + ", ".join(pending)
+                )
+            if migrated:
+                embedding_cache = live.get_indexed_embeddings()
+
+    try:
+        with SemanticSearch(
+            db_path=str(shadow_path),
+            model_name=representation["embedding_model_name"] if representation else None,
+            projection=projection,
+        ) as search:
+            if migrated:
+                apply_migrations(search.store.conn, load_migrations(migration_dir))
+                if representation:
+                    report = search.build_representation(
+                        representation["name"],
+                        parsed_path,
+                        embedding_cache=embedding_cache,
+                    )
+                    search.store.set_default_representation(representation["name"])
+                    search.store.drop_retired_representations()
+                else:
+                    report = search.index_assets(
+                        parsed_path,
+                        show_progress=True,
+                        embedding_cache=embedding_cache,
+                    )
+                indexed_count, reused_count = report.total, report.reused
+            else:
+                indexed_count = search.index_skills(str(parsed_path), show_progress=True)
+                reused_count = 0
+            search.store.set_generation(generation + 1)
+        with connect_sqlite(shadow_path, policy=INDEX_POLICY, mode="read_only") as connection:
+            preflight_index_schema(connection, expected_dimension=search.store.dimension)
+        integrity = swap_database(shadow_path, db_full_path)
+    except BaseException:
+        _remove_database_files(shadow_path)
+        raise
+    return {
+        "indexed_count": indexed_count,
+        "reused_embeddings": reused_count,
+        "generation": generation + 1,
+        "integrity": integrity,
+    }
+
+
+def sync_vector_db(
+    parsed_dir: str,
+    db_path: str,
+    report_only: bool = False,
+    in_place: bool = False,
+):
     """執行同步。"""
     parsed_path = PROJECT_ROOT / parsed_dir
     db_full_path = PROJECT_ROOT / db_path
 
     print(f"{'='*60}")
-    print(f"Vector DB 同步工具")
+    print("Vector DB 同步工具")
     print(f"{'='*60}")
     print(f"Parsed 目錄: {parsed_path}")
     print(f"Vector DB:   {db_full_path}")
-    print(f"模式:        {'報告' if report_only else '同步 + 報告'}")
+    print(f"模式:        {'報告' if report_only else ('就地同步' if in_place else 'shadow 同步')} + 報告")
     print()
 
     # 1. 掃描 parsed 目錄
@@ -85,8 +189,22 @@ def sync_vector_db(parsed_dir: str, db_path: str, report_only: bool = False):
 
     # 3. 重建 Vector DB（除非 report_only）
     indexed_count = 0
-    if not report_only:
-        print(f"\n[3/4] 重建 Vector DB 索引...")
+    swap = None
+    if not report_only and not in_place:
+        print(f"\n[3/4] 於 shadow 檔案重建 Vector DB 索引...")
+        try:
+            swap = build_shadow_index(parsed_path, db_full_path)
+            indexed_count = swap["indexed_count"]
+            print(f"       索引完成: {indexed_count} 個技能")
+            print(f"       重用向量: {swap['reused_embeddings']} 個")
+            print(f"       已原子替換，索引世代: {swap['generation']}")
+        except Exception as e:
+            print(f"       [ERROR] shadow 索引失敗，live 索引未變更: {e}")
+            if "sentence_transformers" in str(e) or "No module" in str(e):
+                print("       提示: 需要安裝 sentence-transformers 套件")
+                print("       pip install sentence-transformers")
+    elif not report_only:
+        print(f"\n[3/4] 就地重建 Vector DB 索引...")
         try:
             from vector_db import SemanticSearch
             search = SemanticSearch(db_path=str(db_full_path))
@@ -128,6 +246,7 @@ def sync_vector_db(parsed_dir: str, db_path: str, report_only: bool = False):
         "parsed_count": len(parsed_skills),
         "governance_count": len(gov_skills),
         "indexed_count": indexed_count,
+        "index_swap": swap,
         "governance_by_status": {k: len(v) for k, v in sorted(gov_by_status.items())},
         "coverage": {
             "in_both": len(in_both),
@@ -174,9 +293,14 @@ def main():
     parser.add_argument("--parsed-dir", default="parsed", help="Parsed 技能目錄")
     parser.add_argument("--db-path", default="skills.db", help="Vector DB 路徑")
     parser.add_argument("--report-only", action="store_true", help="只產出報告")
+    parser.add_argument(
+        "--in-place",
+        action="store_true",
+        help="清空後就地重建（重建期間搜尋結果不完整）",
+    )
     args = parser.parse_args()
 
-    sync_vector_db(args.parsed_dir, args.db_path, args.report_only)
+    sync_vector_db(args.parsed_dir, args.db_path, args.report_only, args.in_place)
 
 
 if __name__ == "__main__":
@@ -33,6 +33,7 @@ def test_asset_list_detail_and_revisions_are_read_only_projections(
     parsed.mkdir()
     _write_skill(parsed / "asset.json")
     monkeypatch.setenv("SKILL0_PARSED_DIR", str(parsed))
+    monkeypatch.delenv("SKILL0_ASSET_MANIFEST_PATH", raising=False)
     client = TestClient(api_module.app)
 
     listed = client.get("/api/assets")
@@ -61,6 +62,7 @@ def test_asset_list_detail_and_revisions_are_read_only_projections(
     assert revisions.status_code == 200
     assert len(revisions.json()) == 1
     assert revisions.json()[0]["payload"] is None
+    assert [item.name for item in tmp_path.iterdir()] == ["parsed"]
 
 
 def test_ambiguous_asset_lists_revisions_but_detail_fails_closed(tmp_path, monkeypatch):
@@ -157,3 +159,124 @@ def test_authenticated_reload_recovers_stale_snapshot_atomically(tmp_path, monke
     )
     assert fresh.status_code == 200
     assert fresh.json()["payload"]["meta"]["name"] == "asset-api-reloaded"
+
+
+def test_asset_listing_pages_by_cursor_and_honours_snapshot_etag(tmp_path, monkeypatch):
+    parsed = tmp_path / "parsed"
+    parsed.mkdir()
+    for suffix in ("c", "a", "b"):
+        _write_skill(parsed / f"{suffix}.json", name=suffix, skill_id=f"claude__skill__{suffix}")
+    monkeypatch.setenv("SKILL0_PARSED_DIR", str(parsed))
+    client = TestClient(api_module.app)
+
+    first = client.get("/api/assets", params={"limit": 2})
+    assert [item["asset_id"] for item in first.json()] == [
+        "claude__skill__a",
+        "claude__skill__b",
+    ]
+    etag = first.headers["ETag"]
+    second = client.get(
+        "/api/assets", params={"limit": 2, "cursor": first.headers["X-Next-Cursor"]}
+    )
+    assert [item["asset_id"] for item in second.json()] == ["claude__skill__c"]
+    assert "X-Next-Cursor" not in second.headers
+    assert client.get("/api/assets", params={"cursor": "%%%"}).status_code == 400
+
+    def untouched(*_args, **_kwargs):
+        raise AssertionError("304 must not read the repository")
+
+    repository = api_module.get_asset_repository()
+    monkeypatch.setattr(repository, "list_asset_summaries", untouched)
+    monkeypatch.setattr(repository, "list_asset_revisions", untouched)
+    assert client.get("/api/assets", headers={"If-None-Match": etag}).status_code == 304
+    not_modified = client.get(
+        "/api/assets/claude__skill__a/revisions",
+        headers={"If-None-Match": f"W/{etag}"},
+    )
+    assert not_modified.status_code == 304
+    assert not_modified.headers["ETag"] == etag
+
+
+def test_conditional_asset_reads_fail_closed_on_stale_snapshot(tmp_path, monkeypatch):
+    parsed = tmp_path / "parsed"
+    parsed.mkdir()
+    source = parsed / "asset.json"
+    _write_skill(source)
+    monkeypatch.setenv("SKILL0_PARSED_DIR", str(parsed))
+    client = TestClient(api_module.app)
+    etag = client.get("/api/assets").headers["ETag"]
+
+    _write_skill(source, name="asset-api-edited")
+    for url in ("/api/assets", "/api/assets/claude__skill__asset_api/revisions"):
+        conditional = client.get(url, headers={"If-None-Match": etag})
+        assert conditional.status_code == 409
+        assert conditional.json()["detail"]["code"] == "stale_source_snapshot"
+
+
+def test_asset_revisions_page_by_revision_cursor(tmp_path, monkeypatch):
+    parsed = tmp_path / "parsed"
+    parsed.mkdir()
+    _write_skill(parsed / "one.json", name="one")
+    _write_skill(parsed / "two.json", name="two")
+    monkeypatch.setenv("SKILL0_PARSED_DIR", str(parsed))
+    client = TestClient(api_module.app)
+    url = "/api/assets/claude__skill__asset_api/revisions"
+
+    first = client.get(url, params={"limit": 1})
+    second = client.get(url, params={"limit": 1, "cursor": first.headers["X-Next-Cursor"]})
+
+    assert len(first.json()) == len(second.json()) == 1
+    assert first.json()[0]["revision_id"] != second.json()[0]["revision_id"]
+    assert "X-Next-Cursor" not in second.headers
+    unknown = api_module._encode_cursor("asset-revision:sha256:" + "0" * 64)
+    assert client.get(url, params={"cursor": unknown}).status_code == 400
+
+
+def test_registry_backed_workers_follow_new_imports_without_reload(
+    root, tmp_path, monkeypatch
+):
+    from asset_registry.sqlite_repository import import_corpus
+
+    parsed = tmp_path / "parsed"
+    parsed.mkdir()
+    _write_skill(parsed / "asset.json", name="before")
+    registry = tmp_path / "registry.db"
+    import_corpus(registry, parsed, migration_dir=root / "migrations/registry")
+    monkeypatch.setenv("SKILL0_PARSED_DIR", str(parsed))
+    monkeypatch.setenv("SKILL0_ASSET_REGISTRY_DB", str(registry))
+    client = TestClient(api_module.app)
+
+    assert client.get("/api/assets").json()[0]["name"] == "before"
+    _write_skill(parsed / "asset.json", name="after")
+    assert client.get("/api/assets").json()[0]["name"] == "before"
+    import_corpus(registry, parsed, migration_dir=root / "migrations/registry")
+    assert client.get("/api/assets").json()[0]["name"] == "after"
+
+
+def test_asset_changes_report_delta_since_previous_snapshot(tmp_path, monkeypatch):
+    parsed = tmp_path / "parsed"
+    parsed.mkdir()
+    _write_skill(parsed / "asset.json")
+    _write_skill(parsed / "gone.json", skill_id="claude__skill__gone")
+    monkeypatch.setenv("SKILL0_PARSED_DIR", str(parsed))
+    client = TestClient(api_module.app)
+    token = api_module.create_access_token({"sub": "testadmin"})
+    headers = {"Authorization": f"Bearer {token}"}
+    before = client.post("/api/assets/reload", headers=headers).json()["snapshot_id"]
+
+    _write_skill(parsed / "asset.json", name="edited")
+    (parsed / "gone.json").unlink()
+    _write_skill(parsed / "new.json", skill_id="claude__skill__new")
+    after = client.post("/api/assets/reload", headers=headers).json()["snapshot_id"]
+    changes = client.get("/api/assets/changes", params={"since": before})
+
+    assert changes.status_code == 200
+    body = changes.json()
+    assert (body["from_snapshot_id"], body["to_snapshot_id"]) == (before, after)
+    assert [item["asset_id"] for item in body["added"]] == ["claude__skill__new"]
+    assert [item["asset_id"] for item in body["changed"]] == ["claude__skill__asset_api"]
+    assert [item["source_path"] for item in body["removed"]] == ["gone.json"]
+    assert client.get("/api/assets/changes", params={"since": after}).json()["changed"] == []
+    unknown = client.get("/api/assets/changes", params={"since": "sha256:unknown"})
+    assert unknown.status_code == 410
+    assert unknown.json()["detail"]["code"] == "snapshot_not_retained"
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
 import pytest
 
+from asset_registry.models import AssetRevision
 from asset_registry.repositories import (
     AssetIdentityAmbiguousError,
     AssetNotFoundError,
     AssetSnapshotBuildError,
     LegacySkillAssetRepository,
+    SkillParserAdapter,
+    SnapshotNotRetainedError,
     StaleSourceSnapshotError,
 )
 
@@ -173,3 +177,262 @@ def test_checked_in_corpus_disambiguates_canonical_ids_and_preserves_legacy_alia
     }
     with pytest.raises(AssetIdentityAmbiguousError):
         repository.get_revision("claude__skill__java_to_java_upgrade")
+
+
+class CountingAdapter(SkillParserAdapter):
+    def __init__(self):
+        self.adapted: list[tuple[str, str]] = []
+
+    def adapt(self, document, *, source_path, **kwargs):
+        self.adapted.append((source_path, kwargs.get("identity_strategy", "legacy_exact")))
+        return super().adapt(document, source_path=source_path, **kwargs)
+
+
+def test_incremental_rebuild_reparses_only_changed_files(tmp_path):
+    _write_skill(tmp_path / "one.json", "claude__skill__one")
+    _write_skill(tmp_path / "two.json", "claude__skill__two")
+    _write_skill(tmp_path / "10-a.json", "claude__skill__legacy", source_name="first")
+    _write_skill(tmp_path / "11-b.json", "claude__skill__legacy", source_name="second")
+    adapter = CountingAdapter()
+    previous = LegacySkillAssetRepository(tmp_path, adapter=adapter)
+    unchanged = previous.get_revision("claude__skill__one")
+    resolved = previous.list_asset_revisions("claude__skill__legacy")
+    adapter.adapted.clear()
+
+    _write_skill(tmp_path / "two.json", "claude__skill__two", name="edited-two")
+    _write_skill(tmp_path / "three.json", "claude__skill__three")
+    os.utime(tmp_path / "one.json", ns=(1, 1))
+    rebuilt = previous.rebuild()
+
+    assert sorted(adapter.adapted) == [
+        ("one.json", "legacy_exact"),
+        ("three.json", "legacy_exact"),
+        ("two.json", "legacy_exact"),
+    ]
+    full = LegacySkillAssetRepository(tmp_path)
+    assert rebuilt.snapshot_id == full.snapshot_id != previous.snapshot_id
+    assert rebuilt.get_revision("claude__skill__two").payload["meta"]["name"] == "edited-two"
+    assert all(
+        new is old
+        for new, old in zip(rebuilt.list_asset_revisions("claude__skill__legacy"), resolved)
+    )
+    assert rebuilt.get_revision("claude__skill__one") == unchanged
+
+
+def test_incremental_rebuild_reresolves_only_affected_collisions(tmp_path):
+    _write_skill(tmp_path / "10-a.json", "claude__skill__legacy", source_name="first")
+    _write_skill(tmp_path / "11-b.json", "claude__skill__legacy", source_name="second")
+    _write_skill(tmp_path / "one.json", "claude__skill__one")
+    adapter = CountingAdapter()
+    previous = LegacySkillAssetRepository(tmp_path, adapter=adapter)
+    adapter.adapted.clear()
+
+    _write_skill(tmp_path / "12-c.json", "claude__skill__legacy", source_name="third")
+    (tmp_path / "one.json").unlink()
+    rebuilt = previous.rebuild()
+
+    assert [strategy for _, strategy in adapter.adapted].count(
+        "source_name_disambiguation"
+    ) == 3
+    assert rebuilt.snapshot_id == LegacySkillAssetRepository(tmp_path).snapshot_id
+    assert len(rebuilt.list_asset_revisions("claude__skill__legacy")) == 3
+    with pytest.raises(AssetNotFoundError):
+        rebuilt.get_revision("claude__skill__one")
+    with pytest.raises(StaleSourceSnapshotError):
+        previous.list_revisions()
+
+
+def test_freshness_ttl_reuses_file_checks_but_stays_fail_closed(tmp_path, monkeypatch):
+    source = tmp_path / "one.json"
+    _write_skill(source, "claude__skill__one")
+    repository = LegacySkillAssetRepository(tmp_path, freshness_ttl_seconds=30)
+    stat_calls = []
+    original_stat = Path.stat
+
+    def counting_stat(self, *args, **kwargs):
+        stat_calls.append(self.name)
+        return original_stat(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "stat", counting_stat)
+    repository.get_revision("claude__skill__one")
+    assert stat_calls == [tmp_path.name]
+
+    _write_skill(source, "claude__skill__one", name="changed-name")
+    os.utime(source, ns=(1, 1))
+    repository.get_revision("claude__skill__one")
+    repository._verified_at -= 30
+    with pytest.raises(StaleSourceSnapshotError):
+        repository.get_revision("claude__skill__one")
+    _write_skill(source, "claude__skill__one")
+    os.utime(source, ns=(1, repository._file_stamps[0].modified_ns))
+    with pytest.raises(StaleSourceSnapshotError):
+        repository.list_revisions()
+    with pytest.raises(ValueError, match="must not be negative"):
+        LegacySkillAssetRepository(tmp_path, freshness_ttl_seconds=-1)
+
+
+def test_freshness_ttl_still_detects_added_files_immediately(tmp_path):
+    _write_skill(tmp_path / "one.json", "claude__skill__one")
+    repository = LegacySkillAssetRepository(tmp_path, freshness_ttl_seconds=30)
+    _write_skill(tmp_path / "two.json", "claude__skill__two")
+
+    with pytest.raises(StaleSourceSnapshotError):
+        repository.list_revisions()
+    assert repository.rebuild().freshness_ttl_seconds == 30
+
+
+def test_manifest_cold_start_parses_only_changed_files(tmp_path, monkeypatch):
+    corpus = tmp_path / "parsed"
+    corpus.mkdir()
+    manifest = tmp_path / "manifest.json"
+    _write_skill(corpus / "one.json", "claude__skill__one")
+    _write_skill(corpus / "two.json", "claude__skill__two")
+    _write_skill(corpus / "10-a.json", "claude__skill__legacy", source_name="first")
+    _write_skill(corpus / "11-b.json", "claude__skill__legacy", source_name="second")
+    written = LegacySkillAssetRepository(corpus, manifest_path=manifest)
+    assert manifest.is_file()
+    _write_skill(corpus / "two.json", "claude__skill__two", name="edited-two")
+
+    adapted = []
+    original_adapt = SkillParserAdapter.adapt
+
+    def counting_adapt(self, document, *, source_path, **kwargs):
+        adapted.append(source_path)
+        return original_adapt(self, document, source_path=source_path, **kwargs)
+
+    monkeypatch.setattr(SkillParserAdapter, "adapt", counting_adapt)
+    cold = LegacySkillAssetRepository(corpus, manifest_path=manifest)
+
+    assert adapted == ["two.json"]
+    assert cold.snapshot_id == LegacySkillAssetRepository(corpus).snapshot_id
+    assert cold.snapshot_id != written.snapshot_id
+    aliases = cold.list_asset_revisions("claude__skill__legacy")
+    assert {item.identity_strategy for item in aliases} == {"source_name_disambiguation"}
+    assert cold.get_revision("claude__skill__one").payload["meta"]["name"] == "fixture"
+    assert cold.get_revision("claude__skill__two").payload["meta"]["name"] == "edited-two"
+
+
+def test_manifest_payloads_fail_closed_and_bad_manifest_falls_back(tmp_path):
+    corpus = tmp_path / "parsed"
+    corpus.mkdir()
+    manifest = tmp_path / "manifest.json"
+    source = corpus / "one.json"
+    _write_skill(source, "claude__skill__one")
+    LegacySkillAssetRepository(corpus, manifest_path=manifest)
+    cold = LegacySkillAssetRepository(corpus, manifest_path=manifest)
+    stamp = source.stat()
+    source.write_text(source.read_text().replace("fixture", "fixturf"), encoding="utf-8")
+    os.utime(source, ns=(stamp.st_atime_ns, stamp.st_mtime_ns))
+
+    with pytest.raises(StaleSourceSnapshotError):
+        cold.get_revision("claude__skill__one").payload
+
+    document = json.loads(manifest.read_text(encoding="utf-8"))
+    document["snapshot_id"] = "sha256:" + "0" * 64
+    manifest.write_text(json.dumps(document), encoding="utf-8")
+    rebuilt = LegacySkillAssetRepository(corpus, manifest_path=manifest)
+    assert rebuilt.get_revision("claude__skill__one").payload["meta"]["name"] == "fixturf"
+    assert json.loads(manifest.read_text(encoding="utf-8"))["snapshot_id"] == rebuilt.snapshot_id
+
+    manifest.write_text("{", encoding="utf-8")
+    assert LegacySkillAssetRepository(corpus, manifest_path=manifest).snapshot_id == (
+        rebuilt.snapshot_id
+    )
+
+
+def test_process_pool_build_matches_serial_build_and_orders_diagnostics(tmp_path):
+    for index in range(40):
+        _write_skill(tmp_path / f"{index:02d}.json", f"claude__skill__item_{index:02d}")
+
+    parallel = LegacySkillAssetRepository(tmp_path, workers=2)
+
+    assert parallel.snapshot_id == LegacySkillAssetRepository(tmp_path).snapshot_id
+    assert parallel.get_revision("claude__skill__item_07").payload["meta"]["skill_id"] == (
+        "claude__skill__item_07"
+    )
+    (tmp_path / "39.json").write_text("{", encoding="utf-8")
+    (tmp_path / "03.json").write_text("[", encoding="utf-8")
+    with pytest.raises(AssetSnapshotBuildError) as error:
+        LegacySkillAssetRepository(tmp_path, workers=2)
+    assert [item.path for item in error.value.diagnostics] == ["03.json", "39.json"]
+    with pytest.raises(ValueError, match="workers"):
+        LegacySkillAssetRepository(tmp_path, workers=0)
+
+
+def test_metadata_only_repository_serves_payloads_through_bounded_lru(tmp_path):
+    for index in range(3):
+        _write_skill(tmp_path / f"{index}.json", f"claude__skill__item_{index}")
+    _write_skill(tmp_path / "10-a.json", "claude__skill__legacy", source_name="first")
+    _write_skill(tmp_path / "11-b.json", "claude__skill__legacy", source_name="second")
+    resident = LegacySkillAssetRepository(tmp_path)
+    lean = LegacySkillAssetRepository(tmp_path, payload_cache_size=2)
+
+    assert lean.snapshot_id == resident.snapshot_id
+    assert [item.name for item in lean.list_revisions()] == [
+        item.name for item in resident.list_revisions()
+    ]
+    for item in lean.list_revisions():
+        assert item.payload == resident.get_revision(item.asset_id).payload
+    assert len(lean._payload_cache) == 2
+    assert lean.rebuild()._payload_cache is lean._payload_cache
+
+    source = tmp_path / "0.json"
+    stamp = source.stat()
+    source.write_text(source.read_text().replace("fixture", "fixturf"), encoding="utf-8")
+    os.utime(source, ns=(stamp.st_atime_ns, stamp.st_mtime_ns))
+    with pytest.raises(StaleSourceSnapshotError):
+        lean.get_revision("claude__skill__item_0").payload
+    with pytest.raises(ValueError, match="payload_cache_size"):
+        LegacySkillAssetRepository(tmp_path, payload_cache_size=0)
+
+
+def test_snapshot_history_is_bounded_and_diffs_across_rebuilds(tmp_path):
+    _write_skill(tmp_path / "one.json", "claude__skill__one")
+    first = LegacySkillAssetRepository(tmp_path, snapshot_history_size=2)
+    _write_skill(tmp_path / "two.json", "claude__skill__two")
+    second = first.rebuild()
+    _write_skill(tmp_path / "one.json", "claude__skill__one", name="edited")
+    third = second.rebuild()
+
+    delta = third.diff(second.snapshot_id)
+    assert delta.added == ()
+    assert [item.asset_id for item in delta.changed] == ["claude__skill__one"]
+    assert third.diff(third.snapshot_id).changed == ()
+    with pytest.raises(SnapshotNotRetainedError):
+        third.diff(first.snapshot_id)
+
+
+def test_asset_revision_accepts_an_eager_payload_and_derives_metadata():
+    payload = {
+        "meta": {
+            "name": "fixture",
+            "description": "repository fixture",
+            "parsed_by": "repository-test",
+            "schema_version": "2.4.0",
+        }
+    }
+
+    revision = AssetRevision(
+        "claude__skill__one",
+        "rev",
+        "skill",
+        "sha256:content",
+        "sha256:source",
+        Path("one.json"),
+        payload,
+        "claude__skill__one",
+        "legacy_exact",
+    )
+
+    assert revision.payload is payload
+    assert (revision.name, revision.summary) == ("fixture", "repository fixture")
+    assert (revision.parser_id, revision.parser_version) == ("repository-test", "2.4.0")
+    loads = []
+    lazy = revision.with_changes(
+        payload=None, payload_loader=lambda: loads.append(1) or payload
+    )
+    assert loads == []
+    assert lazy.with_changes(asset_id="claude__skill__two").payload is payload
+    assert loads == [1]
+    with pytest.raises(TypeError, match="payload or a payload_loader"):
+        revision.with_changes(payload=None)
@@ -34,7 +34,11 @@ def test_fresh_current_and_legacy_fixtures_converge(root, tmp_path):
     database = tmp_path / "legacy.db"
     _legacy_index(database)
     with connect_sqlite(database, policy=INDEX_POLICY, mode="maintenance") as connection:
-        assert apply_migrations(connection, migrations) == ("001_asset_index_state",)
+        assert apply_migrations(connection, migrations) == (
+            "001_asset_index_state",
+            "002_embedding_projection",
+            "002_index_representations",
+        )
         assert apply_migrations(connection, migrations) == ()
         assert {item.state for item in preview_migrations(connection, migrations)} == {"applied"}
         tables = {
@@ -43,7 +47,12 @@ def test_fresh_current_and_legacy_fixtures_converge(root, tmp_path):
                 "SELECT name FROM sqlite_master WHERE type='table'"
             )
         }
-    assert {"skills", "schema_migrations", "asset_index_state"} <= tables
+    assert {
+        "skills",
+        "schema_migrations",
+        "asset_index_state",
+        "embedding_projection",
+    } <= tables
 
 
 def test_edited_migration_checksum_fails_closed(root, tmp_path):
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 from threading import Event
 from threading import Lock, RLock
 import time
@@ -8,10 +9,17 @@ from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager, nullcontext
 
 import numpy as np
+from prometheus_client import REGISTRY
 
 import pytest
 
-from asset_registry.search import BoundedSearchExecutor, SearchOverloadedError
+from asset_registry.search import (
+    BoundedSearchExecutor,
+    SearchClassPolicy,
+    SearchOverloadedError,
+    collect_search_stages,
+    search_stage,
+)
 import api.main as api_module
 from vector_db.search import SemanticSearch
 
@@ -102,6 +110,9 @@ def test_api_search_similar_cluster_and_index_share_operation_lock(monkeypatch):
     class FakeStore:
         dimension = 384
 
+        def is_swapped(self):
+            return False
+
         def search(self, embedding, limit=5):
             del embedding
             with tracker.operation():
@@ -147,3 +158,226 @@ def test_api_search_similar_cluster_and_index_share_operation_lock(monkeypatch):
             future.result(timeout=30)
 
     assert tracker.maximum == 1
+
+
+def test_search_stages_are_observed_per_endpoint_and_backend(monkeypatch):
+    class FakeEmbedder:
+        dimension = 384
+
+        def embed_query(self, query):
+            del query
+            return np.zeros(384, dtype=np.float32)
+
+    class FakeStore:
+        dimension = 384
+
+        def is_swapped(self):
+            return False
+
+        def search(self, embedding, limit=5):
+            del embedding
+            return [
+                {"id": 1, "name": "one", "filename": "one.json", "distance": 0.0}
+            ][:limit]
+
+    engine = object.__new__(SemanticSearch)
+    engine.model_name = "fixture"
+    engine.dimension = 384
+    engine._embedder = FakeEmbedder()
+    engine._operation_lock = RLock()
+    engine.store = FakeStore()
+    engine.open_unit_of_work = lambda: nullcontext(engine)
+    monkeypatch.setattr(api_module, "search_engine", engine)
+
+    class SlowAdapter:
+        def __init__(self, adapter):
+            self.adapter = adapter
+
+        def dump_json(self, content):
+            time.sleep(0.02)
+            return self.adapter.dump_json(content)
+
+    adapter = api_module._response_adapter
+    monkeypatch.setattr(
+        api_module, "_response_adapter", lambda model: SlowAdapter(adapter(model))
+    )
+
+    def sample(stage, suffix="count"):
+        return REGISTRY.get_sample_value(
+            f"skill0_search_stage_duration_seconds_{suffix}",
+            {"endpoint": "/api/search", "backend": "sqlite-vec", "stage": stage},
+        ) or 0.0
+
+    stages = ("queue_wait", "embed", "vector_query", "serialize")
+    before = {stage: sample(stage) for stage in stages}
+    serialized_before = sample("serialize", "sum")
+
+    response = asyncio.run(
+        api_module.search_skills(api_module.SearchRequest(query="one", limit=1))
+    )
+
+    assert json.loads(response.body)["count"] == 1
+    assert {stage: sample(stage) - before[stage] for stage in stages} == {
+        stage: 1 for stage in stages
+    }
+    assert sample("serialize", "sum") - serialized_before >= 0.02
+
+
+def test_stage_collection_is_free_outside_a_collector_and_crosses_the_executor():
+    with search_stage("embed"):
+        pass
+
+    async def scenario():
+        executor = BoundedSearchExecutor(max_workers=1, queue_capacity=1)
+
+        def work():
+            with search_stage("embed"):
+                time.sleep(0.01)
+            return "done"
+
+        with collect_search_stages() as stages:
+            assert await executor.run(work) == "done"
+        executor.shutdown()
+        return stages
+
+    stages = asyncio.run(scenario())
+    assert set(stages) == {"queue_wait", "embed"}
+    assert stages["embed"] >= 0.01
+
+
+def test_admitted_work_waits_for_a_worker_past_the_acquire_timeout():
+    async def scenario():
+        executor = BoundedSearchExecutor()
+
+        def job():
+            time.sleep(0.5)
+            return "ok"
+
+        results = await asyncio.gather(
+            *(executor.run(job) for _ in range(3)), return_exceptions=True
+        )
+        executor.shutdown()
+        return results
+
+    assert asyncio.run(scenario()) == ["ok", "ok", "ok"]
+
+
+def test_full_queue_waits_for_a_slot_until_the_acquire_timeout():
+    async def scenario():
+        executor = BoundedSearchExecutor(
+            max_workers=1, queue_capacity=1, acquire_timeout_seconds=0.5
+        )
+
+        def job():
+            time.sleep(0.1)
+            return "ok"
+
+        results = await asyncio.gather(
+            *(executor.run(job) for _ in range(3)), return_exceptions=True
+        )
+        executor.shutdown()
+        return results
+
+    assert asyncio.run(scenario()) == ["ok", "ok", "ok"]
+
+
+def test_search_classes_isolate_slow_work_and_count_rejections():
+    async def scenario():
+        executor = BoundedSearchExecutor(
+            classes={
+                "interactive": SearchClassPolicy(max_workers=1, queue_capacity=1),
+                "analytics": SearchClassPolicy(max_workers=1, queue_capacity=1),
+            }
+        )
+        release = Event()
+
+        def slow_job():
+            release.wait(timeout=2)
+            return "slow"
+
+        analytics = [
+            asyncio.create_task(executor.run(slow_job, search_class="analytics"))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0.05)
+        with pytest.raises(SearchOverloadedError) as rejected:
+            await executor.run(slow_job, search_class="analytics")
+        assert (rejected.value.search_class, rejected.value.reason) == (
+            "analytics",
+            "queue_full",
+        )
+
+        assert await executor.run(lambda: "fast") == "fast"
+        stats = executor.stats()
+        assert stats["analytics"]["queue_depth"] == 1
+        assert stats["analytics"]["rejections"] == {"queue_full": 1}
+        assert stats["interactive"]["rejections"] == {}
+        with pytest.raises(ValueError, match="unknown search class"):
+            await executor.run(slow_job, search_class="bulk")
+
+        release.set()
+        assert await asyncio.gather(*analytics) == ["slow", "slow"]
+        executor.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_adaptive_limit_halves_once_per_latency_window():
+    async def scenario():
+        executor = BoundedSearchExecutor(
+            classes={
+                "interactive": SearchClassPolicy(
+                    max_workers=4, queue_capacity=4, target_latency_seconds=0.01
+                )
+            }
+        )
+
+        def slow_search():
+            time.sleep(0.03)
+            return "done"
+
+        await asyncio.gather(*(executor.run(slow_search) for _ in range(4)))
+        await asyncio.sleep(0)
+        assert executor.stats()["interactive"]["concurrency_limit"] == 2
+
+        assert await executor.run(slow_search) == "done"
+        await asyncio.sleep(0)
+        assert executor.stats()["interactive"]["concurrency_limit"] == 1
+        executor.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_adaptive_limit_backs_off_and_deadline_sheds_queued_work():
+    async def scenario():
+        executor = BoundedSearchExecutor(
+            classes={
+                "interactive": SearchClassPolicy(
+                    max_workers=4,
+                    queue_capacity=4,
+                    target_latency_seconds=0.01,
+                    deadline_seconds=0.04,
+                )
+            }
+        )
+
+        def slow_search():
+            time.sleep(0.03)
+            return "done"
+
+        assert await executor.run(slow_search) == "done"
+        await asyncio.sleep(0)
+        assert executor.stats()["interactive"]["concurrency_limit"] == 2
+
+        running = [asyncio.create_task(executor.run(slow_search)) for _ in range(2)]
+        await asyncio.sleep(0)
+        with pytest.raises(SearchOverloadedError) as shed:
+            await executor.run(slow_search)
+        assert shed.value.reason == "deadline"
+        assert await executor.run(lambda: "late", deadline_seconds=1.0) == "late"
+
+        await asyncio.gather(*running)
+        assert executor.stats()["interactive"]["rejections"] == {"deadline": 1}
+        executor.shutdown()
+
+    asyncio.run(scenario())
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from asset_registry.corpus_pack import (
+    CorpusPack,
+    CorpusPackError,
+    CorpusReader,
+    build_pack,
+    default_pack_path,
+)
+from tools.report_db_identity_drift import load_parsed_skills
+
+
+def _write_skill(path, skill_id, description="pack fixture"):
+    document = {
+        "meta": {"skill_id": skill_id, "name": path.stem, "description": description},
+        "decomposition": {"actions": [], "rules": [], "directives": []},
+    }
+    path.write_text(json.dumps(document, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+def test_checked_in_corpus_pack_round_trips_every_document(root, tmp_path):
+    pack_path = tmp_path / "parsed.pack"
+    result = build_pack(root / "parsed", pack_path)
+
+    with CorpusPack(pack_path) as pack:
+        assert pack.verify()["documents"] == result["documents"] == 196
+        assert pack.matches(root / "parsed")
+    with CorpusReader(root / "parsed", pack_path=pack_path) as corpus:
+        assert corpus.pack is not None
+        paths = corpus.paths()
+        assert paths == sorted((root / "parsed").glob("*.json"))
+        for path in paths[:20]:
+            assert corpus.load(path) == json.loads(path.read_text(encoding="utf-8"))
+
+
+def test_reader_ignores_stale_pack_and_uses_the_directory(tmp_path):
+    corpus = tmp_path / "parsed"
+    corpus.mkdir()
+    _write_skill(corpus / "one-skill.json", "claude__skill__one")
+    _write_skill(corpus / "two-skill.json", "claude__skill__two")
+    build_pack(corpus)
+    assert default_pack_path(corpus).is_file()
+    with CorpusReader(corpus) as reader:
+        assert reader.pack is not None
+
+    _write_skill(corpus / "two-skill.json", "claude__skill__two", description="édited")
+    os.utime(corpus / "two-skill.json", ns=(1, 1))
+    with CorpusReader(corpus) as reader:
+        assert reader.pack is None
+        assert reader.load(corpus / "two-skill.json")["meta"]["description"] == "édited"
+    assert [item.skill_id for item in load_parsed_skills(corpus)] == [
+        "claude__skill__one",
+        "claude__skill__two",
+    ]
+
+
+def test_corrupted_pack_fails_checksums(tmp_path):
+    corpus = tmp_path / "parsed"
+    corpus.mkdir()
+    _write_skill(corpus / "one-skill.json", "claude__skill__one")
+    pack_path = tmp_path / "parsed.pack"
+    build_pack(corpus, pack_path)
+    data = bytearray(pack_path.read_bytes())
+    entry_offset = data.index(b"claude__skill__one")
+    data[entry_offset] = ord("C")
+    pack_path.write_bytes(bytes(data))
+
+    with CorpusPack(pack_path) as pack:
+        with pytest.raises(CorpusPackError, match="corrupt pack body"):
+            pack.verify()
+        with pytest.raises(CorpusPackError, match="corrupt pack document"):
+            pack.load("one-skill.json")
+    pack_path.write_bytes(bytes(data[:-1]))
+    with pytest.raises(CorpusPackError, match="trailer"):
+        CorpusPack(pack_path)
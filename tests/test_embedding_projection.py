@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import hashlib
+import json
+
+import numpy as np
+import pytest
+
+pytest.importorskip("sqlite_vec")
+
+from asset_registry.sqlite import apply_migrations, load_migrations
+from vector_db.projection import EmbeddingProjection, build_reduced_index
+from vector_db.search import REPRESENTATION_VERSION, SemanticSearch
+from vector_db.vector_store import VectorStore
+
+
+def _vector(text: str) -> np.ndarray:
+    seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "big")
+    return np.random.default_rng(seed).standard_normal(384).astype(np.float32)
+
+
+class TextHashEmbedder:
+    dimension = 384
+
+    def __init__(self):
+        self.embedded = 0
+
+    def embed_skills(self, skills, show_progress=True):
+        del show_progress
+        self.embedded += len(skills)
+        return [_vector(skill["meta"]["description"]) for skill in skills]
+
+    def embed_query(self, query):
+        return _vector(query)
+
+
+def _write_skill(path, skill_id, description):
+    document = {
+        "meta": {
+            "skill_id": skill_id,
+            "name": path.stem,
+            "description": description,
+            "schema_version": "2.4.0",
+            "parsed_by": "projection-test",
+            "parser_version": "1.0.0",
+        },
+        "decomposition": {"actions": [], "rules": [], "directives": []},
+    }
+    path.write_text(json.dumps(document), encoding="utf-8")
+
+
+@pytest.fixture
+def full_index(root, tmp_path, monkeypatch):
+    monkeypatch.setenv("SKILL0_EMBEDDING_MODEL_VERSION", "fixture-v1")
+    monkeypatch.setenv("SKILL0_EMBEDDING_MODEL", "fixture-model")
+    embedder = TextHashEmbedder()
+    monkeypatch.setattr(SemanticSearch, "embedder", property(lambda self: embedder))
+    parsed_dir = tmp_path / "parsed"
+    parsed_dir.mkdir()
+    for name in ("alpha", "beta", "gamma"):
+        _write_skill(parsed_dir / f"{name}-skill.json", f"claude__skill__{name}", name)
+    database = tmp_path / "skills.db"
+    with SemanticSearch(database) as search:
+        apply_migrations(search.store.conn, load_migrations(root / "migrations/index"))
+        search.index_assets(parsed_dir, show_progress=False)
+    return database, parsed_dir, embedder
+
+
+def test_pca_fit_is_deterministic_and_requires_enough_vectors():
+    vectors = np.stack([_vector(str(index)) for index in range(8)])
+
+    first = EmbeddingProjection.fit(vectors, 4)
+    second = EmbeddingProjection.fit(vectors[::-1], 4)
+
+    assert first.digest == second.digest
+    assert first.project(vectors).shape == (8, 4)
+    assert first.project(vectors[0]).shape == (4,)
+    assert 0 < first.retained_variance <= 1
+    assert first.representation_version(REPRESENTATION_VERSION).startswith(
+        REPRESENTATION_VERSION + "+pca4-"
+    )
+    with pytest.raises(ValueError, match="at least 16 vectors"):
+        EmbeddingProjection.fit(vectors, 16)
+
+
+def test_matryoshka_truncates_and_renormalizes():
+    vectors = np.stack([_vector(str(index)) for index in range(2)])
+    projection = EmbeddingProjection.fit(vectors, 192, method="matryoshka")
+
+    projected = projection.project(vectors)
+
+    assert projected.shape == (2, 192)
+    np.testing.assert_allclose(np.linalg.norm(projected, axis=1), 1.0, rtol=1e-5)
+
+
+def test_reduced_index_persists_projection_and_projects_queries(full_index, tmp_path):
+    database, _parsed_dir, _embedder = full_index
+    reduced = tmp_path / "skills-pca2.db"
+
+    result = build_reduced_index(database, reduced, dimension=2)
+
+    assert result["rows"] == 3
+    assert result["integrity"] == "ok"
+    with SemanticSearch(reduced, initialize_schema=False) as search:
+        assert search.store.dimension == 2
+        assert search.projection.digest == result["projection_digest"]
+        assert {row["representation_version"] for row in search.store.get_index_state()} == {
+            result["representation_version"]
+        }
+        top = search.search_assets("beta", limit=1)[0]
+        assert top.asset_id.endswith("beta")
+        assert top.distance == pytest.approx(0.0, abs=1e-4)
+
+
+def test_reduced_index_reindexes_incrementally_with_stored_projection(
+    full_index, tmp_path
+):
+    database, parsed_dir, embedder = full_index
+    reduced = tmp_path / "skills-pca2.db"
+    build_reduced_index(database, reduced, dimension=2)
+    _write_skill(parsed_dir / "gamma-skill.json", "claude__skill__gamma", "edited")
+    embedded_before = embedder.embedded
+
+    with SemanticSearch(reduced, initialize_schema=False) as search:
+        digest = search.projection.digest
+        report = search.index_assets(parsed_dir, show_progress=False)
+        assert (report.changed, report.unchanged) == (1, 2)
+        assert embedder.embedded == embedded_before + 1
+        assert search.projection.digest == digest
+    with VectorStore(reduced, initialize_schema=False) as store:
+        assert store.projection.digest == digest
+        assert all(vector.shape == (2,) for vector in store.get_indexed_embeddings().values())
+
+
+def test_source_index_cannot_be_reduced_twice(full_index, tmp_path):
+    database, _parsed_dir, _embedder = full_index
+    reduced = tmp_path / "skills-pca2.db"
+    build_reduced_index(database, reduced, dimension=2)
+
+    with pytest.raises(RuntimeError, match="already a reduced representation"):
+        build_reduced_index(reduced, tmp_path / "again.db", dimension=1)
+    assert not (tmp_path / "again.db").exists()
+
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+
 from jsonschema import Draft202012Validator, FormatChecker
 import pytest
 
@@ -308,3 +310,96 @@ def test_run_evidence_rejects_event_after_final_terminal():
     ]
     with pytest.raises(ValueError, match="after final terminal"):
         build_run_evidence(events, run=run)
+
+
+def test_evidence_summary_streams_paged_events_in_any_order(tmp_path):
+    with RuntimeLedger(tmp_path / "ledger.db") as ledger:
+        for reason in (None, "validation mismatch", None):
+            run_id = ledger.create_run(skill_name="demo", skill_version="1")
+            event_type = (
+                RuntimeEventType.RUN_SUCCEEDED if reason is None else RuntimeEventType.RUN_FAILED
+            )
+            ledger.append_event(_event(run_id, event_type, reason=reason))
+        listed = ledger.list_events_for_skill("demo", "1")
+        expected = build_evidence_summary(listed, skill_name="demo", skill_version="1")
+        streamed = build_evidence_summary(
+            ledger.iter_events_for_skill("demo", "1", page_size=1),
+            skill_name="demo",
+            skill_version="1",
+        )
+    assert streamed == expected
+    assert build_evidence_summary(
+        reversed(listed), skill_name="demo", skill_version="1"
+    ) == expected
+    assert expected["source_event_watermark"] == 6
+    assert expected["counts"]["succeeded"] == 2 and expected["counts"]["failed"] == 1
+
+
+def test_maintained_skill_evidence_matches_recomputation_after_every_append(tmp_path):
+    with RuntimeLedger(tmp_path / "ledger.db") as ledger:
+        def assert_current():
+            assert ledger.get_skill_evidence("demo", "1") == build_evidence_summary(
+                ledger.iter_events_for_skill("demo", "1"),
+                skill_name="demo",
+                skill_version="1",
+            )
+
+        compensated = ledger.create_run(skill_name="demo", skill_version="1")
+        assert_current()
+        for event_type in (
+            RuntimeEventType.RUN_SUCCEEDED,
+            RuntimeEventType.COMPENSATION_QUEUED,
+            RuntimeEventType.RUN_COMPENSATED,
+        ):
+            ledger.append_event(_event(compensated, event_type))
+            assert_current()
+        failed = ledger.create_run(skill_name="demo", skill_version="1")
+        ledger.append_event(_event(failed, RuntimeEventType.RUN_FAILED, reason="boom"))
+        assert_current()
+        ledger.create_run(skill_name="demo", skill_version="2")
+        assert_current()
+
+        summary = ledger.get_skill_evidence("demo", "1")
+        assert summary["counts"]["compensated"] == 1
+        assert summary["counts"]["failed"] == 1
+        assert summary["counts"]["succeeded"] == 0
+        assert summary["known_failure_patterns"] == ["run_failed"]
+        assert ledger.get_skill_evidence("demo", "2")["source_event_watermark"] == 1
+        assert ledger.get_skill_evidence("other", "1") is None
+
+
+def test_rebuild_reports_and_repairs_projection_drift(tmp_path, capsys):
+    database = tmp_path / "ledger.db"
+    with RuntimeLedger(database) as ledger:
+        run_id = ledger.create_run(skill_name="demo", skill_version="1")
+        ledger.append_event(_event(run_id, RuntimeEventType.RUN_SUCCEEDED))
+        expected = ledger.get_skill_evidence("demo", "1")
+        assert [item["matched"] for item in ledger.rebuild_skill_evidence()] == [True]
+
+        ledger.connection.execute(
+            "UPDATE runtime_skill_evidence SET source_event_watermark=99"
+        )
+        (report,) = ledger.rebuild_skill_evidence("demo", "1")
+        assert report == {
+            "skill_name": "demo",
+            "skill_version": "1",
+            "source_event_watermark": 2,
+            "matched": False,
+        }
+        assert ledger.get_skill_evidence("demo", "1") == expected
+
+        # A ledger written before the projection existed is backfilled once.
+        ledger.connection.execute("DELETE FROM runtime_run_evidence")
+        ledger.connection.execute("DELETE FROM runtime_skill_evidence")
+        ledger.connection.execute("PRAGMA user_version=2")
+    with RuntimeLedger(database) as ledger:
+        assert ledger.get_skill_evidence("demo", "1") == expected
+        ledger.connection.execute("UPDATE runtime_run_evidence SET outcome='failed'")
+
+    from scripts.runtime_evidence import main
+
+    assert main(["--db", str(database), "--rebuild-projection"]) == 1
+    assert main(["--db", str(database), "--rebuild-projection"]) == 0
+    capsys.readouterr()
+    assert main(["--db", str(database), "--skill-name", "demo", "--skill-version", "1"]) == 0
+    assert json.loads(capsys.readouterr().out) == expected
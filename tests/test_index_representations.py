@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pytest.importorskip("sqlite_vec")
+
+from asset_registry.sqlite import apply_migrations, load_migrations
+from scripts.sync_vector_db import build_shadow_index
+from tools.runtime_asset_drift_doctor import build_doctor_report
+from tools.runtime_asset_index_maintenance import (
+    build_representation,
+    collect_representations,
+    cutover_representation,
+    list_representations,
+)
+from vector_db.search import SemanticSearch
+from vector_db.vector_store import VectorStore
+
+
+class FixtureEmbedder:
+    dimension = 384
+
+    def __init__(self):
+        self.embedded = 0
+
+    def embed_skills(self, skills, show_progress=True):
+        del show_progress
+        self.embedded += len(skills)
+        return [np.full(self.dimension, 0.25, dtype=np.float32) for _ in skills]
+
+    def embed_query(self, query):
+        del query
+        return np.full(self.dimension, 0.25, dtype=np.float32)
+
+
+def _write_skill(path, skill_id, description="representation fixture"):
+    document = {
+        "meta": {
+            "skill_id": skill_id,
+            "name": path.stem,
+            "description": description,
+            "schema_version": "2.4.0",
+            "parsed_by": "representation-test",
+            "parser_version": "1.0.0",
+        },
+        "decomposition": {"actions": [], "rules": [], "directives": []},
+    }
+    path.write_text(json.dumps(document), encoding="utf-8")
+
+
+@pytest.fixture
+def serving_index(root, tmp_path, monkeypatch):
+    monkeypatch.setenv("SKILL0_EMBEDDING_MODEL_VERSION", "fixture-v1")
+    monkeypatch.setenv("SKILL0_EMBEDDING_MODEL", "fixture-model")
+    monkeypatch.delenv("SKILL0_INDEX_REPRESENTATION", raising=False)
+    embedder = FixtureEmbedder()
+    monkeypatch.setattr(SemanticSearch, "embedder", property(lambda self: embedder))
+    parsed_dir = tmp_path / "parsed"
+    parsed_dir.mkdir()
+    _write_skill(parsed_dir / "one-skill.json", "claude__skill__one")
+    _write_skill(parsed_dir / "two-skill.json", "claude__skill__two")
+    database = tmp_path / "skills.db"
+    with SemanticSearch(database) as search:
+        apply_migrations(search.store.conn, load_migrations(root / "migrations/index"))
+        search.index_assets(parsed_dir, show_progress=False)
+    return database, parsed_dir, root / "migrations/index"
+
+
+def _build_v2(database, parsed_dir, migration_dir):
+    return build_representation(
+        index_db=database,
+        parsed_dir=parsed_dir,
+        migration_dir=migration_dir,
+        name="minilm-v2",
+        model_name="fixture-model-v2",
+        model_version="fixture-v2",
+    )
+
+
+def test_new_representation_builds_beside_the_serving_default(serving_index):
+    database, parsed_dir, migration_dir = serving_index
+
+    result = _build_v2(database, parsed_dir, migration_dir)
+
+    assert result["report"]["changed"] == 2
+    assert result["default"] == "primary"
+    by_name = {item["name"]: item for item in result["representations"]}
+    assert by_name["primary"]["rows"] == 2
+    assert by_name["minilm-v2"]["status"] == "ready"
+    assert by_name["minilm-v2"]["rows"] == 2
+    with SemanticSearch(database, initialize_schema=False) as search:
+        assert search.store.representation == "primary"
+        assert search.model_name == "fixture-model"
+        assert len(search.search_assets("fixture")) == 2
+    with VectorStore(database, initialize_schema=False, representation="minilm-v2") as store:
+        assert {row["embedding_model_version"] for row in store.get_index_state()} == {
+            "fixture-v2"
+        }
+
+
+def test_building_a_representation_leaves_serving_metadata_untouched(serving_index):
+    database, parsed_dir, migration_dir = serving_index
+    _write_skill(parsed_dir / "one-skill.json", "claude__skill__one", "rewritten fixture")
+
+    _build_v2(database, parsed_dir, migration_dir)
+
+    with SemanticSearch(database, initialize_schema=False) as search:
+        assert {item.description for item in search.search_assets("fixture")} == {
+            "representation fixture"
+        }
+    with SemanticSearch(
+        database, initialize_schema=False, representation="minilm-v2"
+    ) as search:
+        assert sorted(item.description for item in search.search_assets("fixture")) == [
+            "representation fixture",
+            "rewritten fixture",
+        ]
+    with VectorStore(database, initialize_schema=False) as store:
+        assert store.conn.execute("SELECT COUNT(*) FROM skills").fetchone()[0] == 3
+        assert store.get_statistics()["total_skills"] == 2
+        assert {item["description"] for item in store.get_all_skills()} == {
+            "representation fixture"
+        }
+    with VectorStore(database, initialize_schema=False, representation="minilm-v2") as store:
+        assert store.get_statistics()["total_skills"] == 2
+        assert sorted(item["description"] for item in store.get_all_skills()) == [
+            "representation fixture",
+            "rewritten fixture",
+        ]
+
+    cutover_representation(
+        index_db=database,
+        parsed_dir=parsed_dir,
+        migration_dir=migration_dir,
+        name="minilm-v2",
+    )
+    collect_representations(database, migration_dir)
+
+    with VectorStore(database, initialize_schema=False) as store:
+        rows = store.conn.execute("SELECT filename, description FROM skills").fetchall()
+        assert sorted((Path(row[0]).name, row[1]) for row in rows) == [
+            ("one-skill.json", "rewritten fixture"),
+            ("two-skill.json", "representation fixture"),
+        ]
+
+
+def test_cutover_requires_complete_representation_then_readers_follow(serving_index):
+    database, parsed_dir, migration_dir = serving_index
+    _build_v2(database, parsed_dir, migration_dir)
+    _write_skill(parsed_dir / "three-skill.json", "claude__skill__three")
+
+    with pytest.raises(RuntimeError, match="incomplete: missing=1,extra=0"):
+        cutover_representation(
+            index_db=database,
+            parsed_dir=parsed_dir,
+            migration_dir=migration_dir,
+            name="minilm-v2",
+        )
+    _build_v2(database, parsed_dir, migration_dir)
+    with SemanticSearch(database, initialize_schema=False) as long_lived:
+        flipped = cutover_representation(
+            index_db=database,
+            parsed_dir=parsed_dir,
+            migration_dir=migration_dir,
+            name="minilm-v2",
+        )
+        assert (flipped["previous"], flipped["current"]) == ("primary", "minilm-v2")
+        retired = {item["name"]: item for item in list_representations(
+            database, migration_dir
+        )["representations"]}["primary"]
+        assert retired["embedding_model_name"] is None
+        with long_lived.open_unit_of_work() as unit:
+            assert unit.store.representation == "minilm-v2"
+            assert len(unit.search_assets("fixture")) == 3
+        assert long_lived.model_name == "fixture-model-v2"
+
+
+def test_pinned_representation_and_garbage_collection(serving_index, monkeypatch):
+    database, parsed_dir, migration_dir = serving_index
+    _build_v2(database, parsed_dir, migration_dir)
+    cutover_representation(
+        index_db=database,
+        parsed_dir=parsed_dir,
+        migration_dir=migration_dir,
+        name="minilm-v2",
+    )
+    monkeypatch.setenv("SKILL0_INDEX_REPRESENTATION", "primary")
+    with SemanticSearch(database, initialize_schema=False) as pinned:
+        assert pinned.store.representation == "primary"
+        assert len(pinned.search_assets("fixture")) == 2
+    monkeypatch.delenv("SKILL0_INDEX_REPRESENTATION")
+
+    result = collect_representations(database, migration_dir)
+
+    assert result["dropped"] == ["primary"]
+    assert result["default"] == "minilm-v2"
+    with VectorStore(database, initialize_schema=False, representation="primary") as store:
+        assert store.get_index_state() == []
+        assert store.conn.execute("SELECT COUNT(*) FROM skill_embeddings").fetchone()[0] == 0
+    report = build_doctor_report(
+        parsed_dir=parsed_dir,
+        index_db=database,
+        governance_db=database.with_name("missing-governance.db"),
+        migration_dir=migration_dir,
+    )
+    assert report["counts"]["index_rows"] == 2
+    assert report["findings"]["pending_projection"] == []
+
+
+def test_shadow_rebuild_keeps_named_default_and_refuses_pending_builds(
+    serving_index, monkeypatch
+):
+    database, parsed_dir, migration_dir = serving_index
+    _build_v2(database, parsed_dir, migration_dir)
+
+    with pytest.raises(RuntimeError, match="minilm-v2"):
+        build_shadow_index(parsed_dir, database, migration_dir)
+
+    cutover_representation(
+        index_db=database,
+        parsed_dir=parsed_dir,
+        migration_dir=migration_dir,
+        name="minilm-v2",
+    )
+    monkeypatch.setenv("SKILL0_EMBEDDING_MODEL_VERSION", "fixture-v2")
+    result = build_shadow_index(parsed_dir, database, migration_dir)
+
+    assert result["reused_embeddings"] == 2
+    listed = list_representations(database, migration_dir)
+    assert listed["default"] == "minilm-v2"
+    assert [item["name"] for item in listed["representations"] if item["rows"]] == [
+        "minilm-v2"
+    ]
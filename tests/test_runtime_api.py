@@ -9,7 +9,12 @@ from fastapi.testclient import TestClient
 import pytest
 
 import api.main as api_module
-from api.routers.runs_v4 import get_runtime_governance_gate, reload_asset_repository
+from api.routers.runs_v4 import (
+    get_runtime_governance_gate,
+    reload_asset_repository,
+    runtime_ledger_pool_stats,
+    runtime_ledger_writer_stats,
+)
 from runtime.ledger import RuntimeLedger
 from runtime.governance import RuntimeGovernanceError
 from runtime.models import RuntimeEvent, RuntimeEventType
@@ -201,6 +206,54 @@ def test_runtime_events_use_payload_allowlist_and_redact_operation_keys(
     assert started["idempotency_key_present"] is True
 
 
+def test_runtime_events_page_after_sequence_cursor_and_stream_ndjson(
+    tmp_path, monkeypatch
+):
+    database = tmp_path / "runtime.db"
+    with RuntimeLedger(database) as ledger:
+        run_id = ledger.create_run(skill_name="demo", skill_version="1")
+        ledger.append_events(
+            [
+                RuntimeEvent(
+                    run_id=run_id,
+                    event_type=event_type,
+                    skill_name="demo",
+                    skill_version="1",
+                )
+                for event_type in (
+                    RuntimeEventType.PLAN_CREATED,
+                    RuntimeEventType.POLICY_ALLOWED,
+                    RuntimeEventType.RUN_SUCCEEDED,
+                )
+            ]
+        )
+    monkeypatch.setenv("SKILL0_RUNTIME_DB_PATH", str(database))
+    client = TestClient(api_module.app)
+    url = f"/api/runs/{run_id}/events"
+
+    first = client.get(url, params={"limit": 2}, headers=_auth_headers())
+    assert first.status_code == 200
+    assert [event["sequence"] for event in first.json()] == [1, 2]
+    cursor = first.headers["X-Next-After-Sequence"]
+    assert cursor == "2"
+
+    streamed = client.get(
+        url,
+        params={"after_sequence": cursor, "format": "ndjson"},
+        headers=_auth_headers(),
+    )
+    assert streamed.status_code == 200
+    assert streamed.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in streamed.text.splitlines()]
+    assert [event["event_type"] for event in lines] == ["policy_allowed", "run_succeeded"]
+    assert streamed.headers["X-Next-After-Sequence"] == "4"
+
+    caught_up = client.get(url, params={"after_sequence": 4}, headers=_auth_headers())
+    assert caught_up.json() == []
+    assert caught_up.headers["X-Next-After-Sequence"] == "4"
+    assert client.get(url, params={"limit": 0}, headers=_auth_headers()).status_code == 422
+
+
 def test_runtime_run_missing_from_configured_database_returns_404(tmp_path, monkeypatch):
     database = tmp_path / "runtime.db"
     monkeypatch.setenv("SKILL0_RUNTIME_DB_PATH", str(database))
@@ -212,6 +265,35 @@ def test_runtime_run_missing_from_configured_database_returns_404(tmp_path, monk
     assert response.json()["detail"] == "Run not found"
 
 
+def test_runtime_readers_reuse_pooled_ledger_connections(tmp_path, monkeypatch):
+    database = tmp_path / "runtime.db"
+    run_id = _create_runtime_run(database)
+    monkeypatch.setenv("SKILL0_RUNTIME_DB_PATH", str(database))
+    client = TestClient(api_module.app)
+    for _ in range(3):
+        assert client.get("/api/runs/hitl/items", headers=_auth_headers()).status_code == 200
+        assert client.get(f"/api/runs/{run_id}/events", headers=_auth_headers()).status_code == 200
+
+    (stats,) = [
+        item
+        for item in runtime_ledger_pool_stats()["reader"]
+        if item["path"] == str(database.resolve())
+    ]
+    assert stats["in_use"] == 0
+    assert stats["opened"] <= stats["size"]
+    assert stats["reused"] == 6 - stats["opened"]
+
+    monkeypatch.setenv("SKILL0_RUNTIME_LEDGER_POOL_SIZE", "0")
+    response = client.get("/api/runs/hitl/items", headers=_auth_headers())
+    assert response.status_code == 503
+
+    monkeypatch.setenv("SKILL0_RUNTIME_LEDGER_POOL_SIZE", "4")
+    monkeypatch.setenv("SKILL0_RUNTIME_SYNCHRONOUS", "NORMAL")
+    response = client.get("/api/runs/hitl/items", headers=_auth_headers())
+    assert response.status_code == 503
+    assert response.json()["detail"] == "Runtime synchronous mode is not configured"
+
+
 def test_runtime_evidence_requires_authentication(tmp_path, monkeypatch):
     database = tmp_path / "runtime.db"
     run_id = _create_runtime_run(database)
@@ -371,6 +453,14 @@ def test_create_runtime_run_executes_deterministic_simulation(
         assert all(event.payload.get("dry_run", True) is True for event in events)
         basis = ledger.get_execution_basis(body["run_id"])
         assert basis["governance_revision_id"] == "rev-runtime-api-test"
+    (writer,) = [
+        item
+        for item in runtime_ledger_writer_stats()
+        if item["path"] == str(database.resolve())
+    ]
+    assert writer["exclusive"] == 1
+    assert writer["batched"] >= 2
+    assert writer["failed"] == writer["rejected"] == writer["queue_depth"] == 0
     evidence = client.get(
         f"/api/runs/{body['run_id']}/evidence", headers=_auth_headers()
     )
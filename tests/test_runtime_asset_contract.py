@@ -69,6 +69,18 @@ def test_skill_mapping_is_deterministic_and_lossless(read_json):
     assert asset_envelope_to_skill(first) == skill
 
 
+def test_payload_mutated_after_mapping_fails_content_hash(read_json):
+    envelope = skill_document_to_asset_envelope(
+        read_json("tests/fixtures/valid_skill.json"),
+        source_path="tests/fixtures/valid_skill.json",
+        source_digest="sha256:" + "a" * 64,
+    )
+    validate_asset_envelope(envelope)
+    envelope["payload"]["decomposition"] = {"actions": [], "rules": [], "directives": []}
+    with pytest.raises(AssetContractError, match="content_hash does not match payload"):
+        validate_asset_envelope(envelope)
+
+
 def test_asset_id_drift_fails_closed(read_json):
     envelope = read_json("examples/runtime-asset-envelope.skill.valid.json")
     envelope["asset_id"] = "claude__skill__other"
@@ -32,7 +32,11 @@ def test_apply_requires_preflight_and_creates_verified_backup(root, tmp_path):
         root / "migrations/index",
         backup,
     )
-    assert result["applied"] == ["001_asset_index_state"]
+    assert result["applied"] == [
+        "001_asset_index_state",
+        "002_embedding_projection",
+        "002_index_representations",
+    ]
     assert result["backup"]["integrity"] == "ok"
     assert backup.is_file()
     assert result["after"]["migrations"][0]["state"] == "applied"
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import hashlib
+import json
+
+import pytest
+
+from asset_registry.repositories import LegacySkillAssetRepository
+from runtime.digest import canonical_digest, iter_canonical_json, keyed_digest
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {},
+        [],
+        "",
+        None,
+        1.5,
+        {"b": [1, {"z": "ä", "a": [[], {}]}], "a": {"nested": {"deep": {"x": [1, 2]}}}},
+        [{"k": (1, 2)}, " ", float("inf")],
+        {2: "int keys are stringified"},
+    ],
+)
+def test_streamed_encoding_matches_json_dumps(value):
+    expected = json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+    assert "".join(iter_canonical_json(value)) == expected
+    assert canonical_digest(value).startswith("sha256:")
+    assert keyed_digest(value, key="k" * 32).startswith("hmac-sha256:")
+
+
+def test_large_document_hashes_in_bounded_chunks():
+    document = {"rows": [{"id": index, "text": "x" * 100} for index in range(5000)]}
+    expected = json.dumps(
+        document, ensure_ascii=False, sort_keys=True, separators=(",", ":")
+    )
+    chunks = list(iter_canonical_json(document))
+
+    assert max(len(chunk) for chunk in chunks) < 200
+    assert canonical_digest(document) == (
+        "sha256:" + hashlib.sha256(expected.encode("utf-8")).hexdigest()
+    )
+
+
+def test_canonical_digest_always_hashes_the_current_document(root):
+    repository = LegacySkillAssetRepository(root / "parsed")
+    revision = repository.list_revisions()[0]
+    payload = revision.payload
+
+    assert canonical_digest(payload) == revision.content_hash
+    tampered = dict(payload, decomposition={})
+    assert canonical_digest(tampered) != revision.content_hash
@@ -219,6 +219,11 @@ def test_duplicate_primary_idempotency_key_is_rejected_across_runs(tmp_path, rea
         assert first.status == RunStatus.SUCCEEDED
         assert second.status == RunStatus.FAILED
         assert second.reason == "duplicate primary idempotency key"
+        # The rejected claim batch is rolled back; only its policy decision remains.
+        assert [event.event_type for event in ledger.list_events(second.run_id)][-2:] == [
+            RuntimeEventType.POLICY_ALLOWED,
+            RuntimeEventType.RUN_FAILED,
+        ]
 
 
 def test_missing_compensation_pointer_escalates_after_committed_effect(tmp_path, read_json):
@@ -269,3 +274,36 @@ def test_failed_postcondition_is_recorded_truthfully(tmp_path, read_json):
         assert ledger.get_run(result.run_id)["status"] == "recovery_pending"
         assert ledger.count_events(result.run_id, RuntimeEventType.VALIDATION_SUCCEEDED) == 0
         assert ledger.count_events(result.run_id, RuntimeEventType.RUN_SUCCEEDED) == 0
+
+
+def test_events_commit_in_one_transaction_per_side_effect_boundary(tmp_path, read_json):
+    database = tmp_path / "ledger.db"
+
+    class ObservingAdapter(FakeAdapter):
+        def execute(self, action_id, parameters, *, idempotency_key, dry_run):
+            with RuntimeLedger(database, read_only=True) as reader:
+                (run,) = reader.connection.execute("SELECT run_id FROM runtime_runs").fetchall()
+                self.durable = [event.event_type for event in reader.list_events(run[0])]
+            return super().execute(
+                action_id, parameters, idempotency_key=idempotency_key, dry_run=dry_run
+            )
+
+    adapter = ObservingAdapter()
+    with RuntimeLedger(database) as ledger:
+        statements: list[str] = []
+        ledger.connection.set_trace_callback(statements.append)
+        result = _run(
+            RuntimeExecutor(ledger, adapter),
+            read_json("examples/runtime-contract.auto-rollback.json"),
+            parameters={"customer_id": "42"},
+        )
+        ledger.connection.set_trace_callback(None)
+        assert result.status == RunStatus.SUCCEEDED
+        assert adapter.durable[-3:] == [
+            RuntimeEventType.POLICY_ALLOWED,
+            RuntimeEventType.ACTION_PREPARED,
+            RuntimeEventType.ACTION_STARTED,
+        ]
+        # create_run, events before the first adapter call, the claimed
+        # action batch, and everything recorded after the adapter returned.
+        assert statements.count("COMMIT") == 4
@@ -5,7 +5,7 @@ from pathlib import Path
 
 import pytest
 
-from runtime.ledger import RuntimeLedger
+from runtime.ledger import LEDGER_SCHEMA_VERSION, LedgerSchemaError, RuntimeLedger
 from runtime.models import RuntimeEvent, RuntimeEventType
 
 
@@ -243,3 +243,155 @@ def test_ledger_rejects_general_events_after_outcome_and_final_terminal(tmp_path
                     skill_version="1",
                 )
             )
+
+
+def test_run_state_projection_advances_incrementally_and_replays(tmp_path):
+    with RuntimeLedger(tmp_path / "runtime.db") as ledger:
+        run_id = ledger.create_run(skill_name="demo", skill_version="1")
+        for event_type in (
+            RuntimeEventType.PLAN_CREATED,
+            RuntimeEventType.RUN_FAILED,
+            RuntimeEventType.RUN_RECOVERY_FAILED,
+        ):
+            ledger.append_event(
+                RuntimeEvent(
+                    run_id=run_id,
+                    event_type=event_type,
+                    skill_name="demo",
+                    skill_version="1",
+                )
+            )
+        state = ledger.verify_run_state(run_id)
+        assert state.last_sequence == 4
+        assert state.outcome == RuntimeEventType.RUN_FAILED
+        assert state.terminal_events == {
+            RuntimeEventType.RUN_FAILED,
+            RuntimeEventType.RUN_RECOVERY_FAILED,
+        }
+        with pytest.raises(ValueError, match="duplicate runtime terminal"):
+            ledger.append_event(
+                RuntimeEvent(
+                    run_id=run_id,
+                    event_type=RuntimeEventType.RUN_RECOVERY_FAILED,
+                    skill_name="demo",
+                    skill_version="1",
+                )
+            )
+
+        # A run without a stored projection is replayed once on its next append.
+        ledger.connection.execute("DELETE FROM runtime_run_state WHERE run_id=?", (run_id,))
+        stored = ledger.append_event(
+            RuntimeEvent(
+                run_id=run_id,
+                event_type=RuntimeEventType.RUN_CANCELLED,
+                skill_name="demo",
+                skill_version="1",
+            )
+        )
+        assert stored.sequence == 5
+        assert ledger.verify_run_state(run_id).final_terminal == RuntimeEventType.RUN_CANCELLED
+
+        ledger.connection.execute(
+            "UPDATE runtime_run_state SET final_event_type=NULL WHERE run_id=?", (run_id,)
+        )
+        with pytest.raises(ValueError, match="projection mismatch"):
+            ledger.verify_run_state(run_id)
+
+
+def test_current_ledger_opens_without_ddl_and_old_schema_needs_maintenance(
+    tmp_path, monkeypatch
+):
+    database = tmp_path / "runtime.db"
+    with RuntimeLedger(database, migrate=False) as ledger:
+        assert ledger.schema_version == LEDGER_SCHEMA_VERSION
+
+    with monkeypatch.context() as patched:
+        patched.setattr(
+            RuntimeLedger, "_migrate", lambda self: pytest.fail("unexpected DDL")
+        )
+        with RuntimeLedger(database) as ledger:
+            assert ledger.schema_version == LEDGER_SCHEMA_VERSION
+
+    with sqlite3.connect(database) as connection:
+        connection.execute("PRAGMA user_version=0")
+    with pytest.raises(LedgerSchemaError, match="requires migration"):
+        RuntimeLedger(database, migrate=False)
+    with RuntimeLedger(database) as ledger:
+        assert ledger.schema_version == LEDGER_SCHEMA_VERSION
+
+    with sqlite3.connect(database) as connection:
+        connection.execute(f"PRAGMA user_version={LEDGER_SCHEMA_VERSION + 1}")
+    with pytest.raises(LedgerSchemaError, match="newer"):
+        RuntimeLedger(database)
+
+
+def test_normal_synchronous_requires_wal_and_barriers_sync_fully(tmp_path):
+    with pytest.raises(ValueError, match="requires journal_mode=WAL"):
+        RuntimeLedger(tmp_path / "delete.db", synchronous="NORMAL")
+
+    statements: list[str] = []
+    with RuntimeLedger(
+        tmp_path / "wal.db", journal_mode="WAL", synchronous="NORMAL"
+    ) as ledger:
+        assert ledger.connection.execute("PRAGMA synchronous").fetchone()[0] == 1
+        run_id = ledger.create_run(skill_name="demo", skill_version="1")
+        ledger.connection.set_trace_callback(statements.append)
+        ledger.append_events(
+            [
+                RuntimeEvent(
+                    run_id=run_id,
+                    event_type=RuntimeEventType.PLAN_CREATED,
+                    skill_name="demo",
+                    skill_version="1",
+                )
+            ],
+            barrier=True,
+        )
+        ledger.connection.set_trace_callback(None)
+        assert statements[0] == "PRAGMA synchronous=FULL"
+        assert statements[-1] == "PRAGMA synchronous=NORMAL"
+        assert ledger.connection.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+        result = ledger.checkpoint()
+        assert result["busy"] == 0
+        assert (tmp_path / "wal.db-wal").stat().st_size == 0
+
+
+def test_skill_events_page_along_the_skill_index(tmp_path):
+    with RuntimeLedger(tmp_path / "ledger.db") as ledger:
+        for index in range(3):
+            run_id = ledger.create_run(
+                skill_name="demo", skill_version="1", run_id=f"run-{index}"
+            )
+            ledger.append_event(
+                RuntimeEvent(
+                    run_id=run_id,
+                    event_type=RuntimeEventType.PLAN_CREATED,
+                    skill_name="demo",
+                    skill_version="1",
+                )
+            )
+        ledger.create_run(skill_name="demo", skill_version="2")
+
+        paged = list(ledger.iter_events_for_skill("demo", "1", page_size=2))
+        assert [event.event_id for event in paged] == [
+            event.event_id for event in ledger.list_events_for_skill("demo", "1")
+        ]
+        assert len(paged) == 6
+        assert [
+            (event.occurred_at, event.run_id, event.sequence) for event in paged
+        ] == sorted((event.occurred_at, event.run_id, event.sequence) for event in paged)
+        assert len(list(ledger.iter_events_for_skill("demo", page_size=4))) == 7
+
+        plan = " ".join(
+            row[3]
+            for row in ledger.connection.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM runtime_events "
+                "WHERE skill_name=? AND skill_version=? "
+                "AND (occurred_at, run_id, sequence) > (?, ?, ?) "
+                "ORDER BY occurred_at, run_id, sequence LIMIT ?",
+                ("demo", "1", "", "", 0, 2),
+            )
+        )
+        assert "idx_runtime_events_skill" in plan
+        assert "TEMP B-TREE" not in plan
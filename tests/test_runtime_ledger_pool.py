@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from runtime.ledger import RuntimeLedger
+from runtime.ledger_pool import LedgerPool
+
+
+def test_pool_reuses_thread_affine_ledgers_and_overflows_without_blocking(tmp_path):
+    database = tmp_path / "runtime.db"
+    events: list[str] = []
+    pool = LedgerPool(database, size=1, on_event=events.append)
+    try:
+        with pool.lease() as ledger:
+            run_id = ledger.create_run(skill_name="demo", skill_version="1")
+            with pool.lease() as overflow:
+                assert overflow is not ledger
+                assert pool.stats()["in_use"] == 2
+        # The inner lease came back first and took the only idle slot.
+        with pool.lease() as again:
+            assert again is overflow
+            assert again.get_run(run_id)["status"] == "created"
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other = executor.submit(lambda: pool.acquire()).result()
+        assert other is overflow
+        pool.release(other)
+
+        stats = pool.stats()
+        assert stats["idle"] == 1 and stats["in_use"] == 0
+        assert stats["opened"] == 2
+        assert stats["affinity_hits"] == 1
+        assert stats["reused"] == 2
+        assert stats["overflow"] == 1
+        assert events.count("opened") == 2
+    finally:
+        pool.close()
+
+
+def test_pool_recycles_after_errors_open_transactions_and_file_swaps(tmp_path):
+    database = tmp_path / "runtime.db"
+    with RuntimeLedger(database):
+        pass
+    pool = LedgerPool(database, size=2, read_only=True)
+    try:
+        with pytest.raises(sqlite3.OperationalError):
+            with pool.lease() as ledger:
+                ledger.connection.execute("SELECT * FROM missing_table")
+        assert pool.stats()["recycled"] == 1 and pool.stats()["idle"] == 0
+
+        with pool.lease() as ledger:
+            ledger.connection.execute("BEGIN")
+        assert pool.stats()["recycled"] == 2
+
+        with pool.lease() as first:
+            pass
+        replacement = tmp_path / "restored.db"
+        with RuntimeLedger(replacement) as restored:
+            run_id = restored.create_run(skill_name="demo", skill_version="1")
+        replacement.replace(database)
+        with pool.lease() as ledger:
+            assert ledger is not first
+            assert ledger.get_run(run_id)["run_id"] == run_id
+        assert pool.stats()["recycled"] == 3
+    finally:
+        pool.close()
+
+
+def test_pool_checkpoints_wal_writers_on_release_once_per_interval(tmp_path, monkeypatch):
+    database = tmp_path / "runtime.db"
+    clock = [100.0]
+    monkeypatch.setattr("runtime.ledger_pool.time.monotonic", lambda: clock[0])
+    pool = LedgerPool(
+        database,
+        journal_mode="WAL",
+        synchronous="NORMAL",
+        checkpoint_interval_seconds=60,
+    )
+    try:
+        with pool.lease() as ledger:
+            ledger.create_run(skill_name="demo", skill_version="1")
+        assert pool.stats()["checkpoints"] == 0
+        assert (tmp_path / "runtime.db-wal").stat().st_size > 0
+
+        clock[0] += 61
+        with pool.lease() as ledger:
+            ledger.create_run(skill_name="demo", skill_version="1")
+        assert pool.stats()["checkpoints"] == 1
+        assert (tmp_path / "runtime.db-wal").stat().st_size == 0
+        with pool.lease():
+            pass
+        assert pool.stats()["checkpoints"] == 1
+    finally:
+        pool.close()
+
+    assert LedgerPool(database, checkpoint_interval_seconds=60).checkpoint_interval_seconds is None
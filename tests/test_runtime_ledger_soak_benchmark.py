@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import json
+
+from tools.runtime_ledger_soak_benchmark import PROFILES, main, soak_profile
+
+
+def test_soak_profile_reports_throughput_and_tail_latency(tmp_path):
+    result = soak_profile(tmp_path, "wal-normal", threads=2, duration_seconds=0.2)
+
+    assert (result["journal_mode"], result["synchronous"]) == PROFILES["wal-normal"]
+    assert result["events"] > 0
+    assert result["events"] % 8 == 0
+    assert result["appends_per_second"] > 0
+    assert result["p50_ms"] <= result["p99_ms"]
+
+
+def test_soak_cli_emits_one_entry_per_requested_profile(tmp_path, capsys):
+    assert (
+        main(
+            [
+                "--profile",
+                "delete-full",
+                "--profile",
+                "wal-full",
+                "--threads",
+                "1",
+                "--duration-seconds",
+                "0.1",
+                "--work-dir",
+                str(tmp_path),
+            ]
+        )
+        == 0
+    )
+    payload = json.loads(capsys.readouterr().out)
+    assert [item["profile"] for item in payload["profiles"]] == ["delete-full", "wal-full"]
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from threading import Event
+
+import pytest
+
+from runtime.ledger import RuntimeLedger
+from runtime.ledger_writer import LedgerWriter, LedgerWriterBusy, QueuedLedger
+from runtime.models import RuntimeEvent, RuntimeEventType
+
+
+def _event(run_id: str, event_type: RuntimeEventType, **fields) -> RuntimeEvent:
+    return RuntimeEvent(
+        run_id=run_id,
+        event_type=event_type,
+        skill_name="demo",
+        skill_version="1",
+        **fields,
+    )
+
+
+def _hold_writer(writer: LedgerWriter, monkeypatch) -> tuple[Event, Event]:
+    """Park the writer thread inside `create_run` until released."""
+
+    entered, release = Event(), Event()
+    create_run = writer._ledger.create_run
+
+    def parked_create_run(**arguments):
+        entered.set()
+        release.wait(5)
+        return create_run(**arguments)
+
+    monkeypatch.setattr(writer._ledger, "create_run", parked_create_run)
+    return entered, release
+
+
+def test_writer_commits_queued_writes_together_and_isolates_failures(
+    tmp_path, monkeypatch
+):
+    writer = LedgerWriter(tmp_path / "runtime.db")
+    try:
+        entered, release = _hold_writer(writer, monkeypatch)
+        first = writer.submit("create_run", skill_name="demo", skill_version="1", run_id="r1")
+        assert entered.wait(5)
+        appended = writer.submit(
+            "append_events", events=[_event("r1", RuntimeEventType.PLAN_CREATED)]
+        )
+        unknown = writer.submit(
+            "append_events", events=[_event("missing", RuntimeEventType.PLAN_CREATED)]
+        )
+        claimed = writer.submit(
+            "ensure_idempotency_claim",
+            key="k1",
+            run_id="r1",
+            action_id="a1",
+            purpose="action",
+            claimed_at="2026-07-16T00:00:00+00:00",
+        )
+        assert writer.stats()["queue_depth"] == 3
+        release.set()
+
+        assert first.result(5) == "r1"
+        assert appended.result(5)[0].sequence == 2
+        with pytest.raises(KeyError):
+            unknown.result(5)
+        assert claimed.result(5) == "created"
+        stats = writer.stats()
+        assert stats["transactions"] == 2
+        assert stats["exclusive"] == 1 and stats["batched"] == 3
+    finally:
+        writer.close()
+
+    with RuntimeLedger(tmp_path / "runtime.db") as ledger:
+        assert [event.sequence for event in ledger.list_events("r1")] == [1, 2]
+        assert ledger.get_idempotency_claim("k1")["run_id"] == "r1"
+
+
+def test_full_writer_queue_rejects_after_submit_timeout(tmp_path, monkeypatch):
+    events: list[str] = []
+    writer = LedgerWriter(
+        tmp_path / "runtime.db", queue_size=1, submit_timeout=0.01, on_event=events.append
+    )
+    try:
+        entered, release = _hold_writer(writer, monkeypatch)
+        writer.submit("create_run", skill_name="demo", skill_version="1", run_id="r1")
+        assert entered.wait(5)
+        queued = writer.submit(
+            "append_events", events=[_event("r1", RuntimeEventType.PLAN_CREATED)]
+        )
+        with pytest.raises(LedgerWriterBusy):
+            writer.submit(
+                "append_events", events=[_event("r1", RuntimeEventType.PREFLIGHT_PASSED)]
+            )
+        release.set()
+        assert queued.result(5)[0].sequence == 2
+        assert writer.stats()["rejected"] == 1 and events.count("rejected") == 1
+    finally:
+        writer.close()
+
+
+def test_queued_ledger_writes_through_writer_and_reads_committed_state(tmp_path):
+    database = tmp_path / "runtime.db"
+    writer = LedgerWriter(database)
+    try:
+        with RuntimeLedger(database, read_only=True) as reader:
+            ledger = QueuedLedger(writer, reader)
+            run_id = ledger.create_run(skill_name="demo", skill_version="1")
+            prepared = _event(
+                run_id,
+                RuntimeEventType.ACTION_PREPARED,
+                action_id="a1",
+                idempotency_key="k1",
+            )
+            assert ledger.append_claimed_event(prepared, purpose="action").sequence == 2
+            other = ledger.create_run(skill_name="demo", skill_version="1")
+            conflict = _event(
+                other,
+                RuntimeEventType.ACTION_PREPARED,
+                action_id="a1",
+                idempotency_key="k1",
+            )
+            assert ledger.append_claimed_event(conflict, purpose="action") is None
+            assert [event.sequence for event in ledger.list_events(run_id)] == [1, 2]
+            assert ledger.list_events(other)[-1].sequence == 1
+    finally:
+        writer.close()
+    assert writer.stats()["failed"] == 0
@@ -3,6 +3,7 @@ from __future__ import annotations
 import pytest
 
 from runtime.certification import AdapterAdmissionDecision
+from runtime.digest import canonical_digest
 from runtime.executor import ActionResult
 from runtime.ledger import RuntimeLedger
 from runtime.models import RunStatus, RuntimeEventType
@@ -143,6 +144,48 @@ def test_orchestrator_records_attested_preflight(tmp_path, read_json):
         assert event.payload["precondition_rule_ids"] == ["r_001"]
 
 
+def test_orchestrator_rejects_a_skill_digest_for_another_document(tmp_path, read_json):
+    class RecordingGate(ApprovedGovernanceGate):
+        documents = []
+
+        def evaluate(self, skill_document, contract, *, canonical_asset_id=None):
+            self.documents.append(skill_document)
+            return super().evaluate(
+                skill_document, contract, canonical_asset_id=canonical_asset_id
+            )
+
+    contract = read_json("examples/runtime-contract.read-only.json")
+    skill_document = skill_document_for(contract)
+    with RuntimeLedger(tmp_path / "runtime.db") as ledger:
+        orchestrator = RuntimeOrchestrator(
+            ledger,
+            DryRunAdapter(),
+            ContextRuleEvaluator(),
+            binding_key=TEST_BINDING_KEY,
+            governance_gate=RecordingGate(),
+        )
+        with pytest.raises(RuntimeContractValidationError, match="skill_digest"):
+            orchestrator.run(
+                contract,
+                skill_document,
+                skill_digest="sha256:" + "b" * 64,
+                parameters={},
+                context={"rule_results": {"r_001": True}},
+            )
+        assert RecordingGate.documents == []
+
+        known = orchestrator.run(
+            contract,
+            skill_document,
+            skill_digest=canonical_digest(skill_document),
+            parameters={},
+            context={"rule_results": {"r_001": True}},
+        )
+        assert ledger.get_execution_basis(known.run_id)["skill_source_digest"] == (
+            canonical_digest(skill_document)
+        )
+
+
 def test_orchestrator_fails_closed_when_rule_result_is_missing(tmp_path, read_json):
     contract = read_json("examples/runtime-contract.read-only.json")
     with RuntimeLedger(tmp_path / "runtime.db") as ledger:
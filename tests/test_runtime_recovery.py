@@ -138,6 +138,35 @@ def test_recovery_uses_strict_lifo_order(tmp_path, read_json):
         assert adapter.compensation_calls == ["a_004", "a_002"]
 
 
+def test_recovery_reads_run_history_once_then_only_new_events(tmp_path, read_json):
+    adapter = RecoveryAdapter()
+    with RuntimeLedger(tmp_path / "ledger.db") as ledger:
+        run = run_contract(
+            ledger, adapter, two_action_contract(read_json), parameters={"customer_id": "42"}
+        )
+        history = len(ledger.list_events(run.run_id))
+        reads = []
+        list_events = ledger.list_events
+
+        def recording_list_events(run_id, *, after_sequence=0, limit=None):
+            events = list_events(run_id, after_sequence=after_sequence, limit=limit)
+            reads.append((after_sequence, len(events)))
+            return events
+
+        ledger.list_events = recording_list_events
+        assert RecoveryCoordinator(ledger, adapter).recover(run.run_id) == RunStatus.COMPENSATED
+        assert [after for after, _ in reads if after == 0] == [0]
+        # Every event is decoded once, except the closing run_compensated
+        # event that nothing reads back.
+        assert sum(count for _, count in reads) == len(list_events(run.run_id)) - 1
+        assert reads[0] == (0, history)
+
+        view = ledger.run_event_view(run.run_id)
+        assert list(view.iter_recovery_candidates()) == []
+        assert view.has_event(RuntimeEventType.RUN_COMPENSATED)
+        assert view.refresh() == 0
+
+
 def test_acceptable_terminal_error_counts_as_compensated(tmp_path, read_json):
     adapter = RecoveryAdapter(
         [ActionResult(False, error_code="HTTP_404", error_message="already absent")]
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pytest
+
+from asset_registry.sqlite import apply_migrations, load_migrations
+from scripts.sync_vector_db import build_shadow_index
+from vector_db.search import SemanticSearch
+from vector_db.vector_store import VectorStore
+
+
+class CountingEmbedder:
+    dimension = 384
+
+    def __init__(self):
+        self.embedded = 0
+        self.fail = False
+
+    def embed_skills(self, skills, show_progress=True):
+        del show_progress
+        if self.fail:
+            raise RuntimeError("injected embedding failure")
+        self.embedded += len(skills)
+        return [np.full(self.dimension, 0.5, dtype=np.float32) for _ in skills]
+
+    def embed_query(self, query):
+        del query
+        return np.zeros(self.dimension, dtype=np.float32)
+
+
+def _write_skill(path, skill_id, *, description="shadow index fixture"):
+    document = {
+        "meta": {
+            "skill_id": skill_id,
+            "name": path.stem,
+            "description": description,
+            "schema_version": "2.4.0",
+            "parsed_by": "shadow-test",
+            "parser_version": "1.0.0",
+        },
+        "decomposition": {"actions": [], "rules": [], "directives": []},
+    }
+    path.write_text(json.dumps(document), encoding="utf-8")
+
+
+@pytest.fixture
+def live_index(root, tmp_path, monkeypatch):
+    monkeypatch.setenv("SKILL0_EMBEDDING_MODEL_VERSION", "fixture-v1")
+    monkeypatch.setenv("SKILL0_EMBEDDING_MODEL", "fixture-model")
+    embedder = CountingEmbedder()
+    monkeypatch.setattr(SemanticSearch, "embedder", property(lambda self: embedder))
+    parsed_dir = tmp_path / "parsed"
+    parsed_dir.mkdir()
+    _write_skill(parsed_dir / "one-skill.json", "claude__skill__one")
+    _write_skill(parsed_dir / "two-skill.json", "claude__skill__two")
+    database = tmp_path / "skills.db"
+    with SemanticSearch(database) as search:
+        apply_migrations(search.store.conn, load_migrations(root / "migrations/index"))
+        search.index_assets(parsed_dir, show_progress=False)
+    return database, parsed_dir, embedder
+
+
+def test_shadow_build_reuses_vectors_and_swaps_without_disturbing_readers(live_index):
+    database, parsed_dir, embedder = live_index
+    _write_skill(parsed_dir / "two-skill.json", "claude__skill__two", description="edited")
+    reader = VectorStore(database, initialize_schema=False)
+    try:
+        result = build_shadow_index(parsed_dir, database)
+
+        assert result["indexed_count"] == 2
+        assert result["reused_embeddings"] == 1
+        assert result["generation"] == 1
+        assert embedder.embedded == 3
+        assert reader.is_swapped()
+        assert reader.get_statistics()["total_skills"] == 2
+    finally:
+        reader.close()
+    with VectorStore(database, initialize_schema=False) as promoted:
+        assert promoted.generation == 1
+        assert not promoted.is_swapped()
+        assert len(promoted.get_index_state()) == 2
+    assert not database.with_name(database.name + ".shadow").exists()
+
+
+def test_failed_shadow_build_leaves_live_index_untouched(live_index):
+    database, parsed_dir, embedder = live_index
+    with VectorStore(database, initialize_schema=False) as before:
+        state = before.get_index_state()
+    _write_skill(parsed_dir / "one-skill.json", "claude__skill__one", description="edited")
+    embedder.fail = True
+
+    with pytest.raises(RuntimeError, match="injected embedding failure"):
+        build_shadow_index(parsed_dir, database)
+    with VectorStore(database, initialize_schema=False) as after:
+        assert after.generation == 0
+        assert after.get_index_state() == state
+    assert not database.with_name(database.name + ".shadow").exists()
+
+
+def test_long_lived_search_reattaches_after_promotion(live_index):
+    database, parsed_dir, _embedder = live_index
+    with SemanticSearch(database, initialize_schema=False) as search:
+        assert search.reopen_if_swapped() is False
+        build_shadow_index(parsed_dir, database)
+        assert search.reopen_if_swapped() is True
+        assert search.store.generation == 1
+
+
+def test_long_lived_search_reads_the_promoted_index_without_a_unit_of_work(live_index):
+    database, parsed_dir, _embedder = live_index
+    with SemanticSearch(database, initialize_schema=False) as search:
+        previous = search.store
+        _write_skill(parsed_dir / "one-skill.json", "claude__skill__one", description="edited")
+        build_shadow_index(parsed_dir, database)
+
+        descriptions = {item.description for item in search.search_assets("fixture")}
+
+        assert search.store is not previous
+        assert search.store.generation == 1
+        assert "edited" in descriptions
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from asset_registry.repositories import (
+    AssetIdentityAmbiguousError,
+    AssetNotFoundError,
+    LegacySkillAssetRepository,
+    StaleSourceSnapshotError,
+)
+from asset_registry.sqlite_repository import SQLiteAssetRepository, import_corpus
+from tools.runtime_asset_registry import registry_diff
+
+
+def _write_skill(path: Path, skill_id: str, *, name: str = "fixture") -> None:
+    document = {
+        "meta": {
+            "skill_id": skill_id,
+            "name": name,
+            "description": "registry fixture",
+            "parsed_by": "registry-test",
+            "parser_version": "1.0.0",
+        },
+        "decomposition": {"actions": [], "rules": [], "directives": []},
+    }
+    path.write_text(json.dumps(document), encoding="utf-8")
+
+
+def test_checked_in_corpus_round_trips_through_registry(root, tmp_path):
+    database = tmp_path / "registry.db"
+    source = LegacySkillAssetRepository(root / "parsed")
+
+    result = import_corpus(
+        database, root / "parsed", migration_dir=root / "migrations/registry", source=source
+    )
+    registry = SQLiteAssetRepository(database)
+
+    assert result["revisions"] == result["new_revisions"] == 196
+    assert registry.snapshot_id == source.snapshot_id
+    assert registry.list_revisions() == source.list_revisions()
+    assert registry.list_asset_summaries() == source.list_asset_summaries()
+    alias = "claude__skill__java_to_java_upgrade"
+    assert registry.list_asset_revisions(alias) == source.list_asset_revisions(alias)
+    with pytest.raises(AssetIdentityAmbiguousError):
+        registry.get_revision(alias)
+    assert registry.ambiguous_legacy_aliases == source.ambiguous_legacy_aliases
+    revision = source.list_revisions()[0]
+    assert registry.get_revision(revision.asset_id).payload == revision.payload
+    again = import_corpus(
+        database, root / "parsed", migration_dir=root / "migrations/registry", source=source
+    )
+    assert (again["reused_snapshot"], again["new_revisions"]) == (True, 0)
+    registry.assert_fresh()
+
+
+def test_registry_keeps_history_and_follows_new_imports(root, tmp_path):
+    corpus = tmp_path / "parsed"
+    corpus.mkdir()
+    database = tmp_path / "registry.db"
+    migrations = root / "migrations/registry"
+    _write_skill(corpus / "one.json", "claude__skill__one", name="first")
+    _write_skill(corpus / "two.json", "claude__skill__two")
+    _write_skill(corpus / "dup-a.json", "claude__skill__dup", name="a")
+    _write_skill(corpus / "dup-b.json", "claude__skill__dup", name="b")
+    import_corpus(database, corpus, migration_dir=migrations)
+    first = SQLiteAssetRepository(database, payload_cache_size=1)
+
+    assert [item.asset_id for item in first.list_asset_revisions("claude__skill__dup")] == [
+        "claude__skill__dup",
+        "claude__skill__dup",
+    ]
+    with pytest.raises(AssetIdentityAmbiguousError):
+        first.get_revision("claude__skill__dup")
+    assert first.ambiguous_asset_ids == ("claude__skill__dup",)
+    with pytest.raises(AssetNotFoundError):
+        first.get_revision("claude__skill__missing")
+
+    _write_skill(corpus / "one.json", "claude__skill__one", name="second")
+    result = import_corpus(database, corpus, migration_dir=migrations)
+
+    assert (result["new_revisions"], result["new_payloads"]) == (1, 1)
+    assert not first.is_current()
+    with pytest.raises(StaleSourceSnapshotError):
+        first.get_revision("claude__skill__two")
+    current = first.rebuild()
+    assert current.get_revision("claude__skill__one").payload["meta"]["name"] == "second"
+    delta = current.diff(first.snapshot_id)
+    assert [item.asset_id for item in delta.changed] == ["claude__skill__one"]
+    assert (delta.added, delta.removed) == ((), ())
+    assert registry_diff(database, first.snapshot_id)["changed"][0]["source_path"] == "one.json"
+    history = current.list_asset_history("claude__skill__one")
+    assert [item.name for item in history] == ["first", "second"]
+    assert history[0].payload["meta"]["name"] == "first"
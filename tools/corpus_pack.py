@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Build and verify the derived packed cache of the parsed corpus."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from asset_registry.corpus_pack import (
+    CorpusPack,
+    CorpusPackError,
+    build_pack,
+    default_pack_path,
+)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--parsed-dir", type=Path, default=Path("parsed"))
+    parser.add_argument(
+        "--pack", type=Path, help="Pack path (default: .<parsed-dir>.corpus-pack beside it)"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("build", help="Pack every parsed document and swap the pack in")
+    subparsers.add_parser(
+        "verify", help="Check every digest and whether the pack matches the directory"
+    )
+    args = parser.parse_args(argv)
+    pack_path = args.pack or default_pack_path(args.parsed_dir)
+    try:
+        if args.command == "build":
+            payload = {"operation": "build", **build_pack(args.parsed_dir, pack_path)}
+        else:
+            with CorpusPack(pack_path) as pack:
+                payload = {
+                    "operation": "verify",
+                    **pack.verify(),
+                    "current": pack.matches(args.parsed_dir),
+                }
+    except (CorpusPackError, OSError, ValueError) as exc:
+        print(
+            json.dumps(
+                {
+                    "operation": args.command,
+                    "error": type(exc).__name__,
+                    "detail": str(exc),
+                },
+                ensure_ascii=False,
+            ),
+            file=sys.stderr,
+        )
+        return 2
+    print(json.dumps(payload, ensure_ascii=False, indent=2))
+    if args.command == "verify" and not payload["current"]:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -6,12 +6,19 @@ Skill-0 模式提取工具
 
 import json
 import re
+import sys
 from pathlib import Path
 from collections import Counter, defaultdict
 from typing import Dict, List, Any, Set, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from asset_registry.corpus_pack import CorpusReader
+
 
 @dataclass
 class Pattern:
@@ -38,14 +45,14 @@ class PatternExtractor:
         """載入所有已解析的 skills"""
         self.skills = []
         
-        for json_file in self.parsed_dir.glob("*.json"):
-            try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    skill_data = json.load(f)
+        with CorpusReader(self.parsed_dir) as corpus:
+            for json_file in corpus.paths("*.json"):
+                try:
+                    skill_data = corpus.load(json_file)
                     skill_data['_source_file'] = json_file.stem
                     self.skills.append(skill_data)
-            except Exception as e:
-                print(f"⚠️ 載入失敗 {json_file.name}: {e}")
+                except Exception as e:
+                    print(f"⚠️ 載入失敗 {json_file.name}: {e}")
                 
         return len(self.skills)
     
@@ -6,10 +6,17 @@ from __future__ import annotations
 import argparse
 import json
 import sqlite3
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from asset_registry.corpus_pack import CorpusReader
+
 
 DEFAULT_PARSED_DIR = Path("parsed")
 DEFAULT_SKILLS_DB = Path("skills.db")
@@ -42,18 +49,13 @@ class GovernanceSkill:
     source_checksum: str | None
 
 
-def _read_json(path: Path) -> dict[str, Any]:
-    with path.open("r", encoding="utf-8") as handle:
-        payload = json.load(handle)
-    if not isinstance(payload, dict):
-        raise ValueError(f"{path} does not contain a JSON object")
-    return payload
-
-
 def load_parsed_skills(parsed_dir: Path) -> list[ParsedSkill]:
     skills: list[ParsedSkill] = []
-    for path in sorted(parsed_dir.glob("*.json")):
-        payload = _read_json(path)
+    with CorpusReader(parsed_dir) as corpus:
+        documents = [(path, corpus.load(path)) for path in corpus.paths("*.json")]
+    for path, payload in documents:
+        if not isinstance(payload, dict):
+            raise ValueError(f"{path} does not contain a JSON object")
         meta = payload.get("meta") if isinstance(payload.get("meta"), dict) else {}
         original = (
             payload.get("original_definition")
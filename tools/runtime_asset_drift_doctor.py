@@ -18,7 +18,11 @@ from asset_registry.repositories import (
     AssetSnapshotBuildError,
     LegacySkillAssetRepository,
 )
-from asset_registry.sqlite import load_migrations, preview_migrations
+from asset_registry.sqlite import (
+    default_index_representation,
+    load_migrations,
+    preview_migrations,
+)
 
 
 EXIT_CODES = {
@@ -64,10 +68,18 @@ def _index_findings(
                     item.source_path.as_posix() for item in revisions
                 ]
                 return findings, 0
+            representation = default_index_representation(connection)
             rows = [
                 dict(row)
-                for row in connection.execute(
-                    "SELECT * FROM asset_index_state ORDER BY source_path"
+                for row in (
+                    connection.execute(
+                        "SELECT * FROM asset_index_state ORDER BY source_path"
+                    )
+                    if representation is None
+                    else connection.execute(
+                        "SELECT * FROM asset_index_state WHERE representation = ? ORDER BY source_path",
+                        (representation,),
+                    )
                 )
             ]
     except sqlite3.DatabaseError as exc:
@@ -32,8 +32,10 @@ from asset_registry.sqlite import (
     preview_migrations,
     verify_database,
 )
+from asset_registry.repositories import LegacySkillAssetRepository
 from tools.runtime_asset_drift_doctor import build_doctor_report
 from vector_db.search import SemanticSearch
+from vector_db.vector_store import VectorStore
 
 
 def _sha256(path: Path) -> str:
@@ -210,6 +212,84 @@ def index_twice(
     }
 
 
+def _require_applied_migrations(index_db: Path, migration_dir: Path) -> dict[str, Any]:
+    inspection = inspect_index(index_db, migration_dir)
+    if any(item["state"] != "applied" for item in inspection["migrations"]):
+        raise IndexSchemaError("index_representations_migration_required")
+    return inspection
+
+
+def list_representations(index_db: Path, migration_dir: Path) -> dict[str, Any]:
+    _require_applied_migrations(index_db, migration_dir)
+    with VectorStore(index_db, initialize_schema=False) as store:
+        return {"default": store.representation, "representations": store.list_representations()}
+
+
+def build_representation(
+    *,
+    index_db: Path,
+    parsed_dir: Path,
+    migration_dir: Path,
+    name: str,
+    model_name: str | None = None,
+    model_version: str | None = None,
+) -> dict[str, Any]:
+    """Build a named representation while the default keeps serving."""
+
+    _require_applied_migrations(index_db, migration_dir)
+    started = time.perf_counter()
+    with _configured_model_version(model_version):
+        with SemanticSearch(
+            index_db,
+            model_name=model_name,
+            initialize_schema=False,
+            representation="primary",
+        ) as search:
+            report = search.build_representation(name, parsed_dir, show_progress=False)
+            model_id, resolved_model_version = search._embedding_identity()
+    return {
+        "name": name,
+        "report": vars(report),
+        "model_identity": {
+            "model_id": model_id,
+            "model_version": resolved_model_version,
+        },
+        "elapsed_seconds": time.perf_counter() - started,
+        **list_representations(index_db, migration_dir),
+    }
+
+
+def cutover_representation(
+    *,
+    index_db: Path,
+    parsed_dir: Path,
+    migration_dir: Path,
+    name: str,
+) -> dict[str, Any]:
+    """Flip the default only when the target covers every current revision."""
+
+    _require_applied_migrations(index_db, migration_dir)
+    expected = {
+        (
+            revision.asset_id,
+            revision.revision_id,
+            revision.content_hash,
+            revision.source_path.as_posix(),
+        )
+        for revision in LegacySkillAssetRepository(parsed_dir).list_revisions()
+    }
+    with VectorStore(index_db, initialize_schema=False) as store:
+        flipped = store.set_default_representation(name, expected_identities=expected)
+    return {**flipped, **list_representations(index_db, migration_dir)}
+
+
+def collect_representations(index_db: Path, migration_dir: Path) -> dict[str, Any]:
+    _require_applied_migrations(index_db, migration_dir)
+    with VectorStore(index_db, initialize_schema=False) as store:
+        dropped = store.drop_retired_representations()
+    return {"dropped": dropped, **list_representations(index_db, migration_dir)}
+
+
 def _write_output(payload: dict[str, Any], output: Path | None) -> None:
     rendered = json.dumps(payload, ensure_ascii=False, indent=2)
     print(rendered)
@@ -254,9 +334,64 @@ def main(argv: list[str] | None = None) -> int:
             "the JSON result remains accepted=false"
         ),
     )
+    subparsers.add_parser(
+        "representations", help="List named representations and the default"
+    )
+    build_parser = subparsers.add_parser(
+        "build-representation",
+        help="Build a named representation beside the serving default",
+    )
+    build_parser.add_argument("--name", required=True)
+    build_parser.add_argument("--parsed-dir", type=Path, default=Path("parsed"))
+    build_parser.add_argument("--model-name")
+    build_parser.add_argument("--model-version")
+    cutover_parser = subparsers.add_parser(
+        "cutover",
+        help="Make a fully built representation the default and retire the previous one",
+    )
+    cutover_parser.add_argument("--name", required=True)
+    cutover_parser.add_argument("--parsed-dir", type=Path, default=Path("parsed"))
+    subparsers.add_parser(
+        "gc-representations", help="Drop retired representations and their vectors"
+    )
     args = parser.parse_args(argv)
     try:
-        if args.command == "preview":
+        if args.command == "representations":
+            payload = {
+                "operation": "representations",
+                **list_representations(args.index_db, args.migration_dir),
+            }
+        elif args.command == "build-representation":
+            payload = {
+                "operation": "build-representation",
+                "captured_at": datetime.now(timezone.utc).isoformat(),
+                **build_representation(
+                    index_db=args.index_db,
+                    parsed_dir=args.parsed_dir,
+                    migration_dir=args.migration_dir,
+                    name=args.name,
+                    model_name=args.model_name,
+                    model_version=args.model_version,
+                ),
+            }
+        elif args.command == "cutover":
+            payload = {
+                "operation": "cutover",
+                "captured_at": datetime.now(timezone.utc).isoformat(),
+                **cutover_representation(
+                    index_db=args.index_db,
+                    parsed_dir=args.parsed_dir,
+                    migration_dir=args.migration_dir,
+                    name=args.name,
+                ),
+            }
+        elif args.command == "gc-representations":
+            payload = {
+                "operation": "gc-representations",
+                "captured_at": datetime.now(timezone.utc).isoformat(),
+                **collect_representations(args.index_db, args.migration_dir),
+            }
+        elif args.command == "preview":
             payload = {"operation": "preview", **inspect_index(args.index_db, args.migration_dir)}
         elif args.command == "apply":
             payload = {
@@ -294,6 +429,7 @@ def main(argv: list[str] | None = None) -> int:
         IndexSchemaError,
         MigrationError,
         RuntimeError,
+        ValueError,
         sqlite3.DatabaseError,
         OSError,
     ) as exc:
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Import the canonical corpus into the shared SQLite Asset registry and diff snapshots."""
+
+from __future__ import annotations
+
+import argparse
+from datetime import datetime, timezone
+import json
+from pathlib import Path
+import sqlite3
+import sys
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from asset_registry.repositories import AssetRepositoryError
+from asset_registry.sqlite import (
+    REGISTRY_POLICY,
+    MigrationError,
+    connect_sqlite,
+    load_migrations,
+    preview_migrations,
+)
+from asset_registry.sqlite_repository import SQLiteAssetRepository, import_corpus
+
+
+def registry_status(registry_db: Path, migration_dir: Path) -> dict[str, Any]:
+    with connect_sqlite(registry_db, policy=REGISTRY_POLICY, mode="read_only") as connection:
+        migrations = [
+            {"migration_id": item.migration_id, "state": item.state}
+            for item in preview_migrations(connection, load_migrations(migration_dir))
+        ]
+        head = connection.execute(
+            """
+            SELECT h.snapshot_id, h.updated_at, s.revision_count, s.corpus_dir
+            FROM asset_registry_head AS h
+            JOIN asset_snapshots AS s ON s.snapshot_id = h.snapshot_id
+            """
+        ).fetchone()
+        counts = {
+            table: int(connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0])
+            for table in ("asset_snapshots", "asset_revisions", "asset_payloads")
+        }
+    return {
+        "registry_db": str(registry_db),
+        "migrations": migrations,
+        "head": dict(head) if head is not None else None,
+        "counts": counts,
+    }
+
+
+def registry_diff(registry_db: Path, since: str) -> dict[str, Any]:
+    diff = SQLiteAssetRepository(registry_db).diff(since)
+
+    def rows(items) -> list[dict[str, str]]:
+        return [
+            {
+                "asset_id": item.asset_id,
+                "revision_id": item.revision_id,
+                "source_path": item.source_path.as_posix(),
+            }
+            for item in items
+        ]
+
+    return {
+        "from_snapshot_id": diff.from_snapshot_id,
+        "to_snapshot_id": diff.to_snapshot_id,
+        "added": rows(diff.added),
+        "changed": rows(diff.changed),
+        "removed": rows(diff.removed),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--registry-db", type=Path, default=Path("asset-registry.db"))
+    parser.add_argument(
+        "--migration-dir", type=Path, default=ROOT / "migrations/registry"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    import_parser = subparsers.add_parser(
+        "import", help="Validate parsed/ and publish it as the registry head"
+    )
+    import_parser.add_argument("--parsed-dir", type=Path, default=Path("parsed"))
+    import_parser.add_argument("--workers", type=int, default=1)
+    subparsers.add_parser("status", help="Read-only head, migration and row counts")
+    diff_parser = subparsers.add_parser(
+        "diff", help="Revisions added, changed or removed since an imported snapshot"
+    )
+    diff_parser.add_argument("--since", required=True)
+    args = parser.parse_args(argv)
+    try:
+        if args.command == "import":
+            payload = {
+                "operation": "import",
+                "captured_at": datetime.now(timezone.utc).isoformat(),
+                **import_corpus(
+                    args.registry_db,
+                    args.parsed_dir,
+                    migration_dir=args.migration_dir,
+                    workers=args.workers,
+                ),
+            }
+        elif args.command == "diff":
+            payload = {"operation": "diff", **registry_diff(args.registry_db, args.since)}
+        else:
+            payload = {
+                "operation": "status",
+                **registry_status(args.registry_db, args.migration_dir),
+            }
+    except (
+        AssetRepositoryError,
+        MigrationError,
+        ValueError,
+        sqlite3.DatabaseError,
+        OSError,
+    ) as exc:
+        print(
+            json.dumps(
+                {
+                    "operation": args.command,
+                    "error": type(exc).__name__,
+                    "detail": str(exc),
+                },
+                ensure_ascii=False,
+            ),
+            file=sys.stderr,
+        )
+        return 2
+    print(json.dumps(payload, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
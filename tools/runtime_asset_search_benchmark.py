@@ -25,11 +25,13 @@ if str(ROOT) not in sys.path:
 from asset_registry.repositories import LegacySkillAssetRepository
 from asset_registry.sqlite import (
     backup_database,
+    default_index_representation,
     load_migrations,
     preflight_index_schema,
     preview_migrations,
 )
 from vector_db.embedder import SkillEmbedder
+from vector_db.projection import PROJECTION_METHODS, build_reduced_index
 from vector_db.search import REPRESENTATION_VERSION, SemanticSearch
 
 
@@ -136,6 +138,7 @@ def validate_index_projection(connection: sqlite3.Connection, revisions):
         )
         for revision in revisions
     }
+    representation = default_index_representation(connection)
     rows = connection.execute(
         """
         SELECT asset_id, revision_id, representation_version,
@@ -143,6 +146,8 @@ def validate_index_projection(connection: sqlite3.Connection, revisions):
                embedding_model_id, embedding_model_version
         FROM asset_index_state
         """
+        + ("" if representation is None else "WHERE representation = ?"),
+        () if representation is None else (representation,),
     ).fetchall()
     actual = {
         (str(row[0]), str(row[1]), str(row[2]), str(row[3]), str(row[4]))
@@ -366,7 +371,13 @@ def evaluate_gates(
 
 
 def run_benchmark(
-    *, source_index: Path, parsed_dir: Path, query_suite: Path, output_dir: Path
+    *,
+    source_index: Path,
+    parsed_dir: Path,
+    query_suite: Path,
+    output_dir: Path,
+    reduced_dimensions: tuple[int, ...] = (),
+    reduction_method: str = "pca",
 ):
     source_index = source_index.resolve()
     parsed_dir = parsed_dir.resolve()
@@ -378,6 +389,11 @@ def run_benchmark(
         raise FileExistsError(output_dir)
     if source_index == output_dir or output_dir in source_index.parents:
         raise ValueError("benchmark output must not contain the source Index")
+    if len(set(reduced_dimensions)) != len(reduced_dimensions):
+        raise ValueError("reduced dimensions must be unique")
+    reduction_labels = tuple(
+        f"{reduction_method}{dimension}" for dimension in reduced_dimensions
+    )
     source_before = source_file_state(source_index)
     output_dir.mkdir(parents=True)
     vector_copy = output_dir / "vector-snapshot.db"
@@ -434,6 +450,36 @@ def run_benchmark(
                             },
                         }
                     )
+            reductions = {}
+            for dimension, label in zip(reduced_dimensions, reduction_labels):
+                reduced_path = output_dir / f"vector-{label}.db"
+                reductions[label] = build_reduced_index(
+                    vector_copy,
+                    reduced_path,
+                    dimension=dimension,
+                    method=reduction_method,
+                )
+                reduced_engine = SemanticSearch(db_path=reduced_path, initialize_schema=False)
+                reduced_engine._embedder = engine.embedder
+                try:
+                    timing[f"{label}_ms"] = []
+                    for case, item in zip(cases, query_results):
+                        reduced_ids, reduced_times = _measure(
+                            lambda case=case: [
+                                result.asset_id
+                                for result in reduced_engine.search_assets(
+                                    case.query, limit=CANDIDATE_LIMIT
+                                )
+                            ]
+                        )
+                        timing[f"{label}_ms"].extend(reduced_times)
+                        item["rankings_at_5"][label] = reduced_ids[:RESULT_LIMIT]
+                        item["metrics"][label] = ranking_metrics(
+                            reduced_ids, case.relevant_asset_ids, k=RESULT_LIMIT
+                        )
+                finally:
+                    reduced_engine.close()
+                reductions[label]["bytes"] = reduced_path.stat().st_size
         finally:
             engine.close()
 
@@ -442,10 +488,19 @@ def run_benchmark(
                 method: _aggregate_quality(
                     query_results, method, None if subset == "overall" else subset
                 )
-                for method in ("vector", "fts5", "hybrid")
+                for method in ("vector", "fts5", "hybrid", *reduction_labels)
             }
             for subset in ("overall", "lexical", "semantic")
         }
+        # 降維只回報品質與容量取捨，不參與 gate 判定
+        for label, reduction in reductions.items():
+            reduction["impact_vs_vector"] = {
+                subset: {
+                    key: quality[subset][label][key] - quality[subset]["vector"][key]
+                    for key in ("ndcg_at_5", "mrr_at_5", "recall_at_5")
+                }
+                for subset in quality
+            }
         latency = {
             method: {
                 "samples": len(values),
@@ -482,6 +537,8 @@ def run_benchmark(
                 "minimum_query_count": MINIMUM_QUERY_COUNT,
                 "minimum_subset_query_count": MINIMUM_SUBSET_QUERY_COUNT,
                 "fts5_weights": [0.0, 8.0, 4.0, 1.0],
+                "reduced_dimensions": list(reduced_dimensions),
+                "reduction_method": reduction_method,
             },
             "environment": {
                 "platform": platform.platform(),
@@ -520,6 +577,7 @@ def run_benchmark(
             },
             "quality": quality,
             "latency": latency,
+            "dimension_reduction": reductions,
             "queries": query_results,
             "gate": decision,
             "scope": "offline_evidence_only_no_production_ddl",
@@ -561,12 +619,24 @@ def main(argv: list[str] | None = None) -> int:
         default=Path("benchmarks/runtime-asset-search-queries.json"),
     )
     parser.add_argument("--output-dir", type=Path, required=True)
+    parser.add_argument(
+        "--reduced-dimension",
+        type=int,
+        action="append",
+        default=[],
+        help="Also evaluate a reduced-dimension copy (e.g. 128, 192); repeatable",
+    )
+    parser.add_argument(
+        "--reduction-method", choices=PROJECTION_METHODS, default="pca"
+    )
     args = parser.parse_args(argv)
     report, evidence_path = run_benchmark(
         source_index=args.source_index,
         parsed_dir=args.parsed_dir,
         query_suite=args.queries,
         output_dir=args.output_dir,
+        reduced_dimensions=tuple(args.reduced_dimension),
+        reduction_method=args.reduction_method,
     )
     print(
         json.dumps(
@@ -576,6 +646,10 @@ def main(argv: list[str] | None = None) -> int:
                 "source_index_unchanged": report["source_index"]["unchanged"],
                 "asset_count": report["corpus"]["asset_count"],
                 "query_count": report["corpus"]["query_count"],
+                "recall_at_5_impact": {
+                    label: reduction["impact_vs_vector"]["overall"]["recall_at_5"]
+                    for label, reduction in report["dimension_reduction"].items()
+                },
             },
             ensure_ascii=False,
         )
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""Soak the Runtime ledger under concurrent runs and compare durability profiles."""
+
+from __future__ import annotations
+
+import argparse
+from datetime import datetime, timezone
+import json
+from pathlib import Path
+import platform
+import sqlite3
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from runtime.ledger import RuntimeLedger
+from runtime.models import RuntimeEvent, RuntimeEventType
+from tools.runtime_asset_search_benchmark import percentile_higher
+
+
+PROFILES = {
+    "delete-full": ("DELETE", "FULL"),
+    "wal-full": ("WAL", "FULL"),
+    "wal-normal": ("WAL", "NORMAL"),
+}
+SKILL_NAME = "soak-benchmark"
+SKILL_VERSION = "1.0.0"
+# The transaction shape of one successful run after executor batching: the
+# side-effect boundary is a barrier, the closing batch is not.
+PRE_ACTION_BATCH = (
+    RuntimeEventType.PLAN_CREATED,
+    RuntimeEventType.POLICY_ALLOWED,
+    RuntimeEventType.ACTION_PREPARED,
+    RuntimeEventType.ACTION_STARTED,
+)
+POST_ACTION_BATCH = (
+    RuntimeEventType.ACTION_SUCCEEDED,
+    RuntimeEventType.VALIDATION_SUCCEEDED,
+    RuntimeEventType.RUN_SUCCEEDED,
+)
+
+
+def _batch(run_id: str, event_types: tuple[RuntimeEventType, ...]) -> list[RuntimeEvent]:
+    return [
+        RuntimeEvent(
+            run_id=run_id,
+            event_type=event_type,
+            skill_name=SKILL_NAME,
+            skill_version=SKILL_VERSION,
+            action_id="action-1" if event_type.value.startswith("action_") else None,
+        )
+        for event_type in event_types
+    ]
+
+
+def _soak_worker(
+    path: Path,
+    journal_mode: str,
+    synchronous: str,
+    duration_seconds: float,
+    start: threading.Barrier,
+    latencies: list[float],
+    counts: list[int],
+    errors: list[str],
+) -> None:
+    events = 0
+    try:
+        with RuntimeLedger(path, journal_mode=journal_mode, synchronous=synchronous) as ledger:
+            ledger.connection.execute("PRAGMA busy_timeout = 30000")
+            start.wait()
+            deadline = time.perf_counter() + duration_seconds
+            while time.perf_counter() < deadline:
+                began = time.perf_counter()
+                run_id = ledger.create_run(skill_name=SKILL_NAME, skill_version=SKILL_VERSION)
+                latencies.append(time.perf_counter() - began)
+                for event_types, barrier in ((PRE_ACTION_BATCH, True), (POST_ACTION_BATCH, False)):
+                    began = time.perf_counter()
+                    ledger.append_events(_batch(run_id, event_types), barrier=barrier)
+                    latencies.append(time.perf_counter() - began)
+                events += 1 + len(PRE_ACTION_BATCH) + len(POST_ACTION_BATCH)
+    except (sqlite3.Error, ValueError, threading.BrokenBarrierError) as exc:
+        errors.append(f"{type(exc).__name__}: {exc}")
+        start.abort()
+    finally:
+        counts.append(events)
+
+
+def soak_profile(
+    work_dir: Path,
+    profile: str,
+    *,
+    threads: int,
+    duration_seconds: float,
+) -> dict[str, Any]:
+    """Run `threads` concurrent writers against a fresh ledger for a fixed time."""
+
+    journal_mode, synchronous = PROFILES[profile]
+    path = work_dir / f"{profile}.db"
+    for suffix in ("", "-wal", "-shm", "-journal"):
+        Path(f"{path}{suffix}").unlink(missing_ok=True)
+    RuntimeLedger(path, journal_mode=journal_mode, synchronous=synchronous).close()
+    start = threading.Barrier(threads + 1)
+    latencies: list[float] = []
+    counts: list[int] = []
+    errors: list[str] = []
+    workers = [
+        threading.Thread(
+            target=_soak_worker,
+            args=(
+                path,
+                journal_mode,
+                synchronous,
+                duration_seconds,
+                start,
+                latencies,
+                counts,
+                errors,
+            ),
+        )
+        for _ in range(threads)
+    ]
+    for worker in workers:
+        worker.start()
+    try:
+        start.wait()
+    except threading.BrokenBarrierError:
+        pass
+    began = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - began
+    if errors:
+        raise RuntimeError(f"{profile}: {errors[0]}")
+    events = sum(counts)
+    return {
+        "profile": profile,
+        "journal_mode": journal_mode,
+        "synchronous": synchronous,
+        "threads": threads,
+        "elapsed_seconds": round(elapsed, 3),
+        "transactions": len(latencies),
+        "events": events,
+        "appends_per_second": round(events / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(statistics.median(latencies) * 1000, 3) if latencies else None,
+        "p99_ms": round(percentile_higher(latencies, 0.99) * 1000, 3) if latencies else None,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--profile",
+        action="append",
+        choices=sorted(PROFILES),
+        help="Profile to soak; repeat for several (default: all)",
+    )
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--duration-seconds", type=float, default=10.0)
+    parser.add_argument(
+        "--work-dir",
+        type=Path,
+        help="Directory for the scratch ledgers (default: a temporary directory)",
+    )
+    args = parser.parse_args(argv)
+    if args.threads < 1 or args.duration_seconds <= 0:
+        parser.error("--threads and --duration-seconds must be positive")
+    profiles = args.profile or list(PROFILES)
+    with tempfile.TemporaryDirectory(prefix="skill0-ledger-soak-") as scratch:
+        work_dir = args.work_dir or Path(scratch)
+        work_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            results = [
+                soak_profile(
+                    work_dir,
+                    profile,
+                    threads=args.threads,
+                    duration_seconds=args.duration_seconds,
+                )
+                for profile in profiles
+            ]
+        except (RuntimeError, OSError) as exc:
+            print(
+                json.dumps({"error": type(exc).__name__, "detail": str(exc)}),
+                file=sys.stderr,
+            )
+            return 2
+    payload = {
+        "captured_at": datetime.now(timezone.utc).isoformat(),
+        "environment": {
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+        },
+        "profiles": results,
+    }
+    print(json.dumps(payload, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
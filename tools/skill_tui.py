@@ -36,6 +36,11 @@ except ImportError:
 
 # Project root relative to this file
 REPO_ROOT = Path(__file__).parent.parent
+if str(REPO_ROOT.resolve()) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT.resolve()))
+
+from asset_registry.corpus_pack import CorpusPackError, CorpusReader
+
 PARSED_DIR = REPO_ROOT / "parsed"
 SCHEMA_FILE = REPO_ROOT / "schema" / "skill-decomposition.schema.json"
 
@@ -82,15 +87,15 @@ def load_parsed_skills(parsed_dir=None):
     skills = []
     if not search_dir.exists():
         return skills
-    for path in sorted(search_dir.glob("*.json")):
-        try:
-            with open(path, encoding="utf-8") as f:
-                skill = json.load(f)
-            skill["_filename"] = path.name
-            skill["_path"] = str(path)
-            skills.append(skill)
-        except (json.JSONDecodeError, OSError):
-            pass
+    with CorpusReader(search_dir) as corpus:
+        for path in corpus.paths("*.json"):
+            try:
+                skill = corpus.load(path)
+                skill["_filename"] = path.name
+                skill["_path"] = str(path)
+                skills.append(skill)
+            except (json.JSONDecodeError, OSError, CorpusPackError):
+                pass
     return skills
 
 
@@ -3,13 +3,14 @@ Skill Embedder - 將 skill 定義轉換為向量嵌入
 使用 sentence-transformers 的 all-MiniLM-L6-v2 模型
 """
 
-import json
 import logging
 import os
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 import numpy as np
 
+from asset_registry.corpus_pack import CorpusReader
+
 logger = logging.getLogger(__name__)
 
 
@@ -208,9 +209,10 @@ class SkillEmbedder:
         parsed_path = Path(parsed_dir)
         skills = []
         
-        for json_file in sorted(parsed_path.glob('*-skill.json')):
-            with open(json_file, 'r', encoding='utf-8') as f:
-                skill = json.load(f)
+        # 有最新的 corpus pack 時直接從 mmap 解碼，否則逐檔讀取
+        with CorpusReader(parsed_path) as corpus:
+            for json_file in corpus.paths('*-skill.json'):
+                skill = corpus.load(json_file)
                 skill['_filename'] = json_file.name
                 skills.append(skill)
                 
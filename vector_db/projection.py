@@ -0,0 +1,202 @@
+"""
+Embedding Projection - 降維向量表示
+以 PCA 或 Matryoshka 截斷將 384 維向量投影至較小維度，供記憶體受限的搜尋節點使用
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import hashlib
+from pathlib import Path
+from typing import Dict, Union
+
+import numpy as np
+
+
+PROJECTION_METHODS = ("pca", "matryoshka")
+DEFAULT_MIGRATION_DIR = Path(__file__).resolve().parent.parent / "migrations" / "index"
+
+
+@dataclass(frozen=True, eq=False)
+class EmbeddingProjection:
+    """A fitted linear projection from model vectors to stored vectors."""
+
+    method: str
+    source_dimension: int
+    dimension: int
+    mean: np.ndarray
+    components: np.ndarray
+    retained_variance: float = 1.0
+
+    def __post_init__(self):
+        if self.method not in PROJECTION_METHODS:
+            raise ValueError(f"unsupported projection method: {self.method}")
+        if self.mean.shape != (self.source_dimension,):
+            raise ValueError("projection mean does not match source dimension")
+        if self.components.shape != (self.dimension, self.source_dimension):
+            raise ValueError("projection components do not match dimensions")
+
+    @classmethod
+    def fit(
+        cls, vectors: np.ndarray, dimension: int, *, method: str = "pca"
+    ) -> "EmbeddingProjection":
+        """Fit a projection over the full corpus of model vectors."""
+
+        matrix = np.asarray(vectors, dtype=np.float64)
+        if matrix.ndim != 2:
+            raise ValueError("projection fitting requires a 2-D vector matrix")
+        count, source_dimension = matrix.shape
+        if not 0 < dimension < source_dimension:
+            raise ValueError(
+                f"reduced dimension must be between 1 and {source_dimension - 1}"
+            )
+        if method == "matryoshka":
+            components = np.eye(dimension, source_dimension)
+            retained = float(
+                np.square(matrix[:, :dimension]).sum() / np.square(matrix).sum()
+            ) if count else 1.0
+            return cls(
+                method=method,
+                source_dimension=source_dimension,
+                dimension=dimension,
+                mean=np.zeros(source_dimension, dtype=np.float32),
+                components=components.astype(np.float32),
+                retained_variance=retained,
+            )
+        if method != "pca":
+            raise ValueError(f"unsupported projection method: {method}")
+        if count < dimension:
+            raise ValueError(
+                f"PCA to {dimension} dimensions requires at least {dimension} vectors"
+            )
+        mean = matrix.mean(axis=0)
+        _, singular, basis = np.linalg.svd(matrix - mean, full_matrices=False)
+        components = basis[:dimension]
+        # 固定每個主成分的正負號，讓同一份語料每次擬合出相同的 digest
+        pivots = np.argmax(np.abs(components), axis=1)
+        components = components * np.sign(components[np.arange(dimension), pivots])[:, None]
+        variance = np.square(singular)
+        total = float(variance.sum())
+        return cls(
+            method=method,
+            source_dimension=source_dimension,
+            dimension=dimension,
+            mean=mean.astype(np.float32),
+            components=components.astype(np.float32),
+            retained_variance=float(variance[:dimension].sum() / total) if total else 1.0,
+        )
+
+    @property
+    def digest(self) -> str:
+        digest = hashlib.sha256()
+        digest.update(
+            f"{self.method}:{self.source_dimension}:{self.dimension}:".encode("ascii")
+        )
+        digest.update(np.ascontiguousarray(self.mean, dtype=np.float32).tobytes())
+        digest.update(np.ascontiguousarray(self.components, dtype=np.float32).tobytes())
+        return "sha256:" + digest.hexdigest()
+
+    def representation_version(self, base: str) -> str:
+        """Name the reduced representation so it never aliases the full one."""
+
+        return f"{base}+{self.method}{self.dimension}-{self.digest[7:19]}"
+
+    def project(self, vectors: np.ndarray) -> np.ndarray:
+        """Project one vector or a matrix of vectors; queries use the same path."""
+
+        array = np.asarray(vectors, dtype=np.float32)
+        if array.shape[-1] != self.source_dimension:
+            raise ValueError(
+                f"projection expects dimension {self.source_dimension}, "
+                f"got {array.shape[-1]}"
+            )
+        projected = (array - self.mean) @ self.components.T
+        if self.method == "matryoshka":
+            norms = np.linalg.norm(projected, axis=-1, keepdims=True)
+            projected = projected / np.where(norms == 0, 1.0, norms)
+        return projected.astype(np.float32)
+
+
+def build_reduced_index(
+    source_db: Union[str, Path],
+    target_db: Union[str, Path],
+    *,
+    dimension: int,
+    method: str = "pca",
+    migration_dir: Path = DEFAULT_MIGRATION_DIR,
+) -> Dict[str, object]:
+    """Derive a reduced-dimension Index from a full Index without re-embedding.
+
+    The projection is fitted once over every stored vector, persisted in the
+    target, and the target is built in a shadow file before being swapped in.
+    """
+
+    from asset_registry.sqlite import (
+        INDEX_POLICY,
+        apply_migrations,
+        connect_sqlite,
+        load_migrations,
+        preflight_index_schema,
+        swap_database,
+    )
+    from .vector_store import VectorStore
+
+    target_db = Path(target_db)
+    with VectorStore(source_db, initialize_schema=False) as source:
+        if not source.has_asset_index_state():
+            raise RuntimeError("asset_index_state migration is required")
+        if source.projection is not None:
+            raise RuntimeError("source Index is already a reduced representation")
+        records = source.get_asset_records()
+    if not records:
+        raise RuntimeError("source Index has no Asset projections to reduce")
+
+    projection = EmbeddingProjection.fit(
+        np.stack([record["embedding"] for record in records]),
+        dimension,
+        method=method,
+    )
+    vectors = projection.project(np.stack([record["embedding"] for record in records]))
+    indexed_at = datetime.now(timezone.utc).isoformat()
+    skills = [record["skill"] for record in records]
+    states = [
+        {
+            **record["state"],
+            "representation_version": projection.representation_version(
+                record["state"]["representation_version"]
+            ),
+            "indexed_at": indexed_at,
+        }
+        for record in records
+    ]
+
+    shadow_path = target_db.with_name(target_db.name + ".shadow")
+    for candidate in (shadow_path, shadow_path.with_name(shadow_path.name + "-journal")):
+        candidate.unlink(missing_ok=True)
+    try:
+        with VectorStore(shadow_path, dimension=projection.dimension) as target:
+            apply_migrations(target.conn, load_migrations(migration_dir))
+            target.save_projection(projection)
+            target.reconcile_assets_batch(
+                skills,
+                list(vectors),
+                states,
+                active_source_paths={state["source_path"] for state in states},
+            )
+        with connect_sqlite(shadow_path, policy=INDEX_POLICY, mode="read_only") as connection:
+            preflight_index_schema(connection, expected_dimension=projection.dimension)
+        integrity = swap_database(shadow_path, target_db)
+    except BaseException:
+        for candidate in (shadow_path, shadow_path.with_name(shadow_path.name + "-journal")):
+            candidate.unlink(missing_ok=True)
+        raise
+    return {
+        "rows": len(records),
+        "method": projection.method,
+        "dimension": projection.dimension,
+        "representation_version": states[0]["representation_version"],
+        "projection_digest": projection.digest,
+        "retained_variance": projection.retained_variance,
+        "integrity": integrity,
+    }
@@ -12,13 +12,14 @@ from pathlib import Path
 import threading
 from contextlib import contextmanager
 from functools import wraps
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Mapping, Optional, Tuple, Union
 import numpy as np
 
 from .embedder import SkillEmbedder
+from .projection import PROJECTION_METHODS, EmbeddingProjection, build_reduced_index
 from .vector_store import VectorStore
 from asset_registry.repositories import LegacySkillAssetRepository
-from asset_registry.search import AssetSearchResult
+from asset_registry.search import AssetSearchResult, search_stage
 
 
 REPRESENTATION_VERSION = "skill-text-v1"
@@ -28,6 +29,8 @@ def _serialized(method):
     @wraps(method)
     def wrapper(self, *args, **kwargs):
         with self._operation_lock:
+            # 每個讀寫入口都先確認 Index 檔案沒有被 shadow 替換
+            self.reopen_if_swapped()
             return method(self, *args, **kwargs)
 
     return wrapper
@@ -39,6 +42,7 @@ class IndexReport:
     changed: int
     unchanged: int
     removed: int
+    reused: int = 0
 
 
 def _default_model_name() -> str:
@@ -50,6 +54,10 @@ def _default_model_name() -> str:
 
 class SemanticSearch:
     """語義搜尋引擎"""
+
+    projection: Optional[EmbeddingProjection] = None
+    _representation: Optional[str] = None
+    _model_pinned = True
     
     def __init__(
         self,
@@ -57,38 +65,65 @@ class SemanticSearch:
         model_name: Optional[str] = None,
         *,
         initialize_schema: bool = True,
+        projection: Optional[EmbeddingProjection] = None,
+        representation: Optional[str] = None,
     ):
         """
         初始化搜尋引擎
         
         Args:
             db_path: 向量資料庫路徑
-            model_name: embedding 模型名稱
+            model_name: embedding 模型名稱；未指定時採用表示記錄的模型
+            projection: 新建降維索引時使用的投影；既有索引一律採用已儲存的投影
+            representation: 查詢使用的具名表示 (預設 SKILL0_INDEX_REPRESENTATION，
+                未設定則跟隨索引的預設表示)
         """
-        self.model_name = model_name or os.getenv('SKILL0_EMBEDDING_MODEL', _default_model_name())
+        self._representation = representation or os.getenv('SKILL0_INDEX_REPRESENTATION') or None
+        self._model_pinned = model_name is not None
         self.dimension = SkillEmbedder.DEFAULT_DIMENSION
         self._embedder: Optional[SkillEmbedder] = None
         self._operation_lock = threading.RLock()
         self.store = VectorStore(
             db_path,
-            dimension=self.dimension,
+            dimension=projection.dimension if projection else self.dimension,
             initialize_schema=initialize_schema,
+            representation=self._representation,
+        )
+        record = self.store.representation_record
+        self.model_name = (
+            model_name
+            or (record["embedding_model_name"] if record else None)
+            or os.getenv('SKILL0_EMBEDDING_MODEL', _default_model_name())
         )
+        stored = self.store.projection
+        if projection is not None and stored is not None and stored.digest != projection.digest:
+            self.store.close()
+            raise RuntimeError("Index was reduced with a different projection")
+        self.projection = stored or projection
 
     @contextmanager
     def open_unit_of_work(self):
         """Open one factory-backed Index connection while sharing model state."""
 
-        clone = object.__new__(SemanticSearch)
-        clone.model_name = self.model_name
-        clone.dimension = self.dimension
-        clone._embedder = self._embedder
-        clone._operation_lock = self._operation_lock
-        clone.store = VectorStore(
+        self.reopen_if_swapped()
+        store = VectorStore(
             self.store.db_path,
             dimension=self.store.dimension,
             initialize_schema=False,
+            representation=self._representation,
         )
+        record = store.representation_record
+        if (
+            not self._model_pinned
+            and record
+            and record["embedding_model_name"]
+            and record["embedding_model_name"] != self.model_name
+        ):
+            # 預設表示已切換到其他模型：後續查詢改用新模型
+            with self._operation_lock:
+                self.model_name = record["embedding_model_name"]
+                self._embedder = None
+        clone = self._clone(store)
         try:
             yield clone
             if self._embedder is None and clone._embedder is not None:
@@ -97,6 +132,39 @@ class SemanticSearch:
         finally:
             clone.close()
 
+    def _clone(self, store: VectorStore) -> "SemanticSearch":
+        clone = object.__new__(SemanticSearch)
+        clone.model_name = self.model_name
+        clone.dimension = self.dimension
+        clone._embedder = self._embedder
+        clone._operation_lock = self._operation_lock
+        clone._representation = store.representation
+        clone._model_pinned = self._model_pinned
+        clone.store = store
+        clone.projection = store.projection or self.projection
+        return clone
+
+    def reopen_if_swapped(self) -> bool:
+        """Reattach the long-lived store after a shadow Index was promoted.
+
+        Every serialized entry point and ``open_unit_of_work`` call this
+        first, so a long-lived engine never keeps reading the replaced file.
+        """
+
+        with self._operation_lock:
+            if not self.store.is_swapped():
+                return False
+            replacement = VectorStore(
+                self.store.db_path,
+                dimension=self.store.dimension,
+                initialize_schema=False,
+                representation=self._representation,
+            )
+            previous, self.store = self.store, replacement
+            self.projection = replacement.projection
+            previous.close()
+            return True
+
     @property
     def embedder(self) -> SkillEmbedder:
         """延遲初始化 embedder，避免純讀取路徑碰到模型載入。"""
@@ -105,6 +173,20 @@ class SemanticSearch:
             self.dimension = self._embedder.dimension
         return self._embedder
 
+    def _embed_skills(self, skills: List[Dict], show_progress: bool) -> List[np.ndarray]:
+        embeddings = self.embedder.embed_skills(skills, show_progress=show_progress)
+        if self.projection is None or not embeddings:
+            return embeddings
+        return list(self.projection.project(np.stack(embeddings)))
+
+    def _embed_query(self, query: str) -> np.ndarray:
+        """查詢向量與儲存向量走同一個投影。"""
+        with search_stage("embed"):
+            embedding = self.embedder.embed_query(query)
+            if self.projection is None:
+                return embedding
+            return self.projection.project(embedding)
+
     def _embedding_identity(self) -> tuple[str, str]:
         model_path = Path(self.model_name)
         model_id = model_path.name if model_path.exists() else self.model_name
@@ -147,7 +229,7 @@ class SemanticSearch:
             return 0
             
         print(f"Embedding {len(skills)} skills...")
-        embeddings = self.embedder.embed_skills(skills, show_progress=show_progress)
+        embeddings = self._embed_skills(skills, show_progress=show_progress)
         
         print(f"Indexing to database...")
         self.store.insert_skills_batch(skills, embeddings)
@@ -162,11 +244,20 @@ class SemanticSearch:
         *,
         representation_version: str = REPRESENTATION_VERSION,
         show_progress: bool = True,
+        embedding_cache: Optional[Mapping[Tuple[str, ...], np.ndarray]] = None,
     ) -> IndexReport:
-        """Incrementally reconcile Skill-backed Asset projections."""
+        """Incrementally reconcile Skill-backed Asset projections.
+
+        ``embedding_cache`` maps a complete index identity to a vector that was
+        already computed for it, e.g. from the live Index during a shadow build.
+        """
 
         if not self.store.has_asset_index_state():
             raise RuntimeError("asset_index_state migration is required")
+        if self.projection is not None:
+            representation_version = self.projection.representation_version(
+                representation_version
+            )
         repository = LegacySkillAssetRepository(Path(parsed_dir))
         revisions = repository.list_revisions()
         model_id, model_version = self._embedding_identity()
@@ -175,6 +266,17 @@ class SemanticSearch:
                 "Incremental indexing requires SKILL0_EMBEDDING_MODEL_VERSION "
                 "or a digestible local model directory"
             )
+        record = self.store.representation_record
+        if record is not None and (
+            record["representation_version"],
+            record["embedding_model_id"],
+            record["embedding_model_version"],
+        ) != (representation_version, model_id, model_version):
+            raise RuntimeError(
+                f"representation {record['name']} was built with "
+                f"{record['embedding_model_id']}@{record['embedding_model_version']}; "
+                "build a new representation instead of mixing models"
+            )
         existing = {
             (
                 row["asset_id"], row["revision_id"], row["representation_version"],
@@ -184,6 +286,7 @@ class SemanticSearch:
             for row in self.store.get_index_state()
         }
         changed = []
+        cached: Dict[int, np.ndarray] = {}
         active_sources = {item.source_path.as_posix() for item in revisions}
         existing_sources = {item[-1] for item in existing}
         for revision in revisions:
@@ -197,6 +300,8 @@ class SemanticSearch:
                 revision.source_path.as_posix(),
             )
             if identity not in existing:
+                if embedding_cache is not None and identity in embedding_cache:
+                    cached[len(changed)] = embedding_cache[identity]
                 changed.append(revision)
 
         skills = []
@@ -219,11 +324,20 @@ class SemanticSearch:
             )
 
         with self._operation_lock:
-            embeddings = (
-                self.embedder.embed_skills(skills, show_progress=show_progress)
-                if skills
+            pending = [
+                skill for index, skill in enumerate(skills) if index not in cached
+            ]
+            computed = iter(
+                self._embed_skills(pending, show_progress=show_progress)
+                if pending
                 else []
             )
+            embeddings = [
+                cached[index] if index in cached else next(computed)
+                for index in range(len(skills))
+            ]
+            if self.projection is not None and self.store.projection is None:
+                self.store.save_projection(self.projection)
             self.store.reconcile_assets_batch(
                 skills,
                 embeddings,
@@ -235,7 +349,54 @@ class SemanticSearch:
             changed=len(changed),
             unchanged=len(revisions) - len(changed),
             removed=len(existing_sources - active_sources),
+            reused=len(cached),
+        )
+
+    def build_representation(
+        self,
+        name: str,
+        parsed_dir: Union[str, Path],
+        *,
+        show_progress: bool = True,
+        embedding_cache: Optional[Mapping[Tuple[str, ...], np.ndarray]] = None,
+    ) -> IndexReport:
+        """Build a named representation beside the serving one with this model.
+
+        The new representation stays ``building`` until every revision is
+        indexed and only then becomes ``ready``; it does not serve queries
+        until a cutover makes it the default.
+        """
+
+        self.reopen_if_swapped()
+        model_id, model_version = self._embedding_identity()
+        representation_version = REPRESENTATION_VERSION
+        if self.projection is not None:
+            representation_version = self.projection.representation_version(
+                representation_version
+            )
+        self.store.create_representation(
+            name,
+            dimension=self.store.dimension if self.projection else self.embedder.dimension,
+            representation_version=representation_version,
+            model_name=self.model_name,
+            model_id=model_id,
+            model_version=model_version,
+        )
+        target = self._clone(
+            VectorStore(self.store.db_path, initialize_schema=False, representation=name)
         )
+        try:
+            if self.projection is not None:
+                target.store.save_projection(self.projection)
+            report = target.index_assets(
+                parsed_dir,
+                show_progress=show_progress,
+                embedding_cache=embedding_cache,
+            )
+            target.store.mark_representation_ready(name)
+        finally:
+            target.close()
+        return report
 
     @_serialized
     def search_assets(
@@ -248,8 +409,9 @@ class SemanticSearch:
         if "skill" not in asset_types:
             return []
         with self._operation_lock:
-            query_embedding = self.embedder.embed_query(query)
-            results = self.store.search_assets(query_embedding, limit=limit)
+            query_embedding = self._embed_query(query)
+            with search_stage("vector_query"):
+                results = self.store.search_assets(query_embedding, limit=limit)
         return [
             AssetSearchResult(
                 **row,
@@ -271,8 +433,9 @@ class SemanticSearch:
             List[Dict]: 匹配的 skills (含相似度分數)
         """
         with self._operation_lock:
-            query_embedding = self.embedder.embed_query(query)
-            results = self.store.search(query_embedding, limit=limit)
+            query_embedding = self._embed_query(query)
+            with search_stage("vector_query"):
+                results = self.store.search(query_embedding, limit=limit)
         
         # 轉換 distance 為 similarity (0-1)
         for r in results:
@@ -311,7 +474,8 @@ class SemanticSearch:
             return []
             
         # 搜尋相似 (多取一個因為會包含自身)
-        results = self.store.search(embedding, limit=limit + 1)
+        with search_stage("vector_query"):
+            results = self.store.search(embedding, limit=limit + 1)
         
         # 排除自身
         results = [r for r in results if r['id'] != target['id']]
@@ -346,7 +510,7 @@ class SemanticSearch:
             if emb is not None:
                 embeddings.append(emb)
             else:
-                embeddings.append(np.zeros(self.embedder.dimension))
+                embeddings.append(np.zeros(self.store.dimension))
                 
         embeddings = np.array(embeddings)
         
@@ -369,6 +533,9 @@ class SemanticSearch:
         """取得搜尋引擎統計"""
         stats = self.store.get_statistics()
         stats['embedding_dimension'] = self.dimension
+        if self.projection is not None:
+            stats['stored_dimension'] = self.store.dimension
+            stats['projection_method'] = self.projection.method
         stats['model_name'] = self.model_name
         return stats
     
@@ -413,12 +580,30 @@ def main():
     
     # stats 子命令
     stats_parser = subparsers.add_parser('stats', help='Show statistics')
+
+    # reduce 子命令
+    reduce_parser = subparsers.add_parser(
+        'reduce', help='Derive a reduced-dimension index from the full index'
+    )
+    reduce_parser.add_argument('--output', required=True, help='Reduced index path')
+    reduce_parser.add_argument('--dimension', type=int, default=128, help='Stored vector dimension')
+    reduce_parser.add_argument(
+        '--method', choices=PROJECTION_METHODS, default='pca', help='Projection method'
+    )
     
     args = parser.parse_args()
     
     if not args.command:
         parser.print_help()
         return
+
+    if args.command == 'reduce':
+        # 直接由既有向量擬合投影，不需載入模型
+        result = build_reduced_index(
+            args.db, args.output, dimension=args.dimension, method=args.method
+        )
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+        return
         
     search_engine = SemanticSearch(db_path=args.db)
     
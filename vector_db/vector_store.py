@@ -4,11 +4,21 @@ Vector Store - SQLite-vec 向量資料庫封裝
 
 import sqlite3
 import json
+import re
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 import numpy as np
 
-from asset_registry.sqlite import INDEX_POLICY, connect_sqlite
+from asset_registry.sqlite import (
+    INDEX_POLICY,
+    connect_sqlite,
+    read_database_generation,
+)
+from .projection import EmbeddingProjection
+
+PRIMARY_REPRESENTATION = "primary"
+_REPRESENTATION_NAME = re.compile(r"^[a-z0-9][a-z0-9_-]{0,62}$")
 
 try:
     import sqlite_vec
@@ -26,6 +36,7 @@ class VectorStore:
         dimension: int = 384,
         *,
         initialize_schema: bool = True,
+        representation: Optional[str] = None,
     ):
         """
         初始化向量資料庫
@@ -33,6 +44,7 @@ class VectorStore:
         Args:
             db_path: 資料庫檔案路徑
             dimension: 向量維度 (預設 384 for all-MiniLM-L6-v2)
+            representation: 具名向量表示；未指定時使用索引的預設表示
         """
         if not SQLITE_VEC_AVAILABLE:
             raise ImportError("sqlite-vec not installed. Run: pip install sqlite-vec")
@@ -40,9 +52,14 @@ class VectorStore:
         self.db_path = Path(db_path)
         self.dimension = dimension
         self.conn = None
-        self._connect(initialize_schema=initialize_schema)
+        self.projection: Optional[EmbeddingProjection] = None
+        self.representation = PRIMARY_REPRESENTATION
+        self.representation_record: Optional[Dict] = None
+        self.vector_table = "skill_embeddings"
+        self._file_identity: Optional[Tuple[int, int]] = None
+        self._connect(initialize_schema=initialize_schema, representation=representation)
         
-    def _connect(self, *, initialize_schema: bool):
+    def _connect(self, *, initialize_schema: bool, representation: Optional[str] = None):
         """建立資料庫連線並載入 sqlite-vec 擴充"""
         if initialize_schema:
             self.conn = connect_sqlite(
@@ -66,6 +83,317 @@ class VectorStore:
             self._init_schema()
         else:
             self._validate_existing_schema()
+        self._resolve_representation(representation)
+        self._read_declared_dimension()
+        self.projection = self._load_projection()
+        self._file_identity = self._current_file_identity()
+
+    def _current_file_identity(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.db_path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_dev, stat.st_ino
+
+    @property
+    def generation(self) -> int:
+        """Swap generation of the database file this connection opened."""
+        return read_database_generation(self.conn)
+
+    def set_generation(self, generation: int) -> None:
+        self.conn.execute(f"PRAGMA user_version={int(generation)}")
+
+    def is_swapped(self) -> bool:
+        """Return True when a promoted shadow Index replaced the opened file."""
+        current = self._current_file_identity()
+        return current is not None and current != self._file_identity
+
+    def _has_representation_registry(self) -> bool:
+        return self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='index_representations'"
+        ).fetchone() is not None
+
+    def _resolve_representation(self, name: Optional[str]) -> None:
+        """Select the vector table for a named or the default representation."""
+
+        if not self._has_representation_registry():
+            if name not in (None, PRIMARY_REPRESENTATION):
+                raise RuntimeError("index_representations migration is required")
+            return
+        if name is None:
+            row = self.conn.execute(
+                "SELECT * FROM index_representations WHERE is_default = 1"
+            ).fetchone()
+        else:
+            row = self.conn.execute(
+                "SELECT * FROM index_representations WHERE name = ?", (name,)
+            ).fetchone()
+            if row is None and name != PRIMARY_REPRESENTATION:
+                raise RuntimeError(f"unknown index representation: {name}")
+        if row is not None:
+            self.representation = row["name"]
+            self.vector_table = row["vector_table"]
+            self.representation_record = dict(row)
+
+    def _state_scope(self, keyword: str = "AND", *, alias: str = "state"):
+        """Restrict asset_index_state to this representation once it is migrated."""
+
+        if not self._has_representation_registry():
+            return "", ()
+        return f"{keyword} {alias}.representation = ?", (self.representation,)
+
+    def _skill_scope(self, keyword: str = "WHERE") -> str:
+        """Restrict skills to the rows this representation has vectors for.
+
+        A build in progress keeps its own copies of changed skills, which
+        must not be listed or counted beside the serving rows.
+        """
+
+        if not self._has_representation_registry():
+            return ""
+        return f"{keyword} skills.id IN (SELECT rowid FROM {self.vector_table})"
+
+    def _vector_tables(self) -> List[str]:
+        tables = ["skill_embeddings"]
+        if self._has_representation_registry():
+            tables.extend(
+                row[0]
+                for row in self.conn.execute(
+                    "SELECT vector_table FROM index_representations ORDER BY name"
+                )
+                if row[0] not in tables
+            )
+        return tables
+
+    def list_representations(self) -> List[Dict]:
+        """List registered representations plus the implicit primary one."""
+
+        if not self._has_representation_registry():
+            return []
+        counts = {
+            row[0]: row[1]
+            for row in self.conn.execute(
+                "SELECT representation, COUNT(*) FROM asset_index_state GROUP BY representation"
+            )
+        }
+        records = [
+            dict(row)
+            for row in self.conn.execute("SELECT * FROM index_representations ORDER BY name")
+        ]
+        if not any(item["name"] == PRIMARY_REPRESENTATION for item in records):
+            records.insert(0, {
+                "name": PRIMARY_REPRESENTATION,
+                "vector_table": "skill_embeddings",
+                "status": "ready",
+                "is_default": int(not any(item["is_default"] for item in records)),
+            })
+        for item in records:
+            item["rows"] = counts.get(item["name"], 0)
+        return records
+
+    def create_representation(
+        self,
+        name: str,
+        *,
+        dimension: int,
+        representation_version: str,
+        model_name: str,
+        model_id: str,
+        model_version: str,
+    ) -> Dict:
+        """Register a building representation with its own vec0 table.
+
+        Re-creating an existing representation with the same identity resumes it.
+        """
+
+        if not self._has_representation_registry():
+            raise RuntimeError("index_representations migration is required")
+        if name == PRIMARY_REPRESENTATION or not _REPRESENTATION_NAME.match(name):
+            raise ValueError(f"invalid representation name: {name}")
+        existing = self.conn.execute(
+            "SELECT * FROM index_representations WHERE name = ?", (name,)
+        ).fetchone()
+        if existing is not None:
+            identity = (dimension, representation_version, model_id, model_version)
+            recorded = (
+                existing["dimension"], existing["representation_version"],
+                existing["embedding_model_id"], existing["embedding_model_version"],
+            )
+            if existing["status"] == "retired" or identity != recorded:
+                raise RuntimeError(
+                    f"representation {name} already exists with a different identity"
+                )
+            return dict(existing)
+        vector_table = "skill_embeddings__" + name.replace("-", "_")
+        with self.conn:
+            self.conn.execute(
+                f"CREATE VIRTUAL TABLE {vector_table} USING vec0(embedding FLOAT[{int(dimension)}])"
+            )
+            self.conn.execute(
+                """
+                INSERT INTO index_representations(
+                    name, vector_table, dimension, representation_version,
+                    embedding_model_name, embedding_model_id, embedding_model_version,
+                    status, is_default, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, 'building', 0, ?)
+                """,
+                (
+                    name, vector_table, int(dimension), representation_version,
+                    model_name, model_id, model_version,
+                    datetime.now(timezone.utc).isoformat(),
+                ),
+            )
+        return dict(
+            self.conn.execute(
+                "SELECT * FROM index_representations WHERE name = ?", (name,)
+            ).fetchone()
+        )
+
+    def mark_representation_ready(self, name: str) -> None:
+        with self.conn:
+            updated = self.conn.execute(
+                """
+                UPDATE index_representations SET status = 'ready', ready_at = ?
+                WHERE name = ? AND status IN ('building', 'ready')
+                """,
+                (datetime.now(timezone.utc).isoformat(), name),
+            )
+        if updated.rowcount != 1:
+            raise RuntimeError(f"representation {name} cannot be marked ready")
+
+    def set_default_representation(
+        self,
+        name: str,
+        *,
+        expected_identities: Optional[set] = None,
+    ) -> Dict[str, str]:
+        """Atomically flip the default after verifying the target is complete.
+
+        ``expected_identities`` holds ``(asset_id, revision_id, content_hash,
+        source_path)`` for every current registry revision; the flip is refused
+        unless the target covers exactly that set. The previous default is
+        retired so that garbage collection can reclaim it.
+        """
+
+        if not self._has_representation_registry():
+            raise RuntimeError("index_representations migration is required")
+        with self.conn:
+            target = self.conn.execute(
+                "SELECT * FROM index_representations WHERE name = ?", (name,)
+            ).fetchone()
+            if target is None or target["status"] != "ready":
+                raise RuntimeError(f"representation {name} is not fully built")
+            indexed = {
+                tuple(row)
+                for row in self.conn.execute(
+                    """
+                    SELECT asset_id, revision_id, content_hash, source_path
+                    FROM asset_index_state WHERE representation = ?
+                    """,
+                    (name,),
+                )
+            }
+            if expected_identities is not None and indexed != set(expected_identities):
+                raise RuntimeError(
+                    f"representation {name} is incomplete: "
+                    f"missing={len(set(expected_identities) - indexed)},"
+                    f"extra={len(indexed - set(expected_identities))}"
+                )
+            previous = self.conn.execute(
+                "SELECT name FROM index_representations WHERE is_default = 1"
+            ).fetchone()
+            previous_name = previous[0] if previous else PRIMARY_REPRESENTATION
+            if previous_name == name:
+                return {"previous": previous_name, "current": name}
+            if previous is None:
+                self._register_retired_primary()
+            self.conn.execute(
+                """
+                UPDATE index_representations SET is_default = 0, status = 'retired'
+                WHERE name = ?
+                """,
+                (previous_name,),
+            )
+            self.conn.execute(
+                "UPDATE index_representations SET is_default = 1 WHERE name = ?",
+                (name,),
+            )
+        return {"previous": previous_name, "current": name}
+
+    def _register_retired_primary(self) -> None:
+        vector_sql = self.conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'skill_embeddings'"
+        ).fetchone()[0]
+        declared = re.search(r"float\[(\d+)\]", vector_sql or "", re.IGNORECASE)
+        identity = self.conn.execute(
+            """
+            SELECT representation_version, embedding_model_id, embedding_model_version
+            FROM asset_index_state WHERE representation = ? LIMIT 1
+            """,
+            (PRIMARY_REPRESENTATION,),
+        ).fetchone()
+        version, model_id, model_version = identity or ("unknown", "unknown", "unknown")
+        self.conn.execute(
+            """
+            INSERT INTO index_representations(
+                name, vector_table, dimension, representation_version,
+                embedding_model_name, embedding_model_id, embedding_model_version,
+                status, is_default, created_at
+            ) VALUES (?, 'skill_embeddings', ?, ?, NULL, ?, ?, 'retired', 0, ?)
+            """,
+            (
+                PRIMARY_REPRESENTATION,
+                int(declared.group(1)) if declared else self.dimension,
+                # asset_index_state 只保存模型 id；模型名稱未知時保持 NULL
+                version, model_id, model_version,
+                datetime.now(timezone.utc).isoformat(),
+            ),
+        )
+
+    def drop_retired_representations(self) -> List[str]:
+        """Reclaim every retired representation's vectors and index state."""
+
+        if not self._has_representation_registry():
+            return []
+        dropped = []
+        with self.conn:
+            retired = self.conn.execute(
+                """
+                SELECT name, vector_table FROM index_representations
+                WHERE status = 'retired' AND is_default = 0
+                ORDER BY name
+                """
+            ).fetchall()
+            has_projection = self._has_projection_table()
+            for name, vector_table in retired:
+                skill_row_ids = [
+                    row[0]
+                    for row in self.conn.execute(
+                        "SELECT skill_row_id FROM asset_index_state WHERE representation = ?",
+                        (name,),
+                    )
+                ]
+                self.conn.execute(
+                    "DELETE FROM asset_index_state WHERE representation = ?", (name,)
+                )
+                if vector_table == "skill_embeddings":
+                    # legacy schema 需要保留 skill_embeddings，只清空內容
+                    self.conn.execute("DELETE FROM skill_embeddings")
+                else:
+                    self.conn.execute(f"DROP TABLE {vector_table}")
+                if has_projection:
+                    self.conn.execute(
+                        "DELETE FROM embedding_projection WHERE representation = ?",
+                        (name,),
+                    )
+                self.conn.execute(
+                    "DELETE FROM index_representations WHERE name = ?", (name,)
+                )
+                self._delete_unreferenced_skill_rows(skill_row_ids)
+                dropped.append(name)
+            if dropped:
+                self._restore_forked_filenames()
+        return dropped
 
     def _validate_existing_schema(self):
         required = {"skills", "skill_embeddings"}
@@ -81,7 +409,77 @@ class VectorStore:
                 "Index database requires explicit maintenance initialization: "
                 + ", ".join(missing)
             )
-        
+
+    def _read_declared_dimension(self) -> None:
+        # 既有索引以 vec0 宣告的維度為準（降維索引不是 384 維）
+        vector_sql = self.conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = ?", (self.vector_table,)
+        ).fetchone()[0]
+        declared = re.search(r"float\[(\d+)\]", vector_sql or "", re.IGNORECASE)
+        if declared:
+            self.dimension = int(declared.group(1))
+
+    def _has_projection_table(self) -> bool:
+        return self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='embedding_projection'"
+        ).fetchone() is not None
+
+    def _load_projection(self) -> Optional[EmbeddingProjection]:
+        if not self._has_projection_table():
+            return None
+        row = self.conn.execute(
+            "SELECT * FROM embedding_projection WHERE representation = ?",
+            (self.representation,),
+        ).fetchone()
+        if row is None:
+            return None
+        projection = EmbeddingProjection(
+            method=row["method"],
+            source_dimension=row["source_dimension"],
+            dimension=row["dimension"],
+            mean=np.frombuffer(row["mean"], dtype=np.float32).copy(),
+            components=np.frombuffer(row["components"], dtype=np.float32)
+            .reshape(row["dimension"], row["source_dimension"])
+            .copy(),
+            retained_variance=row["retained_variance"],
+        )
+        if projection.digest != row["projection_digest"]:
+            raise RuntimeError("embedding_projection digest mismatch")
+        if projection.dimension != self.dimension:
+            raise RuntimeError(
+                f"embedding_projection dimension {projection.dimension} does not "
+                f"match stored vectors ({self.dimension})"
+            )
+        return projection
+
+    def save_projection(self, projection: EmbeddingProjection) -> None:
+        """Persist the projection every stored vector was reduced with."""
+
+        if projection.dimension != self.dimension:
+            raise ValueError(
+                f"projection dimension {projection.dimension} does not match "
+                f"stored vectors ({self.dimension})"
+            )
+        if not self._has_projection_table():
+            raise RuntimeError("embedding_projection migration is required")
+        with self.conn:
+            self.conn.execute('''
+                INSERT OR REPLACE INTO embedding_projection(
+                    representation, method, source_dimension, dimension, mean,
+                    components, retained_variance, projection_digest
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                self.representation,
+                projection.method,
+                projection.source_dimension,
+                projection.dimension,
+                projection.mean.astype(np.float32).tobytes(),
+                projection.components.astype(np.float32).tobytes(),
+                projection.retained_variance,
+                projection.digest,
+            ))
+        self.projection = projection
+
     def _init_schema(self):
         """初始化資料庫 schema"""
         # 技能元資料表
@@ -113,12 +511,21 @@ class VectorStore:
         
         self.conn.commit()
         
-    def _upsert_skill(self, skill: Dict, embedding: np.ndarray) -> int:
+    def _upsert_skill(
+        self,
+        skill: Dict,
+        embedding: np.ndarray,
+        *,
+        existing_id: Optional[int] = None,
+        find_existing: bool = True,
+    ) -> int:
         """
         Insert or update one skill and embedding without committing.
 
         The public insert methods own transaction boundaries so a batch can
-        commit atomically instead of committing after every row.
+        commit atomically instead of committing after every row. Callers that
+        already chose the row pass ``existing_id`` with ``find_existing=False``;
+        a ``None`` id then always inserts a new row.
         """
         if embedding.shape != (self.dimension,):
             raise ValueError(
@@ -130,9 +537,16 @@ class VectorStore:
         decomp = skill.get('decomposition', {})
         
         # 檢查是否已存在
-        existing = self.conn.execute(
-            'SELECT id FROM skills WHERE filename = ?', (filename,)
-        ).fetchone()
+        if find_existing:
+            existing = self.conn.execute(
+                'SELECT id FROM skills WHERE filename = ?', (filename,)
+            ).fetchone()
+            existing_id = existing['id'] if existing else None
+        elif existing_id is None and self.conn.execute(
+            'SELECT 1 FROM skills WHERE filename = ?', (filename,)
+        ).fetchone():
+            # skills.filename 唯一：分岔列以表示名稱區隔，回收舊表示後改回原名
+            filename = self._forked_filename(filename)
         
         name = meta.get('title') or meta.get('name', '')
         description = meta.get('description', '')
@@ -142,9 +556,9 @@ class VectorStore:
         rule_count = len(decomp.get('rules', []))
         directive_count = len(decomp.get('directives', []))
         
-        if existing:
+        if existing_id is not None:
             # 更新現有記錄
-            skill_id = existing['id']
+            skill_id = existing_id
             self.conn.execute('''
                 UPDATE skills SET
                     name = ?, description = ?, category = ?, version = ?,
@@ -158,11 +572,19 @@ class VectorStore:
                 skill_id
             ))
             
-            # 更新向量
-            self.conn.execute(
-                'UPDATE skill_embeddings SET embedding = ? WHERE rowid = ?',
-                (embedding, skill_id)
-            )
+            # 更新向量（具名表示可能尚未有這個 skill 的向量）
+            if self.conn.execute(
+                f'SELECT 1 FROM {self.vector_table} WHERE rowid = ?', (skill_id,)
+            ).fetchone():
+                self.conn.execute(
+                    f'UPDATE {self.vector_table} SET embedding = ? WHERE rowid = ?',
+                    (embedding, skill_id)
+                )
+            else:
+                self.conn.execute(
+                    f'INSERT INTO {self.vector_table} (rowid, embedding) VALUES (?, ?)',
+                    (skill_id, embedding)
+                )
         else:
             # 插入新記錄
             cursor = self.conn.execute('''
@@ -178,12 +600,85 @@ class VectorStore:
             
             # 插入向量 (rowid 必須與 skills.id 匹配)
             self.conn.execute(
-                'INSERT INTO skill_embeddings (rowid, embedding) VALUES (?, ?)',
+                f'INSERT INTO {self.vector_table} (rowid, embedding) VALUES (?, ?)',
                 (skill_id, embedding)
             )
             
         return skill_id
 
+    def _is_shared_skill_row(self, skill_row_id: int) -> bool:
+        return any(
+            self.conn.execute(
+                f"SELECT 1 FROM {table} WHERE rowid = ?", (skill_row_id,)
+            ).fetchone()
+            for table in self._vector_tables()
+            if table != self.vector_table
+        )
+
+    def _forked_filename(self, filename: str) -> str:
+        return f"{filename}#{self.representation}"
+
+    def _representation_skill_row(
+        self, skill: Dict, current_id: Optional[int]
+    ) -> Optional[int]:
+        """
+        Pick the skills row this representation may write ``skill`` into.
+
+        A row that another representation still has a vector for is serving
+        metadata for that index, so it is reused only while its content is
+        unchanged. Otherwise ``None`` asks for a row of our own, leaving the
+        other representation's name, description and raw_json untouched.
+        """
+        if current_id is not None:
+            candidates = [current_id]
+        else:
+            filename = skill.get('_filename', 'unknown.json')
+            candidates = [
+                row[0]
+                for row in self.conn.execute(
+                    "SELECT id FROM skills WHERE filename IN (?, ?) ORDER BY id",
+                    (filename, self._forked_filename(filename)),
+                )
+            ]
+        raw_json = json.dumps(skill, ensure_ascii=False)
+        for row_id in candidates:
+            if not self._is_shared_skill_row(row_id):
+                return row_id
+            stored = self.conn.execute(
+                "SELECT raw_json FROM skills WHERE id = ?", (row_id,)
+            ).fetchone()
+            if stored is not None and stored[0] == raw_json:
+                return row_id
+        return None
+
+    def _delete_unreferenced_skill_rows(self, skill_row_ids) -> None:
+        for skill_row_id in skill_row_ids:
+            # 其他表示仍引用時保留共用的 skills 列
+            if self.conn.execute(
+                "SELECT 1 FROM asset_index_state WHERE skill_row_id = ?",
+                (skill_row_id,),
+            ).fetchone() is not None:
+                continue
+            for table in self._vector_tables():
+                self.conn.execute(
+                    f"DELETE FROM {table} WHERE rowid = ?", (skill_row_id,)
+                )
+            self.conn.execute("DELETE FROM skills WHERE id = ?", (skill_row_id,))
+
+    def _restore_forked_filenames(self) -> None:
+        for row_id, raw_json, filename in self.conn.execute(
+            "SELECT id, raw_json, filename FROM skills WHERE instr(filename, '#') > 0"
+        ).fetchall():
+            original = json.loads(raw_json or "{}").get('_filename')
+            if not original or filename == original:
+                continue
+            if self.conn.execute(
+                "SELECT 1 FROM skills WHERE filename = ?", (original,)
+            ).fetchone() is None:
+                self.conn.execute(
+                    "UPDATE skills SET filename = ? WHERE id = ?", (original, row_id)
+                )
+
     def insert_skill(self, skill: Dict, embedding: np.ndarray) -> int:
         """
         插入單個 skill 及其向量
@@ -231,12 +726,12 @@ class VectorStore:
             List[Dict]: 相似 skills 列表 (含 distance 分數)
         """
         # sqlite-vec 需要使用 k=? 語法進行 KNN 查詢
-        results = self.conn.execute('''
+        results = self.conn.execute(f'''
             SELECT 
                 s.id, s.name, s.filename, s.description, s.category,
                 s.action_count, s.rule_count, s.directive_count,
                 e.distance
-            FROM skill_embeddings e
+            FROM {self.vector_table} e
             JOIN skills s ON e.rowid = s.id
             WHERE e.embedding MATCH ? AND k = ?
             ORDER BY e.distance
@@ -246,11 +741,11 @@ class VectorStore:
     
     def search_by_category(self, category: str, limit: int = 10) -> List[Dict]:
         """按類別搜尋 skills"""
-        results = self.conn.execute('''
+        results = self.conn.execute(f'''
             SELECT id, name, filename, description, category,
                    action_count, rule_count, directive_count
             FROM skills
-            WHERE category = ?
+            WHERE category = ? {self._skill_scope("AND")}
             LIMIT ?
         ''', (category, limit)).fetchall()
         
@@ -258,11 +753,12 @@ class VectorStore:
     
     def get_all_skills(self) -> List[Dict]:
         """取得所有 skills 的基本資訊"""
-        results = self.conn.execute('''
+        results = self.conn.execute(f'''
             SELECT id, name, filename, description, category, version,
                    action_count, rule_count, directive_count,
                    created_at
             FROM skills
+            {self._skill_scope()}
             ORDER BY name
         ''').fetchall()
         
@@ -273,21 +769,70 @@ class VectorStore:
     ) -> List[Dict]:
         """Search only revision-identified Asset projections."""
 
-        results = self.conn.execute('''
+        scope, params = self._state_scope()
+        results = self.conn.execute(f'''
             SELECT
                 state.asset_id, state.revision_id, 'skill' AS asset_type,
                 s.name, s.description, state.source_path, e.distance
-            FROM skill_embeddings e
+            FROM {self.vector_table} e
             JOIN skills s ON e.rowid = s.id
-            JOIN asset_index_state state ON state.vector_row_id = e.rowid
+            JOIN asset_index_state state ON state.vector_row_id = e.rowid {scope}
             WHERE e.embedding MATCH ? AND k = ?
             ORDER BY e.distance
-        ''', (query_embedding, limit)).fetchall()
+        ''', (*params, query_embedding, limit)).fetchall()
         return [dict(row) for row in results]
 
+    def get_indexed_embeddings(self) -> Dict[Tuple[str, ...], np.ndarray]:
+        """Return stored vectors keyed by their complete Asset index identity."""
+
+        scope, params = self._state_scope("WHERE")
+        rows = self.conn.execute(f'''
+            SELECT
+                state.asset_id, state.revision_id, state.representation_version,
+                state.embedding_model_id, state.embedding_model_version,
+                state.content_hash, state.source_path, e.embedding
+            FROM asset_index_state state
+            JOIN {self.vector_table} e ON e.rowid = state.vector_row_id
+            {scope}
+        ''', params).fetchall()
+        return {
+            tuple(row[:7]): np.frombuffer(row['embedding'], dtype=np.float32).copy()
+            for row in rows
+        }
+
+    def get_asset_records(self) -> List[Dict]:
+        """Return each Asset projection with its skill payload and stored vector."""
+
+        scope, params = self._state_scope("WHERE")
+        rows = self.conn.execute(f'''
+            SELECT
+                state.asset_id, state.revision_id, state.representation_version,
+                state.embedding_model_id, state.embedding_model_version,
+                state.content_hash, state.source_path, state.indexed_at,
+                s.raw_json, e.embedding
+            FROM asset_index_state state
+            JOIN skills s ON s.id = state.skill_row_id
+            JOIN {self.vector_table} e ON e.rowid = state.vector_row_id
+            {scope}
+            ORDER BY state.source_path
+        ''', params).fetchall()
+        return [
+            {
+                "state": {
+                    key: row[key]
+                    for key in row.keys()
+                    if key not in {"raw_json", "embedding"}
+                },
+                "skill": json.loads(row["raw_json"]),
+                "embedding": np.frombuffer(row["embedding"], dtype=np.float32).copy(),
+            }
+            for row in rows
+        ]
+
     def get_index_state(self) -> List[Dict]:
+        scope, params = self._state_scope("WHERE", alias="asset_index_state")
         rows = self.conn.execute(
-            "SELECT * FROM asset_index_state ORDER BY source_path"
+            f"SELECT * FROM asset_index_state {scope} ORDER BY source_path", params
         ).fetchall()
         return [dict(row) for row in rows]
 
@@ -309,45 +854,61 @@ class VectorStore:
         if not (len(skills) == len(embeddings) == len(states)):
             raise ValueError("skills, embeddings, and states must have the same length")
         ids: List[int] = []
+        scope, params = self._state_scope("AND", alias="asset_index_state")
         with self.conn:
             existing_sources = {
-                row[0]
+                row[0]: row[1]
                 for row in self.conn.execute(
-                    "SELECT source_path FROM asset_index_state"
+                    f"SELECT source_path, skill_row_id FROM asset_index_state WHERE 1 = 1 {scope}",
+                    params,
                 )
             }
-            removed_sources = existing_sources - active_source_paths
+            removed_sources = set(existing_sources) - active_source_paths
             for source_path in removed_sources:
-                row = self.conn.execute(
-                    "SELECT skill_row_id FROM asset_index_state WHERE source_path = ?",
-                    (source_path,),
-                ).fetchone()
-                if row:
-                    self.conn.execute(
-                        "DELETE FROM skill_embeddings WHERE rowid = ?", (row[0],)
-                    )
-                    self.conn.execute("DELETE FROM skills WHERE id = ?", (row[0],))
+                skill_row_id = existing_sources[source_path]
+                self.conn.execute(
+                    f"DELETE FROM {self.vector_table} WHERE rowid = ?", (skill_row_id,)
+                )
+                self.conn.execute(
+                    f"DELETE FROM asset_index_state WHERE source_path = ? {scope}",
+                    (source_path, *params),
+                )
+                self._delete_unreferenced_skill_rows([skill_row_id])
 
             for skill, embedding, state in zip(skills, embeddings, states):
-                skill_id = self._upsert_skill(skill, embedding)
+                current_id = existing_sources.get(state["source_path"])
+                skill_id = self._upsert_skill(
+                    skill,
+                    embedding,
+                    existing_id=self._representation_skill_row(skill, current_id),
+                    find_existing=False,
+                )
+                if current_id is not None and current_id != skill_id:
+                    # 內容分岔到自己的列後，舊列只留給其他表示
+                    self.conn.execute(
+                        f"DELETE FROM {self.vector_table} WHERE rowid = ?", (current_id,)
+                    )
                 self.conn.execute(
-                    "DELETE FROM asset_index_state WHERE skill_row_id = ? OR source_path = ?",
-                    (skill_id, state["source_path"]),
+                    f"DELETE FROM asset_index_state WHERE (skill_row_id = ? OR source_path = ?) {scope}",
+                    (skill_id, state["source_path"], *params),
                 )
+                columns = (
+                    "asset_id", "revision_id", "representation_version",
+                    "embedding_model_id", "embedding_model_version", "content_hash",
+                    "skill_row_id", "vector_row_id", "source_path", "indexed_at",
+                )
+                values = (
+                    state["asset_id"], state["revision_id"],
+                    state["representation_version"], state["embedding_model_id"],
+                    state["embedding_model_version"], state["content_hash"],
+                    skill_id, skill_id, state["source_path"], state["indexed_at"],
+                )
+                if params:
+                    columns, values = ("representation", *columns), (*params, *values)
                 self.conn.execute(
-                    """
-                    INSERT INTO asset_index_state(
-                        asset_id, revision_id, representation_version,
-                        embedding_model_id, embedding_model_version, content_hash,
-                        skill_row_id, vector_row_id, source_path, indexed_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        state["asset_id"], state["revision_id"],
-                        state["representation_version"], state["embedding_model_id"],
-                        state["embedding_model_version"], state["content_hash"],
-                        skill_id, skill_id, state["source_path"], state["indexed_at"],
-                    ),
+                    f"INSERT INTO asset_index_state({', '.join(columns)}) "
+                    f"VALUES ({', '.join('?' for _ in columns)})",
+                    values,
                 )
                 ids.append(skill_id)
         return ids
@@ -370,7 +931,7 @@ class VectorStore:
     def get_embedding(self, skill_id: int) -> Optional[np.ndarray]:
         """取得 skill 的向量"""
         result = self.conn.execute(
-            'SELECT embedding FROM skill_embeddings WHERE rowid = ?',
+            f'SELECT embedding FROM {self.vector_table} WHERE rowid = ?',
             (skill_id,)
         ).fetchone()
         
@@ -381,28 +942,31 @@ class VectorStore:
     def get_statistics(self) -> Dict:
         """取得資料庫統計"""
         stats = {}
+        scope = self._skill_scope()
         
         # 總數
         stats['total_skills'] = self.conn.execute(
-            'SELECT COUNT(*) FROM skills'
+            f'SELECT COUNT(*) FROM skills {scope}'
         ).fetchone()[0]
         
         # 類別分布
-        categories = self.conn.execute('''
+        categories = self.conn.execute(f'''
             SELECT category, COUNT(*) as count
             FROM skills
+            {scope}
             GROUP BY category
             ORDER BY count DESC
         ''').fetchall()
         stats['categories'] = {r['category'] or 'uncategorized': r['count'] for r in categories}
         
         # 元素統計
-        totals = self.conn.execute('''
+        totals = self.conn.execute(f'''
             SELECT 
                 SUM(action_count) as actions,
                 SUM(rule_count) as rules,
                 SUM(directive_count) as directives
             FROM skills
+            {scope}
         ''').fetchone()
         stats['total_actions'] = totals['actions'] or 0
         stats['total_rules'] = totals['rules'] or 0
@@ -412,14 +976,16 @@ class VectorStore:
     
     def delete_skill(self, skill_id: int) -> bool:
         """刪除 skill"""
-        self.conn.execute('DELETE FROM skill_embeddings WHERE rowid = ?', (skill_id,))
+        for table in self._vector_tables():
+            self.conn.execute(f'DELETE FROM {table} WHERE rowid = ?', (skill_id,))
         result = self.conn.execute('DELETE FROM skills WHERE id = ?', (skill_id,))
         self.conn.commit()
         return result.rowcount > 0
     
     def clear(self):
         """清空資料庫"""
-        self.conn.execute('DELETE FROM skill_embeddings')
+        for table in self._vector_tables():
+            self.conn.execute(f'DELETE FROM {table}')
         self.conn.execute('DELETE FROM skills')
         self.conn.commit()
         